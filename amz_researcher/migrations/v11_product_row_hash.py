@@ -0,0 +1,34 @@
+"""V11: amz_products에 row_hash 컬럼 추가.
+
+DataCollector.process_snapshot이 upsert_data(hash_column="row_hash")로
+내용이 바뀐 제품만 기록하기 위한 변경 감지 hash (md5 hex).
+기존 행은 NULL이므로 다음 수집 때 한 번 전부 기록된다.
+"""
+import logging
+
+from lib.mysql_connector import MysqlConnector
+
+logger = logging.getLogger(__name__)
+
+ALTER_SQLS = [
+    "ALTER TABLE amz_products ADD COLUMN row_hash CHAR(32) DEFAULT NULL AFTER collected_at",
+]
+
+
+def run_migration(environment: str = "CFO"):
+    with MysqlConnector(environment) as conn:
+        for sql in ALTER_SQLS:
+            try:
+                conn.cursor.execute(sql)
+                logger.info("Executed: %s", sql.strip()[:80])
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    logger.info("Column already exists, skipping")
+                else:
+                    raise
+        conn.connection.commit()
+    print("✅ row_hash column added to amz_products")
+
+
+if __name__ == "__main__":
+    run_migration()
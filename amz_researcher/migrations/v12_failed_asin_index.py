@@ -0,0 +1,33 @@
+"""V12: amz_failed_asins에 last_failed_at 인덱스 추가.
+
+AmzCacheService의 실패 ASIN 스킵 셋(AMZ_FAILED_ASIN_SKIP_SET)이
+last_failed_at watermark 이후 변경분만 증분 조회할 때 사용.
+"""
+import logging
+
+from lib.mysql_connector import MysqlConnector
+
+logger = logging.getLogger(__name__)
+
+ALTER_SQLS = [
+    "ALTER TABLE amz_failed_asins ADD INDEX idx_last_failed (last_failed_at)",
+]
+
+
+def run_migration(environment: str = "CFO"):
+    with MysqlConnector(environment) as conn:
+        for sql in ALTER_SQLS:
+            try:
+                conn.cursor.execute(sql)
+                logger.info("Executed: %s", sql.strip()[:80])
+            except Exception as e:
+                if "Duplicate key name" in str(e):
+                    logger.info("Index already exists, skipping")
+                else:
+                    raise
+        conn.connection.commit()
+    print("✅ idx_last_failed added to amz_failed_asins")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,42 @@
+"""V13: 성분 common_name 대표값 테이블 + ingredient_name 인덱스.
+
+AmzCacheService.harmonize_common_names(names)가 이번 추출에서 나온 성분명만
+재집계해 대표값을 저장하고, UPDATE ... JOIN으로 amz_ingredient_cache에 반영한다.
+"""
+import logging
+
+from lib.mysql_connector import MysqlConnector
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_SQL = """
+CREATE TABLE IF NOT EXISTS amz_ingredient_canonical (
+    ingredient_name VARCHAR(255) NOT NULL PRIMARY KEY,
+    common_name VARCHAR(255) NOT NULL DEFAULT '',
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+ALTER_SQLS = [
+    "ALTER TABLE amz_ingredient_cache ADD INDEX idx_ingredient_name (ingredient_name, common_name)",
+]
+
+
+def run_migration(environment: str = "CFO"):
+    with MysqlConnector(environment) as conn:
+        conn.cursor.execute(MIGRATION_SQL.strip().rstrip(";"))
+        for sql in ALTER_SQLS:
+            try:
+                conn.cursor.execute(sql)
+                logger.info("Executed: %s", sql.strip()[:80])
+            except Exception as e:
+                if "Duplicate key name" in str(e):
+                    logger.info("Index already exists, skipping")
+                else:
+                    raise
+        conn.connection.commit()
+    print("V13 migration completed: amz_ingredient_canonical")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,32 @@
+"""V14: Gemini 성분 추출 content-addressed 캐시 테이블.
+
+키는 정규화된 추출 입력(title/ingredients_raw/features/...) + PROMPT_VERSION의 sha256.
+텍스트가 같은 ASIN(변형, 재등록 SKU, 키워드/카테고리 중복)은 한 번만 추출해 공유한다.
+"""
+
+MIGRATION_SQL = """
+CREATE TABLE IF NOT EXISTS amz_extraction_cache (
+    content_hash CHAR(64) NOT NULL PRIMARY KEY,
+    prompt_version VARCHAR(50) NOT NULL DEFAULT '',
+    ingredients_json MEDIUMTEXT NOT NULL,
+    extracted_at DATETIME NOT NULL,
+    INDEX idx_extracted_at (extracted_at)
+);
+"""
+
+
+def run_migration(environment: str = "CFO"):
+    """마이그레이션 실행."""
+    from lib.mysql_connector import MysqlConnector
+
+    with MysqlConnector(environment) as conn:
+        for statement in MIGRATION_SQL.strip().split(";"):
+            statement = statement.strip()
+            if statement:
+                conn.cursor.execute(statement)
+        conn.connection.commit()
+    print("V14 migration completed: amz_extraction_cache")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,33 @@
+"""V15: amz_report_request_log에 단계별 소요 시간 컬럼 추가.
+
+동시에 실행되는 파이프라인 단계(voice/title 키워드, 리포트 캐시 조회, 리포트 생성 등)의
+소요 시간(ms)을 JSON으로 기록해 전체 duration_sec과 함께 병목을 확인한다.
+"""
+import logging
+
+from lib.mysql_connector import MysqlConnector
+
+logger = logging.getLogger(__name__)
+
+ALTER_SQLS = [
+    "ALTER TABLE amz_report_request_log ADD COLUMN stage_timings_json TEXT NULL AFTER duration_sec",
+]
+
+
+def run_migration(environment: str = "CFO"):
+    with MysqlConnector(environment) as conn:
+        for sql in ALTER_SQLS:
+            try:
+                conn.cursor.execute(sql)
+                logger.info("Executed: %s", sql.strip()[:80])
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    logger.info("Column already exists, skipping")
+                else:
+                    raise
+        conn.connection.commit()
+    print("✅ stage_timings_json added to amz_report_request_log")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,33 @@
+"""V16: amz_report_request_log에 요청 단위 Gemini 호출 통계 컬럼 추가.
+
+operation별 호출 수/재시도/지연 히스토그램/토큰/HTTP 상태/JSON 파싱 결과와
+개별 호출 목록(gemini_telemetry snapshot)을 JSON으로 저장한다.
+"""
+import logging
+
+from lib.mysql_connector import MysqlConnector
+
+logger = logging.getLogger(__name__)
+
+ALTER_SQLS = [
+    "ALTER TABLE amz_report_request_log ADD COLUMN gemini_stats_json MEDIUMTEXT NULL AFTER stage_timings_json",
+]
+
+
+def run_migration(environment: str = "CFO"):
+    with MysqlConnector(environment) as conn:
+        for sql in ALTER_SQLS:
+            try:
+                conn.cursor.execute(sql)
+                logger.info("Executed: %s", sql.strip()[:80])
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    logger.info("Column already exists, skipping")
+                else:
+                    raise
+        conn.connection.commit()
+    print("✅ gemini_stats_json added to amz_report_request_log")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -79,6 +79,7 @@ class Ingredient(BaseModel):
 class ProductIngredients(BaseModel):
     asin: str
     ingredients: list[Ingredient] = []
+    resolved_locally: bool = False  # 로컬 성분 사전으로 해석 (amz_ingredient_cache에 저장하지 않음)
 
 
 class GeminiResponse(BaseModel):
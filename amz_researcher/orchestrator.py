@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
 import re
+import time
 
 from app.config import settings
 from amz_researcher.models import (
@@ -14,8 +16,11 @@ from amz_researcher.models import (
     WeightedProduct,
 )
 from amz_researcher.services.browse_ai import BrowseAiService
-from amz_researcher.services.cache import AmzCacheService
+from amz_researcher.services.cache import AmzCacheService, l1_cache_stats
 from amz_researcher.services.gemini import GeminiService
+from amz_researcher.services.gemini_limiter import limiter_stats
+from amz_researcher.services import gemini_telemetry
+from amz_researcher.services.prompt_compaction import compaction_stats
 from amz_researcher.services.product_db import ProductDBService
 from amz_researcher.services.analyzer import calculate_weights
 from amz_researcher.services.bright_data import BrightDataService
@@ -25,6 +30,8 @@ from amz_researcher.services.html_report_builder import build_html, build_keywor
 from amz_researcher.services.market_analyzer import build_market_analysis, build_keyword_market_analysis
 from amz_researcher.services.report_store import ReportStore
 from amz_researcher.services.slack_sender import SlackSender
+from lib import query_stats
+from lib.mysql_connector import run_in_db_thread
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +111,48 @@ def _apply_voice_keywords(
         db.save_voice_keywords(asin_kw)
 
 
+async def _resolve_voice_keywords(
+    gemini: GeminiService,
+    db: ProductDBService,
+    label: str,
+    weighted_products: list[WeightedProduct],
+    notify,
+) -> VoiceKeywordResult | None:
+    """Voice 키워드: DB 캐시 우선, 없으면 Gemini 추출 후 제품 주입 + 저장."""
+    voice_keywords = await run_in_db_thread(_load_cached_voice_keywords, weighted_products, db)
+    if voice_keywords:
+        await notify("♻️ Consumer Voice 키워드 캐시 사용", ephemeral=True)
+        return voice_keywords
+    await notify("🗣️ Consumer Voice 키워드 추출 중... (Gemini)", ephemeral=True)
+    voice_keywords = await gemini.extract_voice_keywords(label, weighted_products)
+    await run_in_db_thread(_apply_voice_keywords, voice_keywords, weighted_products, db)
+    return voice_keywords
+
+
+async def _run_stage(
+    timings: dict[str, int],
+    name: str,
+    awaitable,
+    optional: bool = False,
+    default=None,
+):
+    """파이프라인 단계 실행 + 소요 시간(ms) 기록.
+
+    optional 단계는 실패해도 예외를 로깅하고 default를 반환해 나머지 단계를 살린다.
+    필수 단계(시장 리포트 생성 등)의 예외는 그대로 전파된다.
+    """
+    started = time.monotonic()
+    try:
+        return await awaitable
+    except Exception:
+        if not optional:
+            raise
+        logger.exception("Optional stage %s failed, continuing with default", name)
+        return default
+    finally:
+        timings[name] = round((time.monotonic() - started) * 1000)
+
+
 def _extract_executive_summary(report_md: str) -> dict:
     """시장 리포트 마크다운에서 Executive Summary를 구조화하여 추출.
 
@@ -149,6 +198,27 @@ def _sanitize_for_slack(text: str) -> str:
     return text
 
 
+def _executive_summary_preview(
+    slack: SlackSender, response_url: str, channel_id: str, label: str,
+):
+    """리포트 스트리밍 중 Executive Summary가 완성되면 먼저 보내는 콜백 생성.
+
+    최종 리포트 메시지(in_channel)와 중복되지 않도록 요청자에게만(ephemeral) 보낸다.
+    """
+    async def _post(partial_report: str) -> None:
+        exec_parts = _extract_executive_summary(partial_report)
+        overview = _sanitize_for_slack(exec_parts["overview"])
+        strategy = _sanitize_for_slack(exec_parts["strategy"])
+        if not overview and not strategy:
+            return
+        text = f"📝 *{label}* Executive Summary (리포트 나머지 생성 중...)\n{overview}"
+        if strategy:
+            text += f"\n\n:bulb: *즉각적인 전략 제안*\n{strategy}"
+        await slack.send_message(response_url, text, ephemeral=True, channel_id=channel_id)
+
+    return _post
+
+
 def _build_report_blocks(
     label: str,
     report_url: str,
@@ -342,7 +412,7 @@ async def run_research(
         # Step 1: Search (캐시 우선)
         search_products = None
         if not refresh:
-            search_products = cache.get_search_cache(keyword)
+            search_products = await cache.aio.get_search_cache(keyword)
         if search_products:
             logger.info("Search cache hit: %d products", len(search_products))
             await _msg(
@@ -351,7 +421,7 @@ async def run_research(
             )
         else:
             search_products = await browse.run_search(keyword)
-            cache.save_search_cache(keyword, search_products)
+            await cache.aio.save_search_cache(keyword, search_products)
             await _msg(
                 f"✅ 검색 완료: {len(search_products)}개 제품. 상세 크롤링 시작...",
                 ephemeral=True,
@@ -362,8 +432,8 @@ async def run_research(
         cached_details = {}
         failed_asins = set()
         if not refresh:
-            cached_details = cache.get_detail_cache(asins)
-            failed_asins = cache.get_failed_asins()
+            cached_details = await cache.aio.get_detail_cache(asins)
+            failed_asins = await cache.aio.get_failed_asins(asins)
         uncached_asins = [
             a for a in asins
             if a not in cached_details and a not in failed_asins
@@ -375,11 +445,11 @@ async def run_research(
         if uncached_asins:
             try:
                 new_details, failures = await browse.run_details_batch(uncached_asins)
-                if not cache.save_detail_cache(new_details):
+                if not await cache.aio.save_detail_cache(new_details):
                     logger.error("Detail cache save failed — %d results may be lost", len(new_details))
                 # 실패 원인별로 분류 저장
                 for reason, failed_list in failures.items():
-                    cache.save_failed_asins(failed_list, keyword, reason=reason)
+                    await cache.aio.save_failed_asins(failed_list, keyword, reason=reason)
             except Exception:
                 logger.warning(
                     "Browse.ai batch failed for %d ASINs, proceeding with %d cached",
@@ -387,7 +457,7 @@ async def run_research(
                 )
                 new_details = []
                 # 배치 전체 실패 → 일시적 실패로 기록 (재시도 가능)
-                cache.save_failed_asins(uncached_asins, keyword, reason="batch_error")
+                await cache.aio.save_failed_asins(uncached_asins, keyword, reason="batch_error")
             all_details = list(cached_details.values()) + new_details
             await _msg(
                 f"📦 상세 정보: 캐시 {len(cached_details)}개 + 신규 {len(new_details)}개"
@@ -415,7 +485,7 @@ async def run_research(
         detail_asins = [d.asin for d in all_details]
         cached_ingredients = {}
         if not refresh:
-            cached_ingredients = cache.get_ingredient_cache(detail_asins)
+            cached_ingredients = await cache.aio.get_ingredient_cache(detail_asins)
         uncached_detail_asins = [a for a in detail_asins if a not in cached_ingredients]
 
         if uncached_detail_asins:
@@ -436,7 +506,14 @@ async def run_research(
                 }
                 for asin in uncached_detail_asins
             ]
-            new_gemini_results = await gemini.extract_ingredients(products_for_gemini)
+            # refresh는 재추출 요청이므로 content-hash 캐시/로컬 사전 결과도 쓰지 않는다
+            # (새 결과는 content-hash 캐시에 덮어씀)
+            new_gemini_results = await gemini.extract_ingredients(
+                products_for_gemini,
+                content_cache=cache,
+                normalizer=None if refresh else await cache.aio.get_ingredient_normalizer(),
+                reuse_cached=not refresh,
+            )
             # 추출 성공한 것만 캐시 (빈 결과는 캐시하지 않음)
             extracted_asins = {r.asin for r in new_gemini_results}
             failed_extraction = len(uncached_detail_asins) - len(extracted_asins)
@@ -446,9 +523,9 @@ async def run_research(
                     failed_extraction, len(uncached_detail_asins),
                 )
             if new_gemini_results:
-                if not cache.save_ingredient_cache(new_gemini_results):
+                if not await cache.aio.save_ingredient_cache(new_gemini_results):
                     logger.error("Ingredient cache save failed — %d results may be lost", len(new_gemini_results))
-                cache.harmonize_common_names()
+                await cache.aio.harmonize_common_names(_ingredient_names(new_gemini_results))
             # 캐시 + 신규 병합
             gemini_results = new_gemini_results + [
                 ProductIngredients(asin=asin, ingredients=ings)
@@ -470,27 +547,43 @@ async def run_research(
         )
 
         # Step 5: AI 시장 분석 리포트 (캐시 우선)
+        # voice/title 키워드 추출과 리포트 캐시 조회는 서로 독립이므로 동시에 실행
         _db = ProductDBService("CFO")
-        voice_keywords = _load_cached_voice_keywords(weighted_products, _db)
-        if voice_keywords:
-            await _msg("♻️ Consumer Voice 키워드 캐시 사용", ephemeral=True)
-        else:
-            await _msg("🗣️ Consumer Voice 키워드 추출 중... (Gemini)", ephemeral=True)
-            voice_keywords = await gemini.extract_voice_keywords(keyword, weighted_products)
-            _apply_voice_keywords(voice_keywords, weighted_products, _db)
-        title_keywords = await gemini.extract_title_keywords(keyword, weighted_products)
+        stage_ms: dict[str, int] = {}
+        _stages_t0 = time.monotonic()
+        # 동시 단계는 모두 optional(실패 시 default)이므로 서로를 취소할 일이 없다
+        voice_keywords, title_keywords, cached_report = await asyncio.gather(
+            _run_stage(
+                stage_ms, "voice_keywords",
+                _resolve_voice_keywords(gemini, _db, keyword, weighted_products, _msg),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "title_keywords",
+                gemini.extract_title_keywords(keyword, weighted_products),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "report_cache",
+                cache.aio.get_market_report_cache(keyword, len(weighted_products)),
+                optional=True,
+            ) if not refresh else asyncio.sleep(0),
+        )
+        stage_ms["keyword_stages"] = round((time.monotonic() - _stages_t0) * 1000)
         analysis_data = build_market_analysis(keyword, weighted_products, all_details, voice_keywords=voice_keywords, title_keywords=title_keywords)
 
-        market_report = ""
-        if not refresh:
-            market_report = cache.get_market_report_cache(keyword, len(weighted_products)) or ""
+        market_report = cached_report or ""
         if market_report:
             logger.info("Market report cache hit for keyword=%s", keyword)
             await _msg("♻️ 시장 분석 리포트 캐시 사용", ephemeral=True)
         else:
             await _msg("📊 시장 분석 리포트 생성 중... (Gemini)", ephemeral=True)
-            market_report = await gemini.generate_market_report(analysis_data)
-            cache.save_market_report_cache(keyword, market_report, len(weighted_products))
+            market_report = await _run_stage(stage_ms, "market_report", gemini.generate_market_report(
+                analysis_data,
+                on_executive_summary=_executive_summary_preview(slack, response_url, channel_id, keyword),
+            ))
+            await cache.aio.save_market_report_cache(keyword, market_report, len(weighted_products))
+        logger.info("Stage timings for keyword=%s: %s", keyword, stage_ms)
 
         # Step 6: Excel generation
         excel_bytes = build_excel(
@@ -539,6 +632,11 @@ async def run_research(
 # ── V4: DB 기반 분석 파이프라인 ──────────────────────────
 
 
+def _ingredient_names(results: list[ProductIngredients]) -> list[str]:
+    """새로 추출된 성분명 목록 (harmonize 대상)."""
+    return sorted({ing.name for pi in results for ing in pi.ingredients})
+
+
 def _parse_db_row(row: dict) -> dict:
     """DB 조회 결과(dict)를 BrightDataProduct 생성자 인자로 변환."""
     import math
@@ -653,7 +751,7 @@ async def _trigger_category_collection(
     product_db = ProductDBService("CFO")
     slack = SlackSender(settings.AMZ_BOT_TOKEN)
 
-    url = product_db.get_category_url(node_id)
+    url = await product_db.aio.get_category_url(node_id)
     if not url:
         await slack.send_message(
             response_url,
@@ -681,7 +779,7 @@ async def _trigger_category_collection(
             "user_id": user_id,
         }
         # is_active 전환
-        product_db.activate_category(node_id)
+        await product_db.aio.activate_category(node_id)
 
         await slack.send_message(
             response_url,
@@ -716,14 +814,18 @@ async def run_analysis(
     slack = SlackSender(settings.AMZ_BOT_TOKEN)
     cache = AmzCacheService("CFO")
     _req_type = "report_only" if report_only else "category"
-    _log_id = product_db.log_request_start(user_id, channel_id, _req_type, category_name)
+    # 이 요청에서 실행된 쿼리 통계 (DB 스레드 호출도 contextvar 복사로 함께 집계)
+    _qstats, _qtoken = query_stats.start_tracking()
+    _gstats, _gtoken = gemini_telemetry.start_tracking()
+    _log_id = await product_db.aio.log_request_start(user_id, channel_id, _req_type, category_name)
+    stage_ms: dict[str, int] = {}  # 단계별 소요 시간 (request log에 기록)
 
     async def _msg(text: str, ephemeral: bool = False):
         await slack.send_message(response_url, text, ephemeral=ephemeral, channel_id=channel_id)
 
     try:
         # Step 1: DB에서 제품 조회
-        raw_products = product_db.get_products_by_category(category_node_id)
+        raw_products = await product_db.aio.get_products_by_category(category_node_id)
         if not raw_products:
             # 미수집 카테고리 → Bright Data 원샷 수집 트리거
             await _trigger_category_collection(
@@ -740,7 +842,7 @@ async def run_analysis(
 
         # Step 2: Gemini 성분 추출 (report_only면 캐시만 사용)
         asins = [p.asin for p in products]
-        cached_ingredients = cache.get_ingredient_cache(asins)
+        cached_ingredients = await cache.aio.get_ingredient_cache(asins)
         uncached = [p for p in products if p.asin not in cached_ingredients]
 
         if uncached and not report_only:
@@ -759,7 +861,11 @@ async def run_analysis(
                 }
                 for p in uncached
             ]
-            new_results = await gemini.extract_ingredients(products_for_gemini)
+            new_results = await gemini.extract_ingredients(
+                products_for_gemini,
+                content_cache=cache,
+                normalizer=await cache.aio.get_ingredient_normalizer(),
+            )
             extracted_asins = {r.asin for r in new_results}
             failed_extraction = len(uncached) - len(extracted_asins)
             if failed_extraction:
@@ -768,8 +874,8 @@ async def run_analysis(
                     failed_extraction, len(uncached),
                 )
             if new_results:
-                cache.save_ingredient_cache(new_results)
-                cache.harmonize_common_names()
+                await cache.aio.save_ingredient_cache(new_results)
+                await cache.aio.harmonize_common_names(_ingredient_names(new_results))
             gemini_results = new_results + [
                 ProductIngredients(asin=asin, ingredients=ings)
                 for asin, ings in cached_ingredients.items()
@@ -812,18 +918,35 @@ async def run_analysis(
                 wp.ingredients_raw = bp.ingredients or ""
 
         # Step 4: 시장 분석 리포트
-        voice_keywords = _load_cached_voice_keywords(weighted_products, product_db)
-        if voice_keywords:
-            await _msg("♻️ Consumer Voice 키워드 캐시 사용", ephemeral=True)
-        else:
-            await _msg("🗣️ Consumer Voice 키워드 추출 중... (Gemini)", ephemeral=True)
-            voice_keywords = await gemini.extract_voice_keywords(category_name, weighted_products)
-            _apply_voice_keywords(voice_keywords, weighted_products, product_db)
-        title_keywords = await gemini.extract_title_keywords(category_name, weighted_products)
-        _tree_ctx = product_db.get_category_tree_context(category_node_id)
-        analysis_data = build_market_analysis(category_name, weighted_products, all_details, voice_keywords=voice_keywords, title_keywords=title_keywords, category_tree=_tree_ctx)
-
-        market_report = cache.get_market_report_cache(category_name, len(weighted_products)) or ""
+        # voice/title 키워드, 카테고리 트리, 리포트 캐시 조회는 서로 독립이므로 동시에 실행
+        _stages_t0 = time.monotonic()
+        # 동시 단계는 모두 optional(실패 시 default)이므로 서로를 취소할 일이 없다
+        voice_keywords, title_keywords, category_tree, cached_report = await asyncio.gather(
+            _run_stage(
+                stage_ms, "voice_keywords",
+                _resolve_voice_keywords(gemini, product_db, category_name, weighted_products, _msg),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "title_keywords",
+                gemini.extract_title_keywords(category_name, weighted_products),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "category_tree",
+                product_db.aio.get_category_tree_context(category_node_id),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "report_cache",
+                cache.aio.get_market_report_cache(category_name, len(weighted_products)),
+                optional=True,
+            ),
+        )
+        stage_ms["keyword_stages"] = round((time.monotonic() - _stages_t0) * 1000)
+        analysis_data = build_market_analysis(category_name, weighted_products, all_details, voice_keywords=voice_keywords, title_keywords=title_keywords, category_tree=category_tree)
+
+        market_report = cached_report or ""
         if market_report:
             logger.info("Market report cache hit for category=%s", category_name)
             await _msg("♻️ 시장 분석 리포트 캐시 사용", ephemeral=True)
@@ -833,8 +956,12 @@ async def run_analysis(
             return
         else:
             await _msg("📊 시장 분석 리포트 생성 중... (Gemini)", ephemeral=True)
-            market_report = await gemini.generate_market_report(analysis_data)
-            cache.save_market_report_cache(category_name, market_report, len(weighted_products))
+            market_report = await _run_stage(stage_ms, "market_report", gemini.generate_market_report(
+                analysis_data,
+                on_executive_summary=_executive_summary_preview(slack, response_url, channel_id, category_name),
+            ))
+            await cache.aio.save_market_report_cache(category_name, market_report, len(weighted_products))
+        logger.info("Stage timings for category=%s: %s", category_name, stage_ms)
 
         # Step 5: Excel + HTML
         excel_bytes = build_excel(
@@ -872,15 +999,19 @@ async def run_analysis(
         )
         logger.info("Analysis completed for category=%s (%d products)", category_name, len(products))
         if _log_id:
-            product_db.log_request_complete(
+            await product_db.aio.log_request_complete(
                 _log_id, product_count=len(products),
                 report_id=report_id, duration_sec=round(_time.monotonic() - _t0, 1),
+                stage_timings=stage_ms,
+                gemini_stats=_gstats.snapshot(include_calls=True),
             )
 
     except Exception as e:
         logger.exception("Analysis failed for category=%s", category_name)
         if _log_id:
-            product_db.log_request_failed(_log_id, str(e)[:500])
+            await product_db.aio.log_request_failed(
+                _log_id, str(e)[:500], gemini_stats=_gstats.snapshot(include_calls=True),
+            )
         await _msg(f"❌ *{category_name}* 분석 실패: {e!s}", ephemeral=True)
         admin_id = settings.AMZ_ADMIN_SLACK_ID
         if admin_id:
@@ -894,6 +1025,18 @@ async def run_analysis(
                 await client.close()
             except Exception:
                 logger.warning("Failed to close %s", type(client).__name__)
+        query_stats.stop_tracking(_qtoken)
+        gemini_telemetry.stop_tracking(_gtoken)
+        logger.info("Query stats for category=%s: %s", category_name, _qstats.format_summary())
+        logger.info("Gemini stats for category=%s: %s", category_name, _gstats.format_summary())
+        _l1 = l1_cache_stats()
+        logger.info(
+            "L1 cache: %d entries, %d bytes, hits=%d misses=%d",
+            _l1["entries"], _l1["size_bytes"], _l1["hits"], _l1["misses"],
+        )
+        for _lim in limiter_stats():
+            logger.info("Gemini limiter: %s", _lim)
+        logger.info("Prompt compaction: %s", compaction_stats())
 
 
 # ── V6: 키워드 검색 분석 파이프라인 ──────────────────────
@@ -1013,7 +1156,7 @@ async def run_keyword_analysis(
 
     try:
         # Step 1: 캐시 확인
-        cached = product_db.get_keyword_cache(normalized_keyword)
+        cached = await product_db.aio.get_keyword_cache(normalized_keyword)
 
         if cached and cached.get("status") == "collecting":
             from datetime import datetime
@@ -1032,7 +1175,7 @@ async def run_keyword_analysis(
         if cached and cached.get("status") == "completed":
             # 캐시 HIT → 즉시 분석 파이프라인
             searched_at = cached["searched_at"]
-            keyword_products = product_db.get_keyword_products(normalized_keyword, searched_at)
+            keyword_products = await product_db.aio.get_keyword_products(normalized_keyword, searched_at)
             if keyword_products:
                 from datetime import datetime
                 days_ago = (datetime.now() - searched_at).days
@@ -1056,7 +1199,7 @@ async def run_keyword_analysis(
             snapshot_id = await bright_data.trigger_keyword_search(
                 normalized_keyword, notify_url=notify_url,
             )
-            searched_at = product_db.save_keyword_search_log(
+            searched_at = await product_db.aio.save_keyword_search_log(
                 normalized_keyword,
                 snapshot_id=snapshot_id,
                 response_url=response_url,
@@ -1072,7 +1215,7 @@ async def run_keyword_analysis(
             )
         except Exception:
             if searched_at:
-                product_db.update_keyword_search_log(normalized_keyword, searched_at, "failed")
+                await product_db.aio.update_keyword_search_log(normalized_keyword, searched_at, "failed")
             raise
         finally:
             await bright_data.close()
@@ -1110,7 +1253,9 @@ async def _run_keyword_analysis_pipeline(
     cache = AmzCacheService("CFO")
     product_db = ProductDBService("CFO")
     _req_type = "report_only" if report_only else "keyword"
-    _log_id = product_db.log_request_start(user_id, channel_id, _req_type, normalized_keyword)
+    _gstats, _gtoken = gemini_telemetry.start_tracking()
+    _log_id = await product_db.aio.log_request_start(user_id, channel_id, _req_type, normalized_keyword)
+    stage_ms: dict[str, int] = {}  # 단계별 소요 시간 (request log에 기록)
 
     async def _msg(text: str, ephemeral: bool = False):
         await slack.send_message(response_url, text, ephemeral=ephemeral, channel_id=channel_id)
@@ -1118,7 +1263,7 @@ async def _run_keyword_analysis_pipeline(
     try:
         # Step 1: 성분 보완 (2-Layer)
         asins = [p["asin"] for p in keyword_products]
-        cached_ingredients = cache.get_ingredient_cache(asins)
+        cached_ingredients = await cache.aio.get_ingredient_cache(asins)
         uncached_asins = [a for a in asins if a not in cached_ingredients]
 
         if uncached_asins and not report_only:
@@ -1132,7 +1277,11 @@ async def _run_keyword_analysis_pipeline(
                 for asin in uncached_asins
                 if asin in product_map
             ]
-            new_results = await gemini.extract_ingredients(products_for_gemini)
+            new_results = await gemini.extract_ingredients(
+                products_for_gemini,
+                content_cache=cache,
+                normalizer=await cache.aio.get_ingredient_normalizer(),
+            )
             extracted_asins = {r.asin for r in new_results}
             failed_extraction = len(uncached_asins) - len(extracted_asins)
             if failed_extraction:
@@ -1141,8 +1290,8 @@ async def _run_keyword_analysis_pipeline(
                     failed_extraction, len(uncached_asins),
                 )
             if new_results:
-                cache.save_ingredient_cache(new_results)
-                cache.harmonize_common_names()
+                await cache.aio.save_ingredient_cache(new_results)
+                await cache.aio.harmonize_common_names(_ingredient_names(new_results))
             gemini_results = new_results + [
                 ProductIngredients(asin=asin, ingredients=ings)
                 for asin, ings in cached_ingredients.items()
@@ -1187,17 +1336,30 @@ async def _run_keyword_analysis_pipeline(
                 wp.ingredients_raw = str(kp.get("ingredients", "") or "")
 
         # Step 3: 시장 분석 (BSR 의존 분석 제외)
-        voice_keywords = _load_cached_voice_keywords(weighted_products, product_db)
-        if voice_keywords:
-            await _msg("♻️ Consumer Voice 키워드 캐시 사용", ephemeral=True)
-        else:
-            await _msg("🗣️ Consumer Voice 키워드 추출 중... (Gemini)", ephemeral=True)
-            voice_keywords = await gemini.extract_voice_keywords(normalized_keyword, weighted_products)
-            _apply_voice_keywords(voice_keywords, weighted_products, product_db)
-        title_keywords = await gemini.extract_title_keywords(normalized_keyword, weighted_products)
+        # voice/title 키워드와 리포트 캐시 조회는 서로 독립이므로 동시에 실행
+        _stages_t0 = time.monotonic()
+        # 동시 단계는 모두 optional(실패 시 default)이므로 서로를 취소할 일이 없다
+        voice_keywords, title_keywords, cached_report = await asyncio.gather(
+            _run_stage(
+                stage_ms, "voice_keywords",
+                _resolve_voice_keywords(gemini, product_db, normalized_keyword, weighted_products, _msg),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "title_keywords",
+                gemini.extract_title_keywords(normalized_keyword, weighted_products),
+                optional=True,
+            ),
+            _run_stage(
+                stage_ms, "report_cache",
+                cache.aio.get_market_report_cache(normalized_keyword, len(weighted_products)),
+                optional=True,
+            ),
+        )
+        stage_ms["keyword_stages"] = round((time.monotonic() - _stages_t0) * 1000)
         analysis_data = build_keyword_market_analysis(normalized_keyword, weighted_products, all_details, voice_keywords=voice_keywords, title_keywords=title_keywords)
 
-        market_report = cache.get_market_report_cache(normalized_keyword, len(weighted_products)) or ""
+        market_report = cached_report or ""
         if market_report:
             logger.info("Market report cache hit for keyword=%s", normalized_keyword)
             await _msg("♻️ 시장 분석 리포트 캐시 사용", ephemeral=True)
@@ -1207,8 +1369,12 @@ async def _run_keyword_analysis_pipeline(
             return
         else:
             await _msg("📊 시장 분석 리포트 생성 중... (Gemini)", ephemeral=True)
-            market_report = await gemini.generate_market_report(analysis_data)
-            cache.save_market_report_cache(normalized_keyword, market_report, len(weighted_products))
+            market_report = await _run_stage(stage_ms, "market_report", gemini.generate_market_report(
+                analysis_data,
+                on_executive_summary=_executive_summary_preview(slack, response_url, channel_id, normalized_keyword),
+            ))
+            await cache.aio.save_market_report_cache(normalized_keyword, market_report, len(weighted_products))
+        logger.info("Stage timings for keyword=%s: %s", normalized_keyword, stage_ms)
 
         # Step 4: Excel + HTML 생성
         excel_bytes = build_keyword_excel(
@@ -1244,15 +1410,19 @@ async def _run_keyword_analysis_pipeline(
         )
         logger.info("Keyword analysis completed for keyword=%s (%d products)", keyword, len(keyword_products))
         if _log_id:
-            product_db.log_request_complete(
+            await product_db.aio.log_request_complete(
                 _log_id, product_count=len(keyword_products),
                 report_id=report_id, duration_sec=round(_time.monotonic() - _t0, 1),
+                stage_timings=stage_ms,
+                gemini_stats=_gstats.snapshot(include_calls=True),
             )
 
     except Exception as e:
         logger.exception("Keyword analysis pipeline failed for keyword=%s", keyword)
         if _log_id:
-            product_db.log_request_failed(_log_id, str(e)[:500])
+            await product_db.aio.log_request_failed(
+                _log_id, str(e)[:500], gemini_stats=_gstats.snapshot(include_calls=True),
+            )
         await _msg(f"❌ *\"{keyword}\"* 검색 분석 실패: {e!s}", ephemeral=True)
         admin_id = settings.AMZ_ADMIN_SLACK_ID
         if admin_id:
@@ -1266,3 +1436,5 @@ async def _run_keyword_analysis_pipeline(
                 await client.close()
             except Exception:
                 logger.warning("Failed to close %s", type(client).__name__)
+        gemini_telemetry.stop_tracking(_gtoken)
+        logger.info("Gemini stats for keyword=%s: %s", normalized_keyword, _gstats.format_summary())
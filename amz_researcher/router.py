@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Form, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Request
 from fastapi.responses import FileResponse, HTMLResponse
 from pydantic import BaseModel
 
@@ -16,13 +16,18 @@ from amz_researcher.orchestrator import (
 )
 from amz_researcher.services.bright_data import BrightDataService
 from amz_researcher.services.data_collector import DataCollector
+from amz_researcher.services.extraction_aggregator import extraction_aggregator_stats
 from amz_researcher.services.gemini import GeminiService
+from amz_researcher.services.gemini_context_cache import context_cache_stats
+from amz_researcher.services.gemini_limiter import limiter_stats
+from amz_researcher.services.gemini_telemetry import global_gemini_stats
 from amz_researcher.services.cache import AmzCacheService
 from amz_researcher.services.ingredient_analyzer import analyze_voice_ingredient_correlation
 from amz_researcher.services.product_db import ProductDBService
 from amz_researcher.services.report_store import ReportStore
 from amz_researcher.services.slack_sender import SlackSender
 from app.config import settings
+from app.dependencies import verify_webhook
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,6 +38,17 @@ _report_store = ReportStore(
 )
 
 
+@router.get("/amz/stats/gemini")
+async def gemini_stats(_: None = Depends(verify_webhook)):
+    """프로세스 누적 Gemini 호출 통계 (operation별 지연 히스토그램/토큰/재시도) + limiter/추출 배치 묶기/context cache 상태."""
+    return {
+        "telemetry": global_gemini_stats().snapshot(),
+        "limiters": limiter_stats(),
+        "extraction_batching": extraction_aggregator_stats(),
+        "context_caches": context_cache_stats(),
+    }
+
+
 @router.get("/reports/{report_id}")
 async def serve_report(report_id: str):
     """Serve a stored HTML report by its ID."""
@@ -221,7 +237,7 @@ async def slack_amz(
     # /amz list
     if subcommand == "list":
         product_db = ProductDBService("CFO")
-        categories = product_db.list_categories()
+        categories = await product_db.aio.list_categories()
         if not categories:
             return {"response_type": "ephemeral", "text": "등록된 카테고리가 없습니다."}
         lines = [f"• {c['name']} (`{c['node_id']}`)" for c in categories]
@@ -253,7 +269,7 @@ async def slack_amz(
                 "text": "사용법: `/amz report {카테고리명}`\n예: `/amz report Hair Styling Serums`",
             }
         product_db = ProductDBService("CFO")
-        matches = product_db.search_categories(keyword)
+        matches = await product_db.aio.search_categories(keyword)
         if not matches:
             return {"response_type": "ephemeral", "text": f"🔍 \"{keyword}\" 관련 카테고리를 찾을 수 없습니다."}
         cat = matches[0]
@@ -276,13 +292,13 @@ async def slack_amz(
             }
         product_db = ProductDBService("CFO")
         normalized = " ".join(keyword.lower().split())
-        cached = product_db.get_keyword_cache(normalized)
+        cached = await product_db.aio.get_keyword_cache(normalized)
         if not cached or cached.get("status") != "completed":
             return {
                 "response_type": "ephemeral",
                 "text": f"⚠️ *\"{keyword}\"* 수집 완료된 데이터가 없습니다. `/amz search {keyword}`로 먼저 분석하세요.",
             }
-        keyword_products = product_db.get_keyword_products(normalized, cached["searched_at"])
+        keyword_products = await product_db.aio.get_keyword_products(normalized, cached["searched_at"])
         if not keyword_products:
             return {"response_type": "ephemeral", "text": f"⚠️ *\"{keyword}\"* 제품 데이터가 없습니다."}
         background_tasks.add_task(
@@ -306,7 +322,7 @@ async def slack_amz(
 
         # 정확한 캐시가 있으면 바로 분석 시작
         product_db = ProductDBService("CFO")
-        exact_cache = product_db.get_keyword_cache(keyword)
+        exact_cache = await product_db.aio.get_keyword_cache(keyword)
         if exact_cache and exact_cache.get("status") == "completed":
             background_tasks.add_task(run_keyword_analysis, keyword, response_url, channel_id, user_id)
             return {
@@ -315,7 +331,7 @@ async def slack_amz(
             }
 
         # 정확한 캐시 없음 → 유사 키워드 추천
-        similar = product_db.find_similar_keywords(keyword)
+        similar = await product_db.aio.find_similar_keywords(keyword)
         if similar:
             from datetime import datetime
 
@@ -379,7 +395,7 @@ async def slack_amz(
     # /amz {keyword} — V4 카테고리 검색 → 버튼
     keyword = " ".join(parts)
     product_db = ProductDBService("CFO")
-    matches = product_db.search_categories(keyword)
+    matches = await product_db.aio.search_categories(keyword)
 
     if not matches:
         return {
@@ -498,7 +514,7 @@ async def slack_amz_interact(
     logger.info("Category interact: node_id=%s, name=%s, action_id=%s", node_id, name, action_id)
 
     product_db = ProductDBService("CFO")
-    freshness = product_db.get_category_freshness(node_id)
+    freshness = await product_db.aio.get_category_freshness(node_id)
     logger.info("Category freshness: node_id=%s, result=%s", node_id, freshness)
 
     if freshness is None:
@@ -603,7 +619,7 @@ async def _send_category_options(
 async def _handle_why_discovery(response_url: str, channel_id: str) -> None:
     """Voice - 키워드 빈도 Top 15를 Block Kit 버튼으로 표시."""
     db = ProductDBService("CFO")
-    stats = db.get_voice_keyword_stats()
+    stats = await db.aio.get_voice_keyword_stats()
     slack = SlackSender(settings.AMZ_BOT_TOKEN)
 
     try:
@@ -669,14 +685,14 @@ async def _handle_why_analysis(
 
     try:
         # 1. 캐시 확인
-        cached = cache.get_correlation_cache(keyword)
+        cached = await cache.aio.get_correlation_cache(keyword)
         if cached:
             logger.info("Correlation cache hit: %s", keyword)
             await _send_why_result(slack, channel_id, cached)
             return
 
         # 2. 데이터 조회 + 분석
-        products = db.get_all_products_with_voice()
+        products = await db.aio.get_all_products_with_voice()
         if not products:
             await slack.send_message(
                 response_url,
@@ -689,7 +705,7 @@ async def _handle_why_analysis(
 
         # 3. 결과 없음 -> 유사 키워드 제안
         if not result.get("enriched"):
-            similar = db.find_similar_voice_keywords(keyword)
+            similar = await db.aio.find_similar_voice_keywords(keyword)
             if similar:
                 buttons = [
                     {
@@ -740,7 +756,7 @@ async def _handle_why_analysis(
 
         # 5. 캐시 저장
         full_result = {**result, "brief": brief}
-        cache.save_correlation_cache(keyword, full_result)
+        await cache.aio.save_correlation_cache(keyword, full_result)
 
         # 6. 메시지 전송
         await _send_why_result(slack, channel_id, full_result)
@@ -863,7 +879,7 @@ async def _generate_category_keywords(
             return
 
         product_db = ProductDBService("CFO")
-        product_db.update_category_keywords(node_id, keywords)
+        await product_db.aio.update_category_keywords(node_id, keywords)
         logger.info("Category keywords saved: %s → %s", category_name, keywords)
 
         if response_url:
@@ -904,7 +920,7 @@ async def brightdata_webhook(
 
     # 키워드 검색 snapshot인지 확인
     product_db = ProductDBService("CFO")
-    keyword_log = product_db.get_keyword_search_by_snapshot(snapshot_id)
+    keyword_log = await product_db.aio.get_keyword_search_by_snapshot(snapshot_id)
 
     if keyword_log:
         logger.info(
@@ -944,7 +960,7 @@ async def _ingest_snapshot(snapshot_id: str):
 
     async def _work() -> int:
         products = await bright_data.fetch_snapshot(snapshot_id)
-        n = collector.process_snapshot(products)
+        n = await collector.aio.process_snapshot(products)
         logger.info("Webhook ingestion complete: snapshot=%s, %d products", snapshot_id, n)
         return n
 
@@ -980,7 +996,7 @@ async def _ingest_and_analyze_category(snapshot_id: str, cb: dict):
 
     try:
         products = await bright_data.fetch_snapshot(snapshot_id)
-        count = collector.process_snapshot(products)
+        count = await collector.aio.process_snapshot(products)
         logger.info(
             "Category oneshot ingestion complete: snapshot=%s, category=%s, %d products",
             snapshot_id, name, count,
@@ -1025,19 +1041,19 @@ async def _ingest_keyword_snapshot(snapshot_id: str, keyword_log: dict):
         # Step 1: snapshot fetch → DB 적재
         products_raw = await bright_data.fetch_snapshot(snapshot_id)
         if not products_raw:
-            product_db.update_keyword_search_log(keyword, searched_at, "failed")
+            await product_db.aio.update_keyword_search_log(keyword, searched_at, "failed")
             logger.warning("Keyword snapshot %s returned empty for keyword=%s", snapshot_id, keyword)
             return
 
-        count = collector.process_search_snapshot(products_raw, keyword, searched_at)
-        product_db.update_keyword_search_log(keyword, searched_at, "completed", count)
+        count = await collector.aio.process_search_snapshot(products_raw, keyword, searched_at)
+        await product_db.aio.update_keyword_search_log(keyword, searched_at, "completed", count)
         logger.info(
             "Keyword snapshot ingested: snapshot=%s, keyword=%s, %d products",
             snapshot_id, keyword, count,
         )
 
         # Step 2: 분석 파이프라인 실행
-        keyword_products = product_db.get_keyword_products(keyword, searched_at)
+        keyword_products = await product_db.aio.get_keyword_products(keyword, searched_at)
         if not keyword_products:
             logger.warning("No keyword products after ingestion for keyword=%s", keyword)
             return
@@ -1045,7 +1061,7 @@ async def _ingest_keyword_snapshot(snapshot_id: str, keyword_log: dict):
         await _run_keyword_analysis_pipeline(keyword, keyword_products, response_url, channel_id)
 
     except Exception:
-        product_db.update_keyword_search_log(keyword, searched_at, "failed")
+        await product_db.aio.update_keyword_search_log(keyword, searched_at, "failed")
         logger.exception("Keyword snapshot ingestion failed: snapshot=%s, keyword=%s", snapshot_id, keyword)
     finally:
         await bright_data.close()
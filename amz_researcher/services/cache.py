@@ -1,12 +1,18 @@
 import json
 import logging
 import math
+import threading
+import time
 from datetime import datetime, timedelta
 
 import pandas as pd
 
+from app.config import settings
 from amz_researcher.models import Ingredient, ProductDetail, ProductIngredients, SearchProduct
-from lib.mysql_connector import MysqlConnector
+from amz_researcher.services.gemini import PROMPT_VERSION
+from amz_researcher.services.ingredient_normalizer import IngredientNormalizer
+from lib.mysql_connector import AsyncServiceProxy, MysqlConnector
+from lib.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +28,133 @@ PERMANENT_REASONS = frozenset({"not_found", "blocked", "asin_invalid"})
 # 일시적 실패 → MAX_RETRY_COUNT까지 재시도 허용
 TRANSIENT_REASONS = frozenset({"timeout", "batch_error", "browse_ai_failure", "network_error"})
 
+# ── In-process L1 cache ─────────────────────
+# MySQL 캐시 테이블(L2) 앞단. 프로세스 내 모든 AmzCacheService가 공유하며,
+# 키는 (namespace, environment, ...) 튜플. 저장 시 write-through, 수집 시 무효화.
+_l1 = TTLCache(
+    max_bytes=settings.AMZ_L1_CACHE_MAX_MB * 1024 * 1024 if settings.AMZ_L1_CACHE_ENABLED else 0,
+    ttl=settings.AMZ_L1_CACHE_TTL_SEC,
+)
+
+def _copy_models(models):
+    """L1에 넣고 꺼내는 pydantic 모델 목록 복사본.
+
+    L1 항목은 프로세스 내 모든 요청이 공유하므로, 호출자가 반환값을 수정해도
+    캐시(와 다른 요청의 결과)가 오염되지 않도록 저장/조회 시 깊은 복사한다.
+    """
+    return [m.model_copy(deep=True) for m in models]
+
+
+# 제품 데이터 갱신 시 통째로 무효화할 namespace (카테고리/키워드 단위라 ASIN으로 좁힐 수 없음)
+_PRODUCT_DERIVED_NAMESPACES = frozenset({"market_report", "correlation"})
+
+
+def l1_cache_stats() -> dict:
+    """L1 캐시 항목 수/용량/hit·miss 통계."""
+    return _l1.stats()
+
+
+def invalidate_l1_for_ingestion(asins: list[str]) -> int:
+    """제품 수집 후 호출: 해당 ASIN 항목과 제품 데이터에서 파생된 항목 무효화."""
+    asin_set = set(asins)
+    removed = _l1.invalidate(
+        lambda key, _: key[0] in _PRODUCT_DERIVED_NAMESPACES
+        or (key[0] in ("detail", "ingredient") and key[2] in asin_set)
+    )
+    if removed:
+        logger.info("L1 cache invalidated after ingestion: %d entries", removed)
+    return removed
+
+
+def _should_skip(reason: str | None, retry_count: int, last_failed_at: datetime | None,
+                 cooldown_cutoff: datetime) -> bool:
+    """실패 ASIN 스킵 정책 (get_failed_asins의 SQL 조건과 동일)."""
+    if (reason or "browse_ai_failure") in PERMANENT_REASONS:
+        return True
+    if retry_count >= MAX_RETRY_COUNT:
+        return True
+    return last_failed_at is not None and last_failed_at >= cooldown_cutoff
+
+
+class _FailedAsinSkipSet:
+    """amz_failed_asins의 프로세스 내 사본. last_failed_at watermark 이후 변경분만 다시 읽는다.
+
+    쿨다운은 조회 시점에 따라 달라지므로 스킵 여부가 아닌 원본 행을 보관하고 매번 정책을 평가한다.
+    """
+
+    # 다른 프로세스의 늦은 커밋/시계 오차를 흡수하기 위한 watermark 재조회 구간
+    OVERLAP = timedelta(seconds=60)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rows: dict[str, dict[str, tuple[str | None, int, datetime | None]]] = {}
+        self._watermark: dict[str, datetime] = {}
+
+    def skipped(self, environment: str, asins: list[str]) -> set[str]:
+        try:
+            self._refresh(environment)
+        except Exception:
+            logger.exception("Failed to refresh failed ASIN skip set")
+        cooldown_cutoff = datetime.now() - timedelta(days=RETRY_COOLDOWN_DAYS)
+        with self._lock:
+            rows = self._rows.get(environment, {})
+            return {
+                a for a in asins
+                if a in rows and _should_skip(*rows[a], cooldown_cutoff)
+            }
+
+    def _refresh(self, environment: str) -> None:
+        with self._lock:
+            watermark = self._watermark.get(environment)
+        query = "SELECT asin, reason, retry_count, last_failed_at FROM amz_failed_asins"
+        params = None
+        if watermark is not None:
+            query += " WHERE last_failed_at >= %s"
+            params = (watermark - self.OVERLAP,)
+        with MysqlConnector(environment) as conn:
+            df = conn.read_query_table(query, params)
+        if df.empty:
+            return
+        with self._lock:
+            rows = self._rows.setdefault(environment, {})
+            for row in df.to_dict("records"):
+                last_failed = row["last_failed_at"]
+                if last_failed is not None and pd.isna(last_failed):
+                    last_failed = None
+                elif last_failed is not None:
+                    last_failed = pd.Timestamp(last_failed).to_pydatetime()
+                rows[row["asin"]] = (row["reason"], int(row["retry_count"] or 0), last_failed)
+                if last_failed is not None and (
+                    environment not in self._watermark or last_failed > self._watermark[environment]
+                ):
+                    self._watermark[environment] = last_failed
+            if environment not in self._watermark:
+                self._watermark[environment] = datetime.min + self.OVERLAP
+
+
+_failed_asin_skip_set = _FailedAsinSkipSet()
+
+# 환경별 로컬 성분 사전: environment -> (built_at monotonic, normalizer)
+_normalizers: dict[str, tuple[float, IngredientNormalizer]] = {}
+_normalizers_lock = threading.Lock()
+
 
 class AmzCacheService:
     """MySQL 기반 Amazon 데이터 캐시 서비스."""
 
     def __init__(self, environment: str = "CFO"):
         self._env = environment
+        # 이벤트 루프에서 호출할 async 변형: await self.aio.<method>(...)
+        self.aio = AsyncServiceProxy(self)
 
     # ── Search Cache ─────────────────────────────────
 
     def get_search_cache(self, keyword: str) -> list[SearchProduct] | None:
         """30일 이내 검색 캐시 조회. 없으면 None."""
+        l1_key = ("search", self._env, keyword)
+        cached = _l1.get(l1_key)
+        if cached is not None:
+            return _copy_models(cached)
         cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
         query = (
             "SELECT * FROM amz_search_cache "
@@ -47,7 +169,7 @@ class AmzCacheService:
             return None
         if df.empty:
             return None
-        return [
+        products = [
             SearchProduct(
                 position=int(row["position"]),
                 title=row["title"] or "",
@@ -60,8 +182,10 @@ class AmzCacheService:
                 sponsored=bool(row["sponsored"]),
                 product_link=row["product_link"] or "",
             )
-            for _, row in df.iterrows()
+            for row in df.to_dict("records")
         ]
+        _l1.set(l1_key, _copy_models(products))
+        return products
 
     def save_search_cache(self, keyword: str, products: list[SearchProduct]) -> None:
         """검색 결과를 캐시에 저장 (upsert)."""
@@ -89,6 +213,7 @@ class AmzCacheService:
             df = pd.DataFrame(rows)
             with MysqlConnector(self._env) as conn:
                 conn.upsert_data(df, "amz_search_cache")
+            _l1.set(("search", self._env, keyword), _copy_models(products))
             logger.info("Search cache saved: keyword=%s, %d products", keyword, len(products))
         except Exception:
             logger.exception("Failed to save search cache")
@@ -99,6 +224,18 @@ class AmzCacheService:
         """30일 이내 상세 캐시 조회. {asin: ProductDetail} 반환."""
         if not asins:
             return {}
+        result: dict[str, ProductDetail] = {}
+        misses = []
+        for asin in asins:
+            hit = _l1.get(("detail", self._env, asin))
+            if hit is not None:
+                result[asin] = hit.model_copy(deep=True)
+            else:
+                misses.append(asin)
+        if not misses:
+            return result
+        asins = misses
+
         cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
         placeholders = ",".join(["%s"] * len(asins))
         query = (
@@ -111,9 +248,8 @@ class AmzCacheService:
                 df = conn.read_query_table(query, params)
         except Exception:
             logger.exception("Failed to read detail cache")
-            return {}
-        result = {}
-        for _, row in df.iterrows():
+            return result
+        for row in df.to_dict("records"):
             def _int_or_none(v):
                 if v is None or (isinstance(v, float) and math.isnan(v)):
                     return None
@@ -150,6 +286,7 @@ class AmzCacheService:
                 brand=_str_or_empty(row["brand"]),
                 manufacturer=_str_or_empty(row["manufacturer"]),
             )
+            _l1.set(("detail", self._env, row["asin"]), result[row["asin"]].model_copy(deep=True))
         return result
 
     def save_detail_cache(self, details: list[ProductDetail]) -> bool:
@@ -181,6 +318,8 @@ class AmzCacheService:
             df = pd.DataFrame(rows)
             with MysqlConnector(self._env) as conn:
                 conn.upsert_data(df, "amz_product_detail")
+            for d in details:
+                _l1.set(("detail", self._env, d.asin), d.model_copy(deep=True))
             logger.info("Detail cache saved: %d products", len(details))
             return True
         except Exception:
@@ -189,8 +328,8 @@ class AmzCacheService:
 
     # ── Failed ASIN Management ──────────────────────
 
-    def get_failed_asins(self) -> set[str]:
-        """스킵해야 할 ASIN 목록 조회.
+    def get_failed_asins(self, asins: list[str]) -> set[str]:
+        """asins 중 스킵해야 할 ASIN 조회.
 
         스킵 조건:
         - 구조적 실패 (not_found, blocked 등) → 영구 스킵
@@ -199,86 +338,63 @@ class AmzCacheService:
 
         재시도 대상 (반환하지 않음):
         - 일시적 실패 + retry_count < MAX_RETRY_COUNT + 쿨다운 경과
+
+        settings.AMZ_FAILED_ASIN_SKIP_SET이면 프로세스 내 실패 기록을 last_failed_at
+        watermark로 증분 갱신해 판단하고, 아니면 PK 조회 + SQL 조건으로 판단한다.
         """
+        if not asins:
+            return set()
+        if settings.AMZ_FAILED_ASIN_SKIP_SET:
+            return _failed_asin_skip_set.skipped(self._env, asins)
+
+        placeholders = ",".join(["%s"] * len(asins))
+        permanent = ",".join(["%s"] * len(PERMANENT_REASONS))
+        cooldown_cutoff = datetime.now() - timedelta(days=RETRY_COOLDOWN_DAYS)
+        query = (
+            f"SELECT asin FROM amz_failed_asins "
+            f"WHERE asin IN ({placeholders}) "
+            f"AND (reason IN ({permanent}) "
+            f"OR retry_count >= %s OR last_failed_at >= %s)"
+        )
+        params = (*asins, *sorted(PERMANENT_REASONS), MAX_RETRY_COUNT, cooldown_cutoff)
         try:
             with MysqlConnector(self._env) as conn:
-                df = conn.read_query_table(
-                    "SELECT asin, reason, retry_count, last_failed_at "
-                    "FROM amz_failed_asins"
-                )
-            if df.empty:
-                return set()
-
-            skip = set()
-            now = datetime.now()
-            cooldown_cutoff = now - timedelta(days=RETRY_COOLDOWN_DAYS)
-
-            for _, row in df.iterrows():
-                reason = row["reason"] or "browse_ai_failure"
-                retry_count = int(row["retry_count"] or 0)
-                last_failed = row["last_failed_at"]
-
-                # 구조적 실패 → 영구 스킵
-                if reason in PERMANENT_REASONS:
-                    skip.add(row["asin"])
-                    continue
-
-                # 일시적 실패: 재시도 한도 초과 → 스킵
-                if retry_count >= MAX_RETRY_COUNT:
-                    skip.add(row["asin"])
-                    continue
-
-                # 일시적 실패: 쿨다운 기간 내 → 스킵 (아직 대기)
-                if last_failed and last_failed >= cooldown_cutoff:
-                    skip.add(row["asin"])
-                    continue
-
-                # 그 외 → 재시도 대상 (skip에 추가하지 않음)
-
-            return skip
+                df = conn.read_query_table(query, params)
         except Exception:
             logger.exception("Failed to read failed ASINs")
             return set()
+        return set(df["asin"]) if not df.empty else set()
 
     def save_failed_asins(
         self, asins: list[str], keyword: str = "",
         reason: str = "browse_ai_failure",
     ) -> None:
-        """실패 ASIN 기록. 기존 레코드가 있으면 retry_count 증가."""
+        """실패 ASIN 기록. 기존 레코드가 있으면 retry_count 증가.
+
+        INSERT ... ON DUPLICATE KEY UPDATE retry_count = retry_count + 1 한 문장(배치)으로
+        기록하므로 기존 값 조회가 필요 없고 동시 기록 시에도 증가분이 유실되지 않는다.
+        """
         if not asins:
             return
         now = datetime.now()
-
-        # 기존 실패 기록 조회
-        existing: dict[str, int] = {}
-        try:
-            placeholders = ",".join(["%s"] * len(asins))
-            with MysqlConnector(self._env) as conn:
-                df = conn.read_query_table(
-                    f"SELECT asin, retry_count FROM amz_failed_asins "
-                    f"WHERE asin IN ({placeholders})",
-                    tuple(asins),
-                )
-            if not df.empty:
-                existing = dict(zip(df["asin"], df["retry_count"].astype(int)))
-        except Exception:
-            logger.debug("Could not read existing failed ASINs, treating as new")
-
         rows = [
             {
                 "asin": a,
                 "keyword": keyword,
                 "last_failed_at": now,
                 "reason": reason,
-                "retry_count": existing.get(a, 0) + (1 if a in existing else 0),
+                "retry_count": 0,
             }
-            for a in asins
+            for a in dict.fromkeys(asins)
         ]
         try:
             df = pd.DataFrame(rows)
             with MysqlConnector(self._env) as conn:
-                conn.upsert_data(df, "amz_failed_asins")
-            logger.info("Failed ASINs saved: %d (reason=%s)", len(asins), reason)
+                conn.upsert_data(
+                    df, "amz_failed_asins",
+                    update_overrides={"retry_count": "`retry_count` + 1"},
+                )
+            logger.info("Failed ASINs saved: %d (reason=%s)", len(rows), reason)
         except Exception:
             logger.exception("Failed to save failed ASINs")
 
@@ -292,6 +408,18 @@ class AmzCacheService:
         """
         if not asins:
             return {}
+        result: dict[str, list[Ingredient]] = {}
+        misses = []
+        for asin in asins:
+            hit = _l1.get(("ingredient", self._env, asin))
+            if hit is not None:
+                result[asin] = _copy_models(hit)
+            else:
+                misses.append(asin)
+        if not misses:
+            return result
+        asins = misses
+
         cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
         placeholders = ",".join(["%s"] * len(asins))
         query = (
@@ -305,39 +433,57 @@ class AmzCacheService:
                 df = conn.read_query_table(query, (*asins, cutoff))
         except Exception:
             logger.exception("Failed to read ingredient cache")
-            return {}
+            return result
         if df.empty:
-            return {}
+            return result
 
-        result: dict[str, list[Ingredient]] = {}
-        for _, row in df.iterrows():
+        loaded: dict[str, list[Ingredient]] = {}
+        for row in df.to_dict("records"):
             asin = row["asin"]
-            if asin not in result:
-                result[asin] = []
+            if asin not in loaded:
+                loaded[asin] = []
             if row["ingredient_name"] != "_NONE_":
-                result[asin].append(Ingredient(
+                loaded[asin].append(Ingredient(
                     name=row["ingredient_name"],
                     common_name=row["common_name"] or row["ingredient_name"],
                     category=row["category"],
                     source=row.get("source", ""),
                 ))
+        for asin, ingredients in loaded.items():
+            _l1.set(("ingredient", self._env, asin), _copy_models(ingredients))
+            result[asin] = ingredients
         return result
 
     def save_ingredient_cache(self, gemini_results: list[ProductIngredients]) -> bool:
-        """Gemini 추출 성분을 캐시에 저장. 성분 0개인 제품도 마커 저장. 성공 시 True."""
+        """Gemini 추출 성분을 캐시에 저장. 성분 0개인 제품도 마커 저장. 성공 시 True.
+
+        로컬 성분 사전으로 해석한 결과(resolved_locally)는 저장하지 않는다. 이 테이블이
+        사전의 학습 데이터이므로, 저장하면 사전이 자기 추측으로 다시 학습하게 된다.
+        """
+        gemini_results = [pi for pi in gemini_results if not pi.resolved_locally]
         rows = []
+        # L1에는 DB에 쓰는 정규화된 값을 그대로 넣어 DB 조회 경로와 같은 결과를 돌려준다
+        stored: dict[str, list[Ingredient]] = {}
         now = datetime.now()
         for pi in gemini_results:
+            stored[pi.asin] = []
             if pi.ingredients:
                 for ing in pi.ingredients:
-                    rows.append({
+                    row = {
                         "asin": pi.asin,
                         "ingredient_name": ing.name,
                         "common_name": ing.common_name or ing.name,
                         "category": ing.category,
                         "source": ing.source or "",
                         "extracted_at": now,
-                    })
+                    }
+                    rows.append(row)
+                    stored[pi.asin].append(Ingredient(
+                        name=row["ingredient_name"],
+                        common_name=row["common_name"],
+                        category=row["category"],
+                        source=row["source"],
+                    ))
             else:
                 rows.append({
                     "asin": pi.asin,
@@ -360,6 +506,8 @@ class AmzCacheService:
                     asins,
                 )
                 conn.upsert_data(df, "amz_ingredient_cache")
+            for asin, ingredients in stored.items():
+                _l1.set(("ingredient", self._env, asin), ingredients)
             logger.info("Ingredient cache saved: %d ingredients from %d products",
                        len(rows), len(gemini_results))
             return True
@@ -367,58 +515,186 @@ class AmzCacheService:
             logger.exception("Failed to save ingredient cache")
             return False
 
-    def harmonize_common_names(self) -> int:
+    def harmonize_common_names(self, names: list[str] | None = None) -> int:
         """common_name 자동 보정: 같은 name에 다른 common_name → 다수결 통일.
 
         동수면 먼저 수집된(extracted_at이 빠른) 값 우선.
+        names를 주면 해당 ingredient_name만 재집계/보정한다 (save_ingredient_cache 직후 호출용).
+        대표값은 amz_ingredient_canonical에 저장하고 UPDATE ... JOIN 한 번으로 반영한다.
         Returns: 보정된 레코드 수.
         """
-        query = """
-            SELECT ingredient_name, common_name, COUNT(*) as cnt,
-                   MIN(extracted_at) as first_seen
-            FROM amz_ingredient_cache
-            WHERE ingredient_name != '_NONE_' AND common_name != ''
-            GROUP BY ingredient_name, common_name
-            ORDER BY ingredient_name, cnt DESC, first_seen ASC
+        if names is not None:
+            names = sorted({n for n in names if n and n != "_NONE_"})
+            if not names:
+                return 0
+        name_filter = ""
+        params: tuple = ()
+        if names is not None:
+            name_filter = f"AND {{alias}}ingredient_name IN ({','.join(['%s'] * len(names))})"
+            params = tuple(names)
+
+        refresh_canonical = f"""
+            INSERT INTO amz_ingredient_canonical (ingredient_name, common_name, updated_at)
+            SELECT ingredient_name, common_name, NOW()
+            FROM (
+                SELECT ingredient_name, common_name,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY ingredient_name
+                           ORDER BY COUNT(*) DESC, MIN(extracted_at) ASC
+                       ) AS rn
+                FROM amz_ingredient_cache
+                WHERE ingredient_name != '_NONE_' AND common_name != ''
+                  {name_filter.format(alias="")}
+                GROUP BY ingredient_name, common_name
+            ) ranked
+            WHERE rn = 1
+            ON DUPLICATE KEY UPDATE
+                common_name = VALUES(common_name), updated_at = VALUES(updated_at)
+        """
+        apply_canonical = f"""
+            UPDATE amz_ingredient_cache c
+            JOIN amz_ingredient_canonical k ON k.ingredient_name = c.ingredient_name
+            SET c.common_name = k.common_name
+            WHERE c.common_name != k.common_name
+              {name_filter.format(alias="c.")}
         """
         try:
             with MysqlConnector(self._env) as conn:
-                df = conn.read_query_table(query)
+                conn.cursor.execute(refresh_canonical, params or None)
+                conn.cursor.execute(apply_canonical, params or None)
+                updated = conn.cursor.rowcount
+                conn.connection.commit()
         except Exception:
-            logger.exception("Failed to read for harmonization")
+            logger.exception("Failed to harmonize common names")
             return 0
 
-        if df.empty:
-            return 0
+        if updated:
+            logger.info("Harmonized %d ingredient records", updated)
+            # 바뀐 이름을 가진 ASIN의 L1 성분 캐시 무효화
+            # (ingredient_name 비교는 MySQL collation처럼 대소문자 무시)
+            touched = {n.casefold() for n in names} if names is not None else None
+            _l1.invalidate(
+                lambda key, value: key[0] == "ingredient" and key[1] == self._env
+                and (touched is None or any(i.name.casefold() in touched for i in value))
+            )
+        return updated
 
-        # 각 ingredient_name별 대표 common_name 결정
-        canonical: dict[str, str] = {}
-        for _, row in df.iterrows():
-            inci = row["ingredient_name"]
-            if inci not in canonical:
-                # ORDER BY cnt DESC, first_seen ASC이므로 첫 번째가 대표
-                canonical[inci] = row["common_name"]
+    def get_ingredient_normalizer(self) -> IngredientNormalizer | None:
+        """과거 추출 결과로 학습한 로컬 성분 사전 (프로세스 공용, REFRESH_SEC마다 재구성).
 
-        # 불일치 레코드 업데이트
-        updated = 0
+        추출 입력(amz_products.ingredients)과 결과(amz_ingredient_cache)를 ASIN으로 대조한다.
+        비활성화되었거나 학습할 데이터가 없으면 None.
+        """
+        if not settings.AMZ_INGREDIENT_NORMALIZER_ENABLED:
+            return None
+        now = time.monotonic()
+        with _normalizers_lock:
+            cached = _normalizers.get(self._env)
+        if cached is not None and now - cached[0] < settings.AMZ_INGREDIENT_NORMALIZER_REFRESH_SEC:
+            return cached[1] if len(cached[1]) else None
+
+        cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
+        # INCI 원문은 ASIN당 한 번만 가져오도록 성분 행과 분리해 조회하고 Python에서 대조
+        results_query = """
+            SELECT asin, ingredient_name, common_name, category, COALESCE(source, '') AS source
+            FROM amz_ingredient_cache
+            WHERE extracted_at >= %s
+        """
+        inci_query = """
+            SELECT asin, ingredients
+            FROM amz_products
+            WHERE asin IN (
+                SELECT DISTINCT asin FROM amz_ingredient_cache WHERE extracted_at >= %s
+            )
+              AND ingredients IS NOT NULL AND ingredients != ''
+        """
+        normalizer = IngredientNormalizer(min_support=settings.AMZ_INGREDIENT_NORMALIZER_MIN_SUPPORT)
+        extracted: dict[str, list[Ingredient]] = {}
         try:
             with MysqlConnector(self._env) as conn:
-                for inci, canon in canonical.items():
-                    update_q = (
-                        "UPDATE amz_ingredient_cache "
-                        "SET common_name = %s "
-                        "WHERE ingredient_name = %s AND common_name != %s"
-                    )
-                    conn.cursor.execute(update_q, (canon, inci, canon))
-                    updated += conn.cursor.rowcount
-                conn.connection.commit()
+                for r in conn.read_query_stream(results_query, (cutoff,), as_dicts=True):
+                    ingredients = extracted.setdefault(r["asin"], [])
+                    if r["ingredient_name"] != "_NONE_":
+                        ingredients.append(Ingredient(
+                            name=r["ingredient_name"],
+                            common_name=r["common_name"] or r["ingredient_name"],
+                            category=r["category"],
+                            source=r["source"],
+                        ))
+                for r in conn.read_query_stream(inci_query, (cutoff,), as_dicts=True):
+                    if r["asin"] in extracted:
+                        normalizer.observe(r["ingredients"], extracted[r["asin"]])
         except Exception:
-            logger.exception("Failed to harmonize common names")
-            return 0
+            logger.exception("Failed to load ingredient normalizer data")
+            return cached[1] if cached is not None and len(cached[1]) else None
 
-        if updated:
-            logger.info("Harmonized %d ingredient records", updated)
-        return updated
+        with _normalizers_lock:
+            _normalizers[self._env] = (now, normalizer)
+        logger.info("Ingredient normalizer built: %s", normalizer.stats())
+        return normalizer if len(normalizer) else None
+
+    # ── Extraction Content Cache (Gemini) ─────────
+
+    def get_extraction_cache(self, content_hashes: list[str]) -> dict[str, list[Ingredient]]:
+        """content hash(정규화된 추출 입력 + 프롬프트 버전) 기준 성분 추출 결과 조회."""
+        if not content_hashes:
+            return {}
+        result: dict[str, list[Ingredient]] = {}
+        misses = []
+        for h in content_hashes:
+            hit = _l1.get(("extraction", self._env, h))
+            if hit is not None:
+                result[h] = _copy_models(hit)
+            else:
+                misses.append(h)
+        if not misses:
+            return result
+
+        cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
+        placeholders = ",".join(["%s"] * len(misses))
+        query = (
+            f"SELECT content_hash, ingredients_json FROM amz_extraction_cache "
+            f"WHERE content_hash IN ({placeholders}) AND extracted_at >= %s"
+        )
+        try:
+            with MysqlConnector(self._env) as conn:
+                df = conn.read_query_table(query, (*misses, cutoff))
+        except Exception:
+            logger.exception("Failed to read extraction cache")
+            return result
+        for row in df.to_dict("records"):
+            ingredients = [Ingredient(**i) for i in json.loads(row["ingredients_json"])]
+            _l1.set(("extraction", self._env, row["content_hash"]), _copy_models(ingredients))
+            result[row["content_hash"]] = ingredients
+        return result
+
+    def save_extraction_cache(self, results: dict[str, list[Ingredient]]) -> bool:
+        """content hash별 성분 추출 결과 저장 (upsert). 성분 0개 결과도 저장. 성공 시 True."""
+        if not results:
+            return True
+        now = datetime.now()
+        rows = [
+            {
+                "content_hash": h,
+                "prompt_version": PROMPT_VERSION,
+                "ingredients_json": json.dumps(
+                    [i.model_dump() for i in ingredients], ensure_ascii=False,
+                ),
+                "extracted_at": now,
+            }
+            for h, ingredients in results.items()
+        ]
+        try:
+            df = pd.DataFrame(rows)
+            with MysqlConnector(self._env) as conn:
+                conn.upsert_data(df, "amz_extraction_cache")
+            for h, ingredients in results.items():
+                _l1.set(("extraction", self._env, h), _copy_models(ingredients))
+            logger.info("Extraction cache saved: %d inputs", len(rows))
+            return True
+        except Exception:
+            logger.exception("Failed to save extraction cache")
+            return False
 
     # ── Market Report Cache ──────────────────────────
 
@@ -445,14 +721,35 @@ class AmzCacheService:
             logger.exception("Failed to get data freshness for %s", category_name)
             return None
 
+    def _is_report_stale(self, keyword: str, generated_at: datetime) -> bool:
+        """데이터 freshness 체크: 리포트 생성 이후 제품이 업데이트되었으면 stale."""
+        data_updated = self._get_data_freshness(keyword)
+        if data_updated and data_updated > generated_at:
+            logger.info(
+                "Market report cache stale: keyword=%s, "
+                "cached=%s, data_updated=%s",
+                keyword, generated_at, data_updated,
+            )
+            return True
+        return False
+
     def get_market_report_cache(self, keyword: str, product_count: int) -> str | None:
         """시장 리포트 캐시 조회.
 
         무효화 조건:
         - TTL 30일 초과
         - 제품 수가 다름
-        - 캐시 생성 이후 제품 데이터가 업데이트됨
+        - 캐시 생성 이후 제품 데이터가 업데이트됨 (L1 hit에도 적용: 다른 프로세스의
+          수집은 이 프로세스의 L1을 무효화하지 못하므로)
         """
+        l1_key = ("market_report", self._env, keyword, product_count)
+        cached = _l1.get(l1_key)
+        if cached is not None:
+            report_md, generated_at = cached
+            if self._is_report_stale(keyword, generated_at):
+                _l1.delete(l1_key)
+                return None
+            return report_md
         cutoff = datetime.now() - timedelta(days=CACHE_TTL_DAYS)
         query = (
             "SELECT report_md, generated_at FROM amz_market_report_cache "
@@ -466,17 +763,12 @@ class AmzCacheService:
 
             generated_at = pd.Timestamp(df.iloc[0]["generated_at"]).to_pydatetime()
 
-            # 데이터 freshness 체크: 제품이 캐시 이후에 업데이트되었으면 무효화
-            data_updated = self._get_data_freshness(keyword)
-            if data_updated and data_updated > generated_at:
-                logger.info(
-                    "Market report cache stale: keyword=%s, "
-                    "cached=%s, data_updated=%s",
-                    keyword, generated_at, data_updated,
-                )
+            if self._is_report_stale(keyword, generated_at):
                 return None
 
-            return df.iloc[0]["report_md"]
+            report_md = df.iloc[0]["report_md"]
+            _l1.set(l1_key, (report_md, generated_at))
+            return report_md
         except Exception:
             logger.exception("Failed to read market report cache")
             return None
@@ -498,6 +790,7 @@ class AmzCacheService:
             df = pd.DataFrame(rows)
             with MysqlConnector(self._env) as conn:
                 conn.upsert_data(df, "amz_market_report_cache")
+            _l1.set(("market_report", self._env, keyword, product_count), (report_md, now))
             logger.info("Market report cache saved: keyword=%s", keyword)
         except Exception:
             logger.exception("Failed to save market report cache")
@@ -506,6 +799,11 @@ class AmzCacheService:
 
     def get_correlation_cache(self, keyword: str) -> dict | None:
         """24h TTL 기준 correlation 분석 결과 캐시 조회."""
+        # 호출자가 결과 dict를 수정해도 캐시가 오염되지 않도록 JSON 문자열로 보관
+        l1_key = ("correlation", self._env, keyword.lower())
+        cached = _l1.get(l1_key)
+        if cached is not None:
+            return json.loads(cached)
         cutoff = datetime.now() - timedelta(hours=CORRELATION_CACHE_TTL_HOURS)
         query = (
             "SELECT result_json, generated_at FROM amz_correlation_cache "
@@ -516,7 +814,9 @@ class AmzCacheService:
                 df = conn.read_query_table(query, (keyword.lower(), cutoff))
             if df.empty:
                 return None
-            return json.loads(df.iloc[0]["result_json"])
+            result_json = df.iloc[0]["result_json"]
+            _l1.set(l1_key, result_json)
+            return json.loads(result_json)
         except Exception:
             logger.exception("Failed to read correlation cache")
             return None
@@ -525,15 +825,17 @@ class AmzCacheService:
         """Correlation 분석 결과를 캐시에 저장 (upsert)."""
         if not result:
             return
+        result_json = json.dumps(result, ensure_ascii=False)
         rows = [{
             "keyword": keyword.lower(),
-            "result_json": json.dumps(result, ensure_ascii=False),
+            "result_json": result_json,
             "generated_at": datetime.now(),
         }]
         try:
             df = pd.DataFrame(rows)
             with MysqlConnector(self._env) as conn:
                 conn.upsert_data(df, "amz_correlation_cache")
+            _l1.set(("correlation", self._env, keyword.lower()), result_json)
             logger.info("Correlation cache saved: keyword=%s", keyword)
         except Exception:
             logger.exception("Failed to save correlation cache")
@@ -6,7 +6,8 @@ from datetime import date, datetime
 
 import pandas as pd
 
-from lib.mysql_connector import MysqlConnector
+from amz_researcher.services.cache import invalidate_l1_for_ingestion
+from lib.mysql_connector import AsyncServiceProxy, MysqlConnector
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +194,8 @@ class DataCollector:
 
     def __init__(self, environment: str = "CFO"):
         self._env = environment
+        # 이벤트 루프에서 호출할 async 변형: await self.aio.<method>(...)
+        self.aio = AsyncServiceProxy(self)
 
     def process_snapshot(
         self, products: list[dict], snapshot_date: date | None = None,
@@ -210,8 +213,14 @@ class DataCollector:
         product_rows = [self._map_product(p) for p in products]
         df_products = pd.DataFrame(product_rows)
         with MysqlConnector(self._env) as conn:
-            conn.upsert_data(df_products, "amz_products")
-        logger.info("Upserted %d products to amz_products", len(product_rows))
+            # 내용이 바뀐 제품만 기록 (collected_at은 hash에서 제외)
+            result = conn.upsert_data(
+                df_products, "amz_products",
+                key_columns=("asin",),
+                hash_column="row_hash",
+                hash_exclude=("collected_at",),
+            )
+        logger.info("amz_products: %s", result)
 
         # 2. amz_products_history append
         history_rows = [self._map_history(p, snapshot_date) for p in products]
@@ -228,6 +237,7 @@ class DataCollector:
                 conn.upsert_data(df_cats, "amz_product_categories")
             logger.info("Upserted %d product-category mappings", len(cat_rows))
 
+        invalidate_l1_for_ingestion([p["asin"] for p in products])
         logger.info("Processed %d products (snapshot: %s)", len(products), snapshot_date)
         return len(products)
 
@@ -369,13 +379,16 @@ class DataCollector:
             })
 
         df = pd.DataFrame(rows)
-        with MysqlConnector(self._env) as conn:
-            # 동일 keyword + searched_at 기존 데이터 삭제 후 INSERT
+        with MysqlConnector(self._env, local_infile=True) as conn:
+            # 동일 keyword + searched_at 기존 데이터 교체 (staging 적재 후 짧은 트랜잭션으로 swap)
             conn.delete_and_insert(
                 df, "amz_keyword_products",
                 where="keyword = %s AND searched_at = %s",
                 where_params=(keyword, searched_at),
+                bulk=True,
+                swap=True,
             )
+        invalidate_l1_for_ingestion([r["asin"] for r in rows])
         logger.info(
             "Inserted %d keyword products (keyword=%s, searched_at=%s)",
             len(rows), keyword, searched_at,
@@ -0,0 +1,214 @@
+"""요청 간 성분 추출 micro-batching.
+
+동시에 실행되는 파이프라인(/amz 여러 건)이 각자 자투리 배치를 보내지 않도록, 캐시에 없는
+추출 입력을 짧은 window 동안 모아 토큰 예산에 맞춘 배치로 묶어 보낸다.
+
+- single-flight: 같은 content hash는 진행 중인 요청 하나만 보내고 결과를 공유
+- 대기 중인 입력이 배치 하나를 넘치면 window를 기다리지 않고 꽉 찬 배치부터 발행
+- 다른 요청이 추출을 기다리고 있지 않으면 window 없이 다음 루프 턴에 바로 발행
+  (같은 턴에 들어온 요청끼리는 여전히 묶인다). window 지연은 동시 요청이 있을 때만 든다
+- 배치는 aggregator가 소유한 GeminiService(프로세스 공용 client)로 실행한다. 요청별
+  GeminiService가 닫히거나 요청이 취소돼도 다른 요청과 공유하는 배치는 계속 진행된다
+- 배치 호출은 그 배치의 입력을 기다리는 모든 요청의 telemetry(start_tracking)에 기록된다
+  (배치가 이미 진행 중일 때 합류한 요청도 이후 호출부터 기록)
+
+asyncio.Future는 이벤트 루프에 묶이므로 aggregator는 (루프, API key)별로 하나씩 둔다.
+
+Usage:
+    aggregator = get_extraction_aggregator(api_key)
+    by_hash = await aggregator.extract({content_hash: product, ...})
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import weakref
+
+from amz_researcher.models import Ingredient
+from amz_researcher.services.gemini import GeminiService, plan_extraction_batches
+from amz_researcher.services.gemini_telemetry import GeminiTelemetry, current_tracker, track_shared
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 배치 항목: (content hash, 추출 입력)
+_Item = tuple[str, dict]
+
+
+class ExtractionAggregator:
+    """content hash 단위 single-flight + window 기반 배치 묶기 (이벤트 루프 하나 전용)."""
+
+    def __init__(self, service: GeminiService, window_sec: float = 0.3) -> None:
+        self.service = service
+        self.window_sec = window_sec
+        # 아직 배치에 들어가지 않은 입력: hash -> product
+        self._pending: dict[str, dict] = {}
+        # hash별로 결과를 기다리는 요청 telemetry. 배치 발행 후에는 같은 배치의 hash가
+        # 한 목록을 공유하고, 배치 task가 그 목록을 그대로 참조한다
+        self._trackers: dict[str, list[GeminiTelemetry]] = {}
+        # 대기/진행 중인 hash의 결과 future (None: 추출 실패)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.Handle | None = None
+        # extract()에서 결과를 기다리는 호출자 수
+        self._callers = 0
+        self._tasks: set[asyncio.Task] = set()
+        self.requested = 0
+        self.shared = 0
+        self.batches = 0
+        self.products_sent = 0
+
+    async def extract(self, products: dict[str, dict]) -> dict[str, list[Ingredient]]:
+        """content hash -> 추출 입력을 넘기면 hash -> 성분 목록 반환 (실패한 hash는 빠짐)."""
+        loop = asyncio.get_running_loop()
+        tracker = current_tracker()
+        futures: dict[str, asyncio.Future] = {}
+        for h, product in products.items():
+            self.requested += 1
+            fut = self._inflight.get(h)
+            if fut is None:
+                fut = self._inflight[h] = loop.create_future()
+                self._pending[h] = product
+                self._trackers[h] = []
+            else:
+                self.shared += 1
+            if tracker is not None and tracker not in self._trackers[h]:
+                self._trackers[h].append(tracker)
+            futures[h] = fut
+
+        results: dict[str, list[Ingredient]] = {}
+        self._callers += 1
+        try:
+            self._schedule(loop)
+            for h, fut in futures.items():
+                # 다른 호출자와 공유하는 future이므로 이 호출자가 취소돼도 future는 살려둔다
+                ingredients = await asyncio.shield(fut)
+                if ingredients is not None:
+                    results[h] = ingredients
+        finally:
+            self._callers -= 1
+        return results
+
+    def _plan(self) -> list[list[_Item]]:
+        """대기 입력을 토큰 예산 배치로 나눈다. ASIN이 겹치는 입력(내용이 다른 같은 ASIN)은 다른 배치로."""
+        rounds: list[list[_Item]] = []
+        round_asins: list[set[str]] = []
+        for h, product in self._pending.items():
+            for items, asins in zip(rounds, round_asins):
+                if product["asin"] not in asins:
+                    break
+            else:
+                items, asins = [], set()
+                rounds.append(items)
+                round_asins.append(asins)
+            items.append((h, product))
+            asins.add(product["asin"])
+
+        batches: list[list[_Item]] = []
+        for items in rounds:
+            by_asin = {item[1]["asin"]: item for item in items}
+            for batch in plan_extraction_batches([product for _, product in items]):
+                batches.append([by_asin[p["asin"]] for p in batch])
+        return batches
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """배치 하나를 넘치면 꽉 찬 배치만 즉시 발행, 나머지는 window 뒤에 발행.
+
+        기다리는 호출자가 이 요청 하나뿐이면 window 대신 다음 루프 턴에 발행한다.
+        """
+        if not self._pending:
+            return
+        if len(self._plan()) > 1:
+            self._flush(final=False)
+        if not self._pending:
+            return
+        if self._callers <= 1:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = loop.call_soon(self._flush, True)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_sec, self._flush, True)
+
+    def _flush(self, final: bool) -> None:
+        if final:
+            self._timer = None
+        batches = self._plan()
+        if not final:
+            batches = batches[:-1]
+        for batch in batches:
+            trackers: list[GeminiTelemetry] = []
+            for h, _ in batch:
+                del self._pending[h]
+                trackers.extend(t for t in self._trackers[h] if t not in trackers)
+            for h, _ in batch:
+                self._trackers[h] = trackers
+            # 특정 요청의 contextvar를 물려받지 않도록 빈 context에서 실행
+            task = asyncio.get_running_loop().create_task(
+                self._run(batch, trackers), context=contextvars.Context(),
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[_Item], trackers: list[GeminiTelemetry]) -> None:
+        self.batches += 1
+        self.products_sent += len(batch)
+        track_shared(trackers)
+        by_asin: dict[str, list[Ingredient]] = {}
+        try:
+            for pi in await self.service._extract_batch([product for _, product in batch]):
+                by_asin.setdefault(pi.asin, pi.ingredients)
+        except Exception:
+            logger.exception("Gemini aggregated batch failed (%d products)", len(batch))
+        finally:
+            for h, product in batch:
+                self._trackers.pop(h, None)
+                fut = self._inflight.pop(h, None)
+                if fut is not None and not fut.done():
+                    fut.set_result(by_asin.get(product["asin"]))
+
+    def stats(self) -> dict:
+        return {
+            "requested": self.requested,
+            "shared": self.shared,
+            "batches": self.batches,
+            "products_sent": self.products_sent,
+            "avg_batch_size": round(self.products_sent / self.batches, 1) if self.batches else 0.0,
+            "pending": len(self._pending),
+            "in_flight": len(self._inflight) - len(self._pending),
+        }
+
+
+_aggregators: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_aggregators_lock = threading.Lock()
+
+
+def get_extraction_aggregator(api_key: str) -> ExtractionAggregator:
+    """현재 이벤트 루프의 프로세스 공용 aggregator (API key별)."""
+    loop = asyncio.get_running_loop()
+    with _aggregators_lock:
+        by_key = _aggregators.get(loop)
+        if by_key is None:
+            by_key = _aggregators[loop] = {}
+        aggregator = by_key.get(api_key)
+        if aggregator is None:
+            aggregator = by_key[api_key] = ExtractionAggregator(
+                GeminiService(api_key),
+                window_sec=settings.AMZ_GEMINI_EXTRACT_AGGREGATE_WINDOW_MS / 1000,
+            )
+        return aggregator
+
+
+async def close_extraction_aggregators() -> None:
+    """현재 이벤트 루프의 aggregator가 소유한 GeminiService(httpx client)를 닫는다 (앱 종료 시)."""
+    loop = asyncio.get_running_loop()
+    with _aggregators_lock:
+        by_key = _aggregators.pop(loop, {})
+    for aggregator in by_key.values():
+        await aggregator.service.close()
+
+
+def extraction_aggregator_stats() -> list[dict]:
+    with _aggregators_lock:
+        aggregators = [a for by_key in _aggregators.values() for a in by_key.values()]
+    return [a.stats() for a in aggregators]
@@ -1,38 +1,170 @@
 import asyncio
+import hashlib
 import json
 import logging
+import re
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 import httpx
+from pydantic import ValidationError
 
 from amz_researcher.models import (
     GeminiResponse,
+    Ingredient,
     ProductIngredients,
     TitleKeywordResult,
+    VoiceKeyword,
     VoiceKeywordResult,
     WeightedProduct,
 )
+from amz_researcher.services.gemini_context_cache import CACHE_MISS_STATUSES, get_context_cache, is_cache_miss
+from amz_researcher.services.gemini_limiter import CHARS_PER_TOKEN, estimate_tokens, get_limiter
+from amz_researcher.services.gemini_retry import LatencyWindow, RetryPolicy, hedged
+from amz_researcher.services.gemini_telemetry import (
+    JSON_FAILED,
+    JSON_OK,
+    JSON_REPAIRED,
+    JSON_TRUNCATED,
+    GeminiCall,
+    adopt_last_call,
+    last_call,
+    note_json_outcome,
+    record_call,
+)
+from amz_researcher.services.ingredient_normalizer import IngredientNormalizer
+from amz_researcher.services.prompt_compaction import (
+    REVIEW_MAX_CHARS,
+    TITLE_MAX_CHARS,
+    compact_extraction_product,
+    record_savings,
+    truncate_text,
+)
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-def _try_repair_json(text: str) -> str | None:
-    """잘린 JSON을 복구 시도. 마지막 완전한 product까지 파싱."""
-    # 마지막 완전한 product 블록의 끝(}])을 찾아 잘라냄
-    last_complete = text.rfind("}]")
-    if last_complete == -1:
-        return None
-    truncated = text[:last_complete + 2]
-    # 열린 배열/객체 닫기
-    open_braces = truncated.count("{") - truncated.count("}")
-    open_brackets = truncated.count("[") - truncated.count("]")
-    truncated += "}" * open_braces + "]" * open_brackets
-    try:
-        json.loads(truncated)
-        return truncated
-    except json.JSONDecodeError:
-        return None
+_PRODUCTS_ARRAY_RE = re.compile(r'"products"\s*:\s*\[')
+_PRODUCT_OBJECT_RE = re.compile(r'\{\s*"asin"\s*:')
+_json_decoder = json.JSONDecoder()
+
+
+def salvage_products(text: str) -> list[ProductIngredients]:
+    """깨지거나 잘린 추출 응답({"products": [...]})에서 완전한 제품 객체를 모두 회수.
 
-PROMPT_TEMPLATE = """아래는 아마존에서 수집한 제품 목록이다.
+    products 배열을 앞에서부터 제품 객체 단위로 raw_decode한다. 파싱/검증에 실패한 객체는
+    다음 `{"asin":` 위치로 건너뛰고 계속 읽으므로, 중간 객체 하나가 깨져도 뒤의 제품은 살린다.
+    같은 ASIN이 여러 번 나오면 첫 객체를 쓴다.
+    """
+    if not text:
+        return []
+    m = _PRODUCTS_ARRAY_RE.search(text)
+    pos = m.end() if m else 0
+    products: list[ProductIngredients] = []
+    seen: set[str] = set()
+    while (start := _PRODUCT_OBJECT_RE.search(text, pos)) is not None:
+        try:
+            obj, pos = _json_decoder.raw_decode(text, start.start())
+        except json.JSONDecodeError:
+            pos = start.end()
+            continue
+        try:
+            product = ProductIngredients.model_validate(obj)
+        except ValidationError:
+            continue
+        if product.asin not in seen:
+            seen.add(product.asin)
+            products.append(product)
+    return products
+
+# 성분 추출 프롬프트/모델 버전. EXTRACTION_INSTRUCTIONS나 추출 규칙이 바뀌면 올린다
+# (content hash에 포함되어 이전 버전 결과는 자연히 캐시 miss가 됨)
+PROMPT_VERSION = "ingredients-v1"
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_text(value) -> object:
+    """추출 입력 정규화: 공백 접기 + casefold. dict/list는 재귀."""
+    if isinstance(value, str):
+        return _WS_RE.sub(" ", value).strip().casefold()
+    if isinstance(value, dict):
+        return {str(k): _normalize_text(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize_text(v) for v in value]
+    return value
+
+
+def extraction_content_hash(product: dict) -> str:
+    """성분 추출 입력(asin 제외) + 프롬프트 버전의 content hash.
+
+    변형(variation)/재등록 SKU/키워드·카테고리 중복처럼 텍스트가 같은 제품은 같은 hash가 된다.
+    """
+    payload = {k: _normalize_text(v) for k, v in product.items() if k != "asin"}
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{PROMPT_VERSION}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+# 성분 추출 호출의 최근 성공 지연 (hedge 지연 계산용, 프로세스 공용)
+_EXTRACT_LATENCY = LatencyWindow()
+
+# ── 성분 추출 배치 계획 ──────────────────────
+EXTRACT_MAX_OUTPUT_TOKENS = 32768
+# 배치당 예상 출력 토큰 목표. 2.5 Flash는 thinking 토큰도 maxOutputTokens에 포함되므로 여유를 둔다
+EXTRACT_OUTPUT_BUDGET = 12000
+EXTRACT_INPUT_BUDGET = 60000
+EXTRACT_MAX_BATCH = 40
+# 응답 잘림 시 누락 ASIN을 반으로 나눠 재요청하는 최대 깊이
+EXTRACT_MAX_SPLIT_DEPTH = 3
+# 추출 결과 JSON에서 성분 1개당 토큰 (name/common_name/category/source)
+_TOKENS_PER_INGREDIENT = 45
+
+
+def estimate_extraction_tokens(product: dict) -> tuple[int, int]:
+    """제품 1개의 (입력, 출력) 토큰 추정.
+
+    출력은 INCI 성분 수의 절반 정도가 핵심 성분으로 선별된다고 보고,
+    title/features에서만 나오는 성분 몇 개를 더한다.
+    """
+    input_tokens = len(json.dumps(product, ensure_ascii=False)) // CHARS_PER_TOKEN
+    inci = product.get("ingredients_raw") or ""
+    inci_count = inci.count(",") + 1 if inci.strip() else 0
+    expected_ingredients = min(inci_count, 60) * 0.5 + 3
+    output_tokens = 20 + int(expected_ingredients * _TOKENS_PER_INGREDIENT)
+    return input_tokens, output_tokens
+
+
+def plan_extraction_batches(
+    products: list[dict],
+    max_batch: int = EXTRACT_MAX_BATCH,
+    input_budget: int = EXTRACT_INPUT_BUDGET,
+    output_budget: int = EXTRACT_OUTPUT_BUDGET,
+) -> list[list[dict]]:
+    """예상 토큰 기준으로 배치를 채운다 (입력 순서 유지, greedy)."""
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    used_in = used_out = 0
+    for p in products:
+        tokens_in, tokens_out = estimate_extraction_tokens(p)
+        if current and (
+            len(current) >= max_batch
+            or used_in + tokens_in > input_budget
+            or used_out + tokens_out > output_budget
+        ):
+            batches.append(current)
+            current, used_in, used_out = [], 0, 0
+        current.append(p)
+        used_in += tokens_in
+        used_out += tokens_out
+    if current:
+        batches.append(current)
+    return batches
+
+
+# 성분 추출 고정 지시문 (context cache로 등록되는 부분, 뒤에 EXTRACTION_PROMPT가 붙음)
+EXTRACTION_INSTRUCTIONS = """아래는 아마존에서 수집한 제품 목록이다.
 각 제품에는 INCI 전성분 리스트와 제품 특성 정보가 포함되어 있다.
 
 작업:
@@ -76,66 +208,25 @@ PROMPT_TEMPLATE = """아래는 아마존에서 수집한 제품 목록이다.
    - "both": title/features와 ingredients_raw 양쪽 모두에서 확인된 성분
    - 판단 근거: title/features에 성분명이 직접 언급되어 있으면 "featured" 또는 "both"
 
-{{
+{
   "products": [
-    {{
+    {
       "asin": "제품ASIN",
       "ingredients": [
-        {{"name": "Argania Spinosa Kernel Oil", "common_name": "Argan Oil", "category": "Natural Oil", "source": "both"}},
-        {{"name": "Tocopherol", "common_name": "Vitamin E", "category": "Vitamin", "source": "inci"}}
+        {"name": "Argania Spinosa Kernel Oil", "common_name": "Argan Oil", "category": "Natural Oil", "source": "both"},
+        {"name": "Tocopherol", "common_name": "Vitamin E", "category": "Vitamin", "source": "inci"}
       ]
-    }}
+    }
   ]
-}}
+}"""
 
-제품 목록:
+EXTRACTION_PROMPT = """제품 목록:
 {products_json}"""
 
 
-MARKET_REPORT_PROMPT = """아래는 아마존 "{keyword}" 카테고리의 시장 분석 데이터이다.
-총 {total_products}개 제품을 분석한 결과이다.
-
-## 카테고리 위치
-{category_context}
-
-## 분석 데이터
-
-### 1. 가격대별 성분 전략
-{price_tier_json}
-
-### 2. BSR 상위 vs 하위 제품 성분 비교
-{bsr_json}
-
-### 3. 주요 브랜드 프로파일
-{brand_json}
-
-### 4. 성분 조합 분석 (Co-occurrence)
-{cooccurrence_json}
-
-### 5. 브랜드 포지셔닝 (가격 vs BSR)
-{brand_positioning_json}
-
-### 6. 급성장 제품 (리뷰 적지만 BSR 우수)
-{rising_products_json}
-
-### 7. 고평점 vs 저평점 성분 비교
-{rating_ingredients_json}
-
-### 8. 월간 판매량 분석
-{sales_volume_json}
-
-### 9. {section9_title}
-{section9_json}
-
-### 10. 쿠폰/프로모션 분석
-{promotions_json}
-
-### 11. 소비자 리뷰 키워드 분석 (Consumer Voice)
-{customer_voice_json}
-
----
-
-위 데이터를 바탕으로 시장 분석 리포트를 작성하라.
+# 시장 리포트 고정 지시문 (context cache로 등록되는 부분, 뒤에 MARKET_REPORT_PROMPT가 붙음)
+MARKET_REPORT_INSTRUCTIONS = """너는 아마존 카테고리 시장 분석 리포트를 작성한다. 이 지시문 뒤에 카테고리 위치와 11개 항목의 시장 분석 데이터가 주어진다.
+주어진 데이터를 바탕으로 시장 분석 리포트를 작성하라.
 
 ## 리포트 톤 가이드라인 (필수 준수)
 - 이 리포트의 독자는 아마존 시장을 잘 아는 전문 셀러이다.
@@ -145,7 +236,7 @@ MARKET_REPORT_PROMPT = """아래는 아마존 "{keyword}" 카테고리의 시장
 - 데이터에 기반한 구체적 수치와 차별화 인사이트만 제공하라.
 
 ## 시장 규모 표현 기준 (필수 준수)
-- 위 "카테고리 위치"의 경로(breadcrumb)를 참고하여 분석 범위를 정확히 인지하라. 최하위(leaf) 카테고리라면 가장 좁은 시장이고, 하위 카테고리가 있다면 여러 세그먼트를 포괄하는 넓은 시장이다. 동일 판매량이라도 leaf 카테고리 Top 100과 상위 카테고리 Top 100은 의미가 다르다.
+- 데이터의 "카테고리 위치" 경로(breadcrumb)를 참고하여 분석 범위를 정확히 인지하라. 최하위(leaf) 카테고리라면 가장 좁은 시장이고, 하위 카테고리가 있다면 여러 세그먼트를 포괄하는 넓은 시장이다. 동일 판매량이라도 leaf 카테고리 Top 100과 상위 카테고리 Top 100은 의미가 다르다.
 - 시장 규모를 표현할 때 반드시 아래 기준을 따르고, 정성적 표현과 정량 수치를 병기하라:
   - 월 ~10만개 이하: "소규모 니치 시장 (Top 100 합산 월 ~N만개)"
   - 월 10~50만개: "중규모 시장 (Top 100 합산 월 ~N만개)"
@@ -186,7 +277,7 @@ MARKET_REPORT_PROMPT = """아래는 아마존 "{keyword}" 카테고리의 시장
 
 6. **판매량 & 경쟁 전략 (Sales & Competitive Tactics)**
    - 가격대별 판매량 차이와 전략적 의미
-   - {section6_guidance}
+   - 데이터 끝의 "리포트 6번 섹션 분석 포인트"에 지정된 항목 분석
    - 쿠폰/프로모션 사용 현황과 BSR 영향
 
 7. **소비자 인식 (Consumer Voice)**
@@ -207,6 +298,154 @@ MARKET_REPORT_PROMPT = """아래는 아마존 "{keyword}" 카테고리의 시장
 각 섹션에 구체적 수치와 성분명을 반드시 포함.
 데이터에 있는 수치만 인용하라. JSON이 아닌 마크다운 텍스트로 출력하라."""
 
+MARKET_REPORT_PROMPT = """---
+
+아래는 아마존 "{keyword}" 카테고리의 시장 분석 데이터이다.
+총 {total_products}개 제품을 분석한 결과이다.
+
+## 카테고리 위치
+{category_context}
+
+## 분석 데이터
+
+### 1. 가격대별 성분 전략
+{price_tier_json}
+
+### 2. BSR 상위 vs 하위 제품 성분 비교
+{bsr_json}
+
+### 3. 주요 브랜드 프로파일
+{brand_json}
+
+### 4. 성분 조합 분석 (Co-occurrence)
+{cooccurrence_json}
+
+### 5. 브랜드 포지셔닝 (가격 vs BSR)
+{brand_positioning_json}
+
+### 6. 급성장 제품 (리뷰 적지만 BSR 우수)
+{rising_products_json}
+
+### 7. 고평점 vs 저평점 성분 비교
+{rating_ingredients_json}
+
+### 8. 월간 판매량 분석
+{sales_volume_json}
+
+### 9. {section9_title}
+{section9_json}
+
+### 10. 쿠폰/프로모션 분석
+{promotions_json}
+
+### 11. 소비자 리뷰 키워드 분석 (Consumer Voice)
+{customer_voice_json}
+
+## 리포트 6번 섹션 분석 포인트
+{section6_guidance}"""
+
+
+# Voice 키워드 추출 shard 크기 / shard당 출력 상한
+VOICE_SHARD_SIZE = 25
+VOICE_SHARD_MAX_OUTPUT_TOKENS = 16384
+VOICE_MAX_KEYWORDS = 15
+VOICE_MIN_ASINS = 2
+
+# 키워드 병합 시 같은 의미로 접는 표현 (정규화 후 기준)
+_VOICE_SYNONYMS = {
+    "moisturising": "moisturizing",
+    "moisturize": "moisturizing",
+    "moisturizer": "moisturizing",
+    "hydration": "hydrating",
+    "hydrate": "hydrating",
+    "fragrance": "scent",
+    "smell": "scent",
+    "greasy": "oily",
+    "non greasy": "not oily",
+    "irritating": "irritation",
+    "break out": "breakout",
+}
+_VOICE_TOKEN_RE = re.compile(r"[^a-z0-9가-힣]+")
+
+
+def _singular(word: str) -> str:
+    """아주 단순한 영어 복수형 → 단수형 (ss/us/is 어미는 유지)."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def voice_keyword_key(keyword: str) -> str:
+    """키워드 병합 키: 소문자, 구두점/하이픈 제거, 단수형, 동의어 접기."""
+    text = _VOICE_TOKEN_RE.sub(" ", keyword.lower()).strip()
+    text = _VOICE_SYNONYMS.get(text, text)
+    text = " ".join(_singular(w) for w in text.split())
+    return _VOICE_SYNONYMS.get(text, text)
+
+
+def _merge_voice_side(
+    groups: list[list[VoiceKeyword]], asin_order: dict[str, int], max_keywords: int, min_asins: int,
+) -> list[VoiceKeyword]:
+    merged: dict[str, set[str]] = {}
+    labels: dict[str, Counter] = {}
+    for keywords in groups:
+        for vk in keywords:
+            key = voice_keyword_key(vk.keyword)
+            if not key:
+                continue
+            asins = {a for a in vk.asins if a in asin_order}
+            merged.setdefault(key, set()).update(asins)
+            labels.setdefault(key, Counter())[vk.keyword.strip().lower()] += max(len(asins), 1)
+
+    result = []
+    for key, asins in merged.items():
+        if len(asins) < min_asins:
+            continue
+        # 표시 이름: 가장 많은 ASIN을 가진 원문 표현 (동률이면 사전순)
+        label = min(labels[key].items(), key=lambda kv: (-kv[1], kv[0]))[0]
+        result.append(VoiceKeyword(keyword=label, asins=sorted(asins, key=asin_order.__getitem__)))
+    result.sort(key=lambda vk: (-len(vk.asins), vk.keyword))
+    return result[:max_keywords]
+
+
+def merge_voice_keywords(
+    results: list[VoiceKeywordResult],
+    asins: list[str],
+    max_keywords: int = VOICE_MAX_KEYWORDS,
+    min_asins: int = VOICE_MIN_ASINS,
+) -> VoiceKeywordResult:
+    """shard별 키워드 결과 병합.
+
+    voice_keyword_key로 같은 키워드를 접고 ASIN 목록을 합친 뒤(입력 순서 유지),
+    min_asins개 이상 제품에서 언급된 키워드만 ASIN 수 내림차순으로 max_keywords개.
+    입력 순서와 무관하게 결과가 결정적이다.
+    """
+    asin_order = {a: i for i, a in enumerate(asins)}
+    return VoiceKeywordResult(
+        positive_keywords=_merge_voice_side(
+            [r.positive_keywords for r in results], asin_order, max_keywords, min_asins,
+        ),
+        negative_keywords=_merge_voice_side(
+            [r.negative_keywords for r in results], asin_order, max_keywords, min_asins,
+        ),
+    )
+
+
+# 스트리밍 중 Executive Summary 섹션이 끝났다고 판단하는 경계 (다음 섹션 시작)
+_EXEC_SUMMARY_DONE_RE = re.compile(
+    r"(?:^|\n)##\s*Executive\s*Summary\s*\n.*?\S.*?(?:\n###\s|\n---|\n\d+\.\s|\n##\s)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def executive_summary_complete(report_md: str) -> bool:
+    """스트리밍 중인 리포트에서 Executive Summary 섹션이 완결되었는지."""
+    return bool(_EXEC_SUMMARY_DONE_RE.search(report_md))
+
 
 class GeminiService:
     MODEL_FLASH = "gemini-2.5-flash"
@@ -219,91 +458,398 @@ class GeminiService:
         self.url = f"{self._BASE}/{self.model}:generateContent"
         self.report_url = f"{self._BASE}/{self.MODEL_PRO}:generateContent"
         self.client = httpx.AsyncClient(timeout=120.0)
+        self.retry = RetryPolicy(
+            max_attempts=settings.AMZ_GEMINI_RETRY_MAX_ATTEMPTS,
+            base_delay=settings.AMZ_GEMINI_RETRY_BASE_SEC,
+            max_delay=settings.AMZ_GEMINI_RETRY_MAX_SEC,
+        )
+
+    async def _request_body(
+        self, model: str, prompt: str, generation_config: dict, static_prefix: str,
+    ) -> tuple[dict, str | None]:
+        """generateContent 요청 본문과 참조한 cachedContents 이름.
+
+        static_prefix(고정 지시문)는 context cache가 있으면 cachedContent로 참조하고,
+        없으면 prompt 앞에 붙여 인라인으로 보낸다 (모델이 보는 내용은 같음).
+        """
+        name = None
+        if static_prefix and settings.AMZ_GEMINI_CONTEXT_CACHE_ENABLED:
+            name = await get_context_cache().get(self.client, self.api_key, model, static_prefix)
+        if name is not None:
+            return {
+                "cachedContent": name,
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "generationConfig": generation_config,
+            }, name
+        text = f"{static_prefix}\n\n{prompt}" if static_prefix else prompt
+        return {
+            "contents": [{"parts": [{"text": text}]}],
+            "generationConfig": generation_config,
+        }, None
+
+    async def _generate(
+        self,
+        model: str,
+        prompt: str,
+        generation_config: dict,
+        timeout: float | None = None,
+        operation: str = "",
+        attempt: int = 0,
+        hedge: bool = False,
+        static_prefix: str = "",
+        on_slot: Callable[[], None] | None = None,
+    ) -> dict:
+        """generateContent 호출. 프로세스 공용 limiter(동시성/RPM/TPM)를 거쳐 응답 JSON 반환.
+
+        호출마다 지연/토큰/HTTP 상태를 gemini_telemetry에 기록한다.
+        static_prefix는 context cache로 보내고, 캐시가 만료/삭제되었으면 다시 만들어 한 번 재요청한다.
+        on_slot: limiter 슬롯을 잡은 직후(전송 직전) 호출되는 콜백.
+        """
+        call = GeminiCall(operation=operation, model=model, attempt=attempt, hedge=hedge)
+        estimated = estimate_tokens(static_prefix + prompt, generation_config.get("maxOutputTokens", 0))
+        queued_at = time.monotonic()
+        try:
+            async with get_limiter(model).slot(estimated) as slot:
+                started = time.monotonic()
+                call.queue_ms = (started - queued_at) * 1000
+                if on_slot is not None:
+                    on_slot()
+                try:
+                    body, cached_name = await self._request_body(model, prompt, generation_config, static_prefix)
+                    resp = await self._post_generate(model, body, timeout)
+                    if cached_name is not None and is_cache_miss(resp):
+                        logger.warning("Gemini context cache %s expired, recreating", cached_name)
+                        get_context_cache().invalidate(cached_name)
+                        body, _ = await self._request_body(model, prompt, generation_config, static_prefix)
+                        resp = await self._post_generate(model, body, timeout)
+                    call.status = resp.status_code
+                    resp.raise_for_status()
+                    data = resp.json()
+                finally:
+                    call.latency_ms = (time.monotonic() - started) * 1000
+                call.apply_usage(data.get("usageMetadata", {}))
+                call.finish_reason = data.get("candidates", [{}])[0].get("finishReason", "")
+                slot.settle(call.total_tokens)
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            record_call(call)
+        return data
+
+    async def _post_generate(self, model: str, body: dict, timeout: float | None) -> httpx.Response:
+        return await self.client.post(
+            f"{self._BASE}/{model}:generateContent",
+            params={"key": self.api_key},
+            json=body,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+
+    async def _generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        generation_config: dict,
+        timeout: float | None = None,
+        operation: str = "",
+        static_prefix: str = "",
+    ) -> AsyncIterator[str]:
+        """streamGenerateContent(SSE) 호출. 텍스트 조각을 도착 순서대로 yield.
+
+        context cache가 만료/삭제되어 실패하면 캐시 항목만 버리고 예외를 올린다
+        (호출 측의 일반 호출 대체 경로가 캐시를 다시 만든다).
+        """
+        call = GeminiCall(operation=operation, model=model, streamed=True)
+        estimated = estimate_tokens(static_prefix + prompt, generation_config.get("maxOutputTokens", 0))
+        queued_at = time.monotonic()
+        started = None
+        try:
+            async with get_limiter(model).slot(estimated) as slot:
+                started = time.monotonic()
+                call.queue_ms = (started - queued_at) * 1000
+                body, cached_name = await self._request_body(model, prompt, generation_config, static_prefix)
+                async with self.client.stream(
+                    "POST",
+                    f"{self._BASE}/{model}:streamGenerateContent",
+                    params={"key": self.api_key, "alt": "sse"},
+                    json=body,
+                    timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                ) as resp:
+                    call.status = resp.status_code
+                    if cached_name is not None and resp.status_code in CACHE_MISS_STATUSES:
+                        await resp.aread()
+                        if is_cache_miss(resp):
+                            logger.warning("Gemini context cache %s expired (stream)", cached_name)
+                            get_context_cache().invalidate(cached_name)
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        payload = line[5:].strip()
+                        if not payload:
+                            continue
+                        chunk = json.loads(payload)
+                        if chunk.get("usageMetadata"):
+                            call.apply_usage(chunk["usageMetadata"])
+                        candidate = chunk.get("candidates", [{}])[0]
+                        call.finish_reason = candidate.get("finishReason") or call.finish_reason
+                        for part in candidate.get("content", {}).get("parts", []):
+                            if part.get("text"):
+                                yield part["text"]
+                    slot.settle(call.total_tokens)
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            if started is not None:
+                call.latency_ms = (time.monotonic() - started) * 1000
+            record_call(call)
+
+    @staticmethod
+    def _parse_json(text: str, parse):
+        """응답 JSON 파싱 + 결과를 직전 호출의 telemetry에 기록."""
+        try:
+            result = parse(text)
+        except Exception:
+            note_json_outcome(JSON_FAILED)
+            raise
+        note_json_outcome(JSON_OK)
+        return result
 
     async def extract_ingredients(
-        self, products: list[dict], batch_size: int = 20,
+        self,
+        products: list[dict],
+        batch_size: int = EXTRACT_MAX_BATCH,
+        content_cache=None,
+        normalizer: IngredientNormalizer | None = None,
+        reuse_cached: bool = True,
     ) -> list[ProductIngredients]:
-        batches = [
-            products[i:i + batch_size]
-            for i in range(0, len(products), batch_size)
-        ]
+        """제품별 성분 추출.
+
+        입력 텍스트가 같은 제품(extraction_content_hash 동일)은 한 번만 추출해 결과를 공유한다.
+        content_cache(AmzCacheService)를 주면 배치 구성 전에 content hash 캐시를 조회하고,
+        새로 추출한 결과를 저장한다. reuse_cached=False(refresh)면 조회 없이 모두 다시 추출하고
+        결과로 캐시를 덮어쓴다.
+        normalizer를 주면 로컬 성분 사전으로 해석되는 제품은 Gemini 없이 처리한다
+        (resolved_locally=True. 사전이 갱신되면 다시 계산되고 학습 데이터로 되먹이지 않도록
+        content cache / ingredient cache에는 저장하지 않음).
+        AMZ_GEMINI_EXTRACT_AGGREGATE_ENABLED면 남은 입력을 프로세스 공용 aggregator로 보내
+        동시에 실행 중인 다른 요청의 입력과 함께 배치로 묶는다.
+        """
+        groups: dict[str, list[dict]] = {}
+        for p in products:
+            groups.setdefault(extraction_content_hash(p), []).append(p)
+
+        by_hash: dict[str, list[Ingredient]] = {}
+        if content_cache is not None and reuse_cached and groups:
+            by_hash = await content_cache.aio.get_extraction_cache(list(groups))
+        cache_hits = len(by_hash)
+
+        local_hashes: set[str] = set()
+        if normalizer is not None:
+            for h, members in groups.items():
+                if h in by_hash:
+                    continue
+                resolved = normalizer.resolve(members[0])
+                if resolved is not None:
+                    by_hash[h] = resolved
+                    local_hashes.add(h)
+        local_hits = len(local_hashes)
+
+        # hash당 대표 제품 하나만 Gemini로 (규칙상 버려질 입력은 미리 압축)
+        representatives = {
+            h: compact_extraction_product(members[0])
+            for h, members in groups.items() if h not in by_hash
+        }
+        if representatives:
+            record_savings(
+                "extraction",
+                sum(len(json.dumps(groups[h][0], ensure_ascii=False)) for h in representatives),
+                sum(len(json.dumps(p, ensure_ascii=False)) for p in representatives.values()),
+            )
         logger.info(
-            "Gemini extraction: %d products → %d batches (parallel)",
-            len(products), len(batches),
+            "Gemini extraction: %d products → %d unique inputs "
+            "(%d content-cache hits, %d local dictionary hits) → %d to extract",
+            len(products), len(groups), cache_hits, local_hits, len(representatives),
         )
+        if not representatives:
+            extracted: dict[str, list[Ingredient]] = {}
+        elif settings.AMZ_GEMINI_EXTRACT_AGGREGATE_ENABLED and batch_size == EXTRACT_MAX_BATCH:
+            # 동시에 실행 중인 다른 요청의 입력과 함께 배치로 묶어 보냄 (같은 hash는 한 번만)
+            from amz_researcher.services.extraction_aggregator import get_extraction_aggregator  # 순환 import 회피
+
+            extracted = await get_extraction_aggregator(self.api_key).extract(representatives)
+        else:
+            extracted = await self._extract_representatives(representatives, batch_size)
+        if content_cache is not None and extracted:
+            await content_cache.aio.save_extraction_cache(extracted)
+        by_hash.update(extracted)
+
+        all_results = [
+            ProductIngredients(
+                asin=p["asin"],
+                ingredients=[ing.model_copy() for ing in by_hash[h]],
+                resolved_locally=h in local_hashes,
+            )
+            for h, members in groups.items() if h in by_hash
+            for p in members
+        ]
+        logger.info("Gemini total: %d/%d products extracted", len(all_results), len(products))
+        return all_results
+
+    async def _extract_representatives(
+        self, representatives: dict[str, dict], batch_size: int,
+    ) -> dict[str, list[Ingredient]]:
+        """이 요청의 추출 입력만으로 배치를 구성해 병렬 추출. content hash -> 성분 목록."""
+        # 예상 입력/출력 토큰으로 배치 구성 (batch_size는 배치당 제품 수 상한)
+        batches = plan_extraction_batches(list(representatives.values()), max_batch=batch_size)
+        logger.info("Gemini extraction: %d batches (parallel)", len(batches))
 
         tasks = [self._extract_batch(batch) for batch in batches]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        all_results: list[ProductIngredients] = []
+        extracted: dict[str, list[Ingredient]] = {}
+        hash_of_rep = {rep["asin"]: h for h, rep in representatives.items()}
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 logger.error("Gemini batch %d/%d failed: %s", i + 1, len(batches), result)
-            else:
-                all_results.extend(result)
-
-        logger.info("Gemini total: %d/%d products extracted", len(all_results), len(products))
-        return all_results
+                continue
+            for pi in result:
+                h = hash_of_rep.get(pi.asin)
+                if h is not None:
+                    extracted[h] = pi.ingredients
+        return extracted
 
     async def _extract_batch(
-        self, products: list[dict], max_retries: int = 1,
+        self, products: list[dict], depth: int = 0,
     ) -> list[ProductIngredients]:
         products_json = json.dumps(products, ensure_ascii=False)
-        prompt = PROMPT_TEMPLATE.format(products_json=products_json)
-        text = ""
+        prompt = EXTRACTION_PROMPT.format(products_json=products_json)
 
-        for attempt in range(1 + max_retries):
+        for attempt in range(self.retry.max_attempts):
+            text = ""
             try:
-                resp = await self.client.post(
-                    self.url,
-                    params={"key": self.api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.1,
-                            "maxOutputTokens": 32768,
-                            "responseMimeType": "application/json",
-                        },
-                    },
-                )
-                resp.raise_for_status()
-
-                data = resp.json()
+                data = await self._generate_extraction(prompt, attempt)
+                candidate = data.get("candidates", [{}])[0]
                 text = (
-                    data.get("candidates", [{}])[0]
+                    candidate
                     .get("content", {})
                     .get("parts", [{}])[0]
                     .get("text", "")
                 )
-
-                parsed = GeminiResponse.model_validate_json(text)
-                return parsed.products
-
-            except Exception:
-                # 잘린 JSON 복구 시도 (재요청 전에)
+                if candidate.get("finishReason") != "MAX_TOKENS":
+                    parsed = GeminiResponse.model_validate_json(text)
+                    note_json_outcome(JSON_OK)
+                    return parsed.products
+                note_json_outcome(JSON_TRUNCATED)
+
+            except Exception as e:
+                # 깨진 JSON에서 완성된 제품만 회수하고 누락 ASIN만 재요청 (배치 전체 재요청 대신)
+                recovered = salvage_products(text)
                 if text:
-                    repaired = _try_repair_json(text)
-                    if repaired:
-                        try:
-                            parsed = GeminiResponse.model_validate_json(repaired)
-                            logger.warning(
-                                "Gemini JSON repaired: %d/%d products recovered",
-                                len(parsed.products), len(products),
-                            )
-                            return parsed.products
-                        except Exception:
-                            pass
-
-                if attempt < max_retries:
-                    logger.warning("Gemini parse failed, retrying (attempt %d)", attempt + 1)
+                    note_json_outcome(JSON_REPAIRED if recovered else JSON_FAILED)
+                if recovered:
+                    return await self._resubmit_missing(products, recovered, depth, split=False)
+
+                if self.retry.should_retry(attempt, e):
+                    logger.warning(
+                        "Gemini extraction failed (%s), retrying (attempt %d)", type(e).__name__, attempt + 1,
+                    )
+                    await self.retry.wait(attempt, e)
                     continue
                 logger.exception("Gemini extraction failed after retries")
                 return []
 
+            # finishReason=MAX_TOKENS: 출력 한도 초과이므로 누락분은 나눠서 재요청
+            return await self._resubmit_missing(products, salvage_products(text), depth, split=True)
+
         return []
 
-    async def generate_market_report(self, analysis_data: dict) -> str:
-        """시장 분석 데이터를 기반으로 AI 인사이트 리포트 생성."""
+    def _hedge_delay(self) -> float | None:
+        """성분 추출 hedge 발행 시점(초): 최근 성공 지연의 p95. 표본이 부족하면 hedge 안 함."""
+        if not settings.AMZ_GEMINI_HEDGE_ENABLED or len(_EXTRACT_LATENCY) < settings.AMZ_GEMINI_HEDGE_MIN_SAMPLES:
+            return None
+        p = _EXTRACT_LATENCY.percentile(settings.AMZ_GEMINI_HEDGE_PERCENTILE)
+        return max(settings.AMZ_GEMINI_HEDGE_MIN_SEC, p / 1000)
+
+    async def _generate_extraction(self, prompt: str, attempt: int) -> dict:
+        """성분 추출 호출. p95 안에 응답이 없으면 같은 요청을 hedge로 한 번 더 보내고 먼저 온 응답 사용.
+
+        hedge 지연은 주 요청이 limiter 슬롯을 잡은 뒤부터 잰다. limiter가 밀려 대기 중인
+        요청까지 hedge하면 이미 속도 제한에 걸린 상황에서 토큰 사용량만 두 배가 된다.
+        """
+        sent = asyncio.Event()
+
+        async def _call(is_hedge: bool) -> dict:
+            data = await self._generate(
+                self.model,
+                prompt,
+                {
+                    "temperature": 0.1,
+                    "maxOutputTokens": EXTRACT_MAX_OUTPUT_TOKENS,
+                    "responseMimeType": "application/json",
+                },
+                operation="extract_ingredients",
+                attempt=attempt,
+                hedge=is_hedge,
+                static_prefix=EXTRACTION_INSTRUCTIONS,
+                on_slot=None if is_hedge else sent.set,
+            )
+            # limiter 대기 시간을 뺀 응답 지연만 기록 (큐가 밀려도 hedge 기준이 부풀지 않도록)
+            call = last_call()
+            if call is not None:
+                _EXTRACT_LATENCY.observe(call.latency_ms)
+            return data
+
+        return await hedged(_call, self._hedge_delay(), on_context=adopt_last_call, started=sent)
+
+    async def _resubmit_missing(
+        self, products: list[dict], recovered: list[ProductIngredients], depth: int, split: bool,
+    ) -> list[ProductIngredients]:
+        """회수한 제품은 그대로 쓰고 누락 ASIN만 재요청.
+
+        split=True(출력 잘림)면 누락분을 반으로 나눠, False(깨진 JSON)면 한 배치로 다시 보낸다.
+        """
+        got = {pi.asin for pi in recovered}
+        missing = [p for p in products if p["asin"] not in got]
+        logger.warning(
+            "Gemini response %s: %d/%d products recovered, %d missing (depth %d)",
+            "truncated" if split else "malformed", len(products) - len(missing), len(products),
+            len(missing), depth,
+        )
+        if not missing:
+            return recovered
+        if len(products) == 1 or depth >= EXTRACT_MAX_SPLIT_DEPTH:
+            logger.error(
+                "Gemini extraction gave up on %d ASINs (%s, depth %d): %s",
+                len(missing),
+                "truncated response" if split else "missing from malformed response",
+                depth, [p["asin"] for p in missing][:10],
+            )
+            return recovered
+        if split:
+            mid = max(1, len(missing) // 2)
+            parts = [h for h in (missing[:mid], missing[mid:]) if h]
+        else:
+            parts = [missing]
+        results = await asyncio.gather(
+            *[self._extract_batch(part, depth=depth + 1) for part in parts],
+        )
+        for r in results:
+            recovered.extend(r)
+        return recovered
+
+    async def generate_market_report(
+        self,
+        analysis_data: dict,
+        on_executive_summary: Callable[[str], Awaitable[None]] | None = None,
+    ) -> str:
+        """시장 분석 데이터를 기반으로 AI 인사이트 리포트 생성.
+
+        on_executive_summary가 주어지면 스트리밍으로 생성하고, Executive Summary 섹션이
+        완결되는 즉시 그때까지의 마크다운으로 한 번 호출한다. 반환값은 항상 전체 리포트.
+        스트리밍 실패 시 일반 호출로 재시도한다.
+        """
         def _dump(key: str) -> str:
             return json.dumps(analysis_data.get(key, {}), ensure_ascii=False, indent=2)
 
@@ -353,23 +899,26 @@ class GeminiService:
             customer_voice_json=_dump("customer_voice"),
         )
 
-        max_retries = 2
-        for attempt in range(max_retries):
+        if on_executive_summary is not None:
+            text = await self._stream_market_report(prompt, on_executive_summary)
+            if text:
+                return text
+
+        max_attempts = self.retry.max_attempts
+        for attempt in range(max_attempts):
             try:
-                resp = await self.client.post(
-                    self.report_url,
-                    params={"key": self.api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.3,
-                            "maxOutputTokens": 16384,
-                        },
+                data = await self._generate(
+                    self.MODEL_PRO,
+                    prompt,
+                    {
+                        "temperature": 0.3,
+                        "maxOutputTokens": 16384,
                     },
                     timeout=300.0,
+                    operation="market_report",
+                    attempt=attempt,
+                    static_prefix=MARKET_REPORT_INSTRUCTIONS,
                 )
-                resp.raise_for_status()
-                data = resp.json()
                 text = (
                     data.get("candidates", [{}])[0]
                     .get("content", {})
@@ -379,14 +928,59 @@ class GeminiService:
                 if text:
                     logger.info("Market report generated with %s", self.MODEL_PRO)
                     return text
-                logger.warning("Market report empty response (attempt %d/%d)", attempt + 1, max_retries)
-            except Exception:
-                logger.warning("Market report generation failed (attempt %d/%d)", attempt + 1, max_retries)
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2)
-        logger.error("Market report generation failed after %d attempts", max_retries)
+                logger.warning("Market report empty response (attempt %d/%d)", attempt + 1, max_attempts)
+                error = None
+            except Exception as e:
+                logger.warning("Market report generation failed (attempt %d/%d)", attempt + 1, max_attempts)
+                if not self.retry.should_retry(attempt, e):
+                    break
+                error = e
+            if attempt < max_attempts - 1:
+                await self.retry.wait(attempt, error)
+        logger.error("Market report generation failed after %d attempts", max_attempts)
         return ""
 
+    async def _stream_market_report(
+        self, prompt: str, on_executive_summary: Callable[[str], Awaitable[None]],
+    ) -> str:
+        """리포트 스트리밍 생성. 실패 시 빈 문자열 (호출 측이 일반 호출로 대체)."""
+        text = ""
+        notified = False
+        try:
+            async for piece in self._generate_stream(
+                self.MODEL_PRO,
+                prompt,
+                {
+                    "temperature": 0.3,
+                    "maxOutputTokens": 16384,
+                },
+                timeout=300.0,
+                operation="market_report",
+                static_prefix=MARKET_REPORT_INSTRUCTIONS,
+            ):
+                text += piece
+                if not notified and executive_summary_complete(text):
+                    notified = True
+                    await self._notify_executive_summary(on_executive_summary, text)
+        except Exception:
+            logger.warning("Market report streaming failed after %d chars, falling back", len(text))
+            return ""
+        if text and not notified:
+            # 섹션 경계 없이 끝난 경우 전체 텍스트로 한 번 전달
+            await self._notify_executive_summary(on_executive_summary, text)
+        if text:
+            logger.info("Market report streamed with %s (%d chars)", self.MODEL_PRO, len(text))
+        return text
+
+    @staticmethod
+    async def _notify_executive_summary(
+        callback: Callable[[str], Awaitable[None]], text: str,
+    ) -> None:
+        try:
+            await callback(text)
+        except Exception:
+            logger.exception("Executive summary callback failed")
+
     async def extract_voice_keywords(
         self,
         category_name: str,
@@ -394,6 +988,8 @@ class GeminiService:
     ) -> VoiceKeywordResult | None:
         """customer_says에서 카테고리 맞춤 긍정/부정 키워드 동적 추출.
 
+        제품을 VOICE_SHARD_SIZE 단위로 나눠 병렬 호출한 뒤 merge_voice_keywords로 병합한다.
+        일부 shard 실패 시 해당 shard만 빠진 결과를 반환한다.
         Returns None on failure (caller falls back to hardcoded keywords).
         """
         with_cs = [p for p in products if p.customer_says]
@@ -404,10 +1000,43 @@ class GeminiService:
             )
             return None
 
+        shards = [with_cs[i:i + VOICE_SHARD_SIZE] for i in range(0, len(with_cs), VOICE_SHARD_SIZE)]
+        shard_results = await asyncio.gather(
+            *(self._extract_voice_shard(category_name, shard) for shard in shards)
+        )
+        succeeded = [r for r in shard_results if r is not None]
+        if not succeeded:
+            logger.warning("Voice keywords extraction failed for all %d shards of '%s'", len(shards), category_name)
+            return None
+        if len(succeeded) < len(shards):
+            logger.warning(
+                "Voice keywords: %d/%d shards failed for '%s'",
+                len(shards) - len(succeeded), len(shards), category_name,
+            )
+
+        result = merge_voice_keywords(succeeded, [p.asin for p in with_cs])
+        logger.info(
+            "Voice keywords extracted: %d positive, %d negative for '%s' (%d shards)",
+            len(result.positive_keywords),
+            len(result.negative_keywords),
+            category_name,
+            len(shards),
+        )
+        return result
+
+    async def _extract_voice_shard(
+        self, category_name: str, products: list[WeightedProduct],
+    ) -> VoiceKeywordResult | None:
+        """shard 하나의 키워드 추출. ASIN은 shard 입력에 있는 것만 남긴다."""
         lines = [
-            f"[{p.asin}] {p.customer_says}" for p in with_cs
+            f"[{p.asin}] {truncate_text(p.customer_says, REVIEW_MAX_CHARS)}" for p in products
         ]
         customer_says_block = "\n".join(lines)
+        record_savings(
+            "voice",
+            len("\n".join(f"[{p.asin}] {p.customer_says}" for p in products)),
+            len(customer_says_block),
+        )
 
         prompt = (
             f'아래는 아마존 "{category_name}" 카테고리 제품들의 '
@@ -416,12 +1045,12 @@ class GeminiService:
             f"위 리뷰 요약에서 이 카테고리에서 반복적으로 언급되는 핵심 키워드를 추출하라.\n\n"
             f"규칙:\n"
             f'1. 이 카테고리에 특화된 키워드만 추출 (generic한 "good", "bad", "nice", "love" 등 제외)\n'
-            f"2. 각 키워드는 원문에서 실제 사용된 표현 기반으로, 1-3 단어로 간결하게\n"
+            f"2. 각 키워드는 원문에서 실제 사용된 표현 기반으로, 1-3 단어로 간결하게 (영어 소문자, 기본형)\n"
             f"3. 긍정 키워드: 소비자가 칭찬하는 속성 (효과, 질감, 향 등)\n"
             f"4. 부정 키워드: 소비자가 불만을 표현하는 속성 (자극, 질감, 부작용 등)\n"
             f"5. 각 키워드별로 해당 키워드가 언급된 ASIN 목록을 포함 (전체 ASIN 모두 포함, 누락 없이)\n"
-            f"6. 긍정 10-15개, 부정 10-15개 범위로 추출\n"
-            f"7. 2개 이상의 제품에서 언급된 키워드만 포함\n"
+            f"6. 긍정 10-20개, 부정 10-20개 범위로 추출\n"
+            f"7. 1개 제품에서만 언급된 키워드도 포함 (다른 제품 묶음과 합산하여 판단함)\n"
             f"8. ASIN은 B0XXXXXXXX 형식의 원본 그대로 출력\n\n"
             f"JSON 출력:\n"
             f'{{\n'
@@ -434,23 +1063,21 @@ class GeminiService:
             f"}}"
         )
 
-        for attempt in range(2):
+        valid = {p.asin for p in products}
+        for attempt in range(self.retry.max_attempts):
             try:
-                resp = await self.client.post(
-                    self.url,
-                    params={"key": self.api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.1,
-                            "maxOutputTokens": 65536,
-                            "responseMimeType": "application/json",
-                            "thinkingConfig": {"thinkingBudget": 0},
-                        },
+                data = await self._generate(
+                    self.model,
+                    prompt,
+                    {
+                        "temperature": 0.1,
+                        "maxOutputTokens": VOICE_SHARD_MAX_OUTPUT_TOKENS,
+                        "responseMimeType": "application/json",
+                        "thinkingConfig": {"thinkingBudget": 0},
                     },
+                    operation="voice_keywords",
+                    attempt=attempt,
                 )
-                resp.raise_for_status()
-                data = resp.json()
                 text = (
                     data.get("candidates", [{}])[0]
                     .get("content", {})
@@ -461,25 +1088,24 @@ class GeminiService:
                     logger.warning("Voice keywords empty response (attempt %d)", attempt + 1)
                     continue
 
-                result = VoiceKeywordResult.model_validate_json(text)
-                logger.info(
-                    "Voice keywords extracted: %d positive, %d negative for '%s'",
-                    len(result.positive_keywords),
-                    len(result.negative_keywords),
-                    category_name,
-                )
+                result = self._parse_json(text, VoiceKeywordResult.model_validate_json)
+                for vk in result.positive_keywords + result.negative_keywords:
+                    vk.asins = [a for a in vk.asins if a in valid]
                 return result
 
-            except Exception:
-                if attempt == 0:
-                    logger.warning("Voice keywords extraction failed, retrying")
+            except Exception as e:
+                if self.retry.should_retry(attempt, e):
+                    logger.warning("Voice keywords shard extraction failed, retrying")
+                    await self.retry.wait(attempt, e)
                     continue
-                logger.warning("Voice keywords extraction failed after retries for '%s'", category_name)
+                logger.warning(
+                    "Voice keywords shard extraction failed after retries for '%s' (%d products)",
+                    category_name, len(products),
+                )
                 return None
 
         return None
 
-
     async def extract_title_keywords(
         self,
         category_name: str,
@@ -497,7 +1123,8 @@ class GeminiService:
             )
             return None
 
-        title_block = "\n".join(p.title for p in with_title)
+        title_block = "\n".join(truncate_text(p.title, TITLE_MAX_CHARS) for p in with_title)
+        record_savings("title", len("\n".join(p.title for p in with_title)), len(title_block))
         count = len(with_title)
 
         prompt = (
@@ -519,23 +1146,20 @@ class GeminiService:
             f"}}"
         )
 
-        for attempt in range(2):
+        for attempt in range(self.retry.max_attempts):
             try:
-                resp = await self.client.post(
-                    self.url,
-                    params={"key": self.api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.1,
-                            "maxOutputTokens": 4096,
-                            "responseMimeType": "application/json",
-                            "thinkingConfig": {"thinkingBudget": 0},
-                        },
+                data = await self._generate(
+                    self.model,
+                    prompt,
+                    {
+                        "temperature": 0.1,
+                        "maxOutputTokens": 4096,
+                        "responseMimeType": "application/json",
+                        "thinkingConfig": {"thinkingBudget": 0},
                     },
+                    operation="title_keywords",
+                    attempt=attempt,
                 )
-                resp.raise_for_status()
-                data = resp.json()
                 text = (
                     data.get("candidates", [{}])[0]
                     .get("content", {})
@@ -546,7 +1170,7 @@ class GeminiService:
                     logger.warning("Title keywords empty response (attempt %d)", attempt + 1)
                     continue
 
-                result = TitleKeywordResult.model_validate_json(text)
+                result = self._parse_json(text, TitleKeywordResult.model_validate_json)
                 if not result.keywords:
                     logger.warning("Title keywords returned empty list for '%s'", category_name)
                     return None
@@ -557,9 +1181,10 @@ class GeminiService:
                 )
                 return result
 
-            except Exception:
-                if attempt == 0:
+            except Exception as e:
+                if self.retry.should_retry(attempt, e):
                     logger.warning("Title keywords extraction failed, retrying")
+                    await self.retry.wait(attempt, e)
                     continue
                 logger.warning(
                     "Title keywords extraction failed after retries for '%s'",
@@ -581,19 +1206,15 @@ class GeminiService:
             f"{category_name} →"
         )
         try:
-            resp = await self.client.post(
-                self.url,
-                params={"key": self.api_key},
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.4,
-                        "maxOutputTokens": 512,
-                    },
+            data = await self._generate(
+                self.model,
+                prompt,
+                {
+                    "temperature": 0.4,
+                    "maxOutputTokens": 512,
                 },
+                operation="category_keywords",
             )
-            resp.raise_for_status()
-            data = resp.json()
             text = (
                 data.get("candidates", [{}])[0]
                 .get("content", {})
@@ -656,23 +1277,20 @@ class GeminiService:
             f"- cause/brief/avoid/safe_combo는 각각 반드시 1줄로"
         )
 
-        for attempt in range(2):
+        for attempt in range(self.retry.max_attempts):
             try:
-                resp = await self.client.post(
-                    self.url,
-                    params={"key": self.api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.2,
-                            "maxOutputTokens": 4096,
-                            "responseMimeType": "application/json",
-                            "thinkingConfig": {"thinkingBudget": 0},
-                        },
+                data = await self._generate(
+                    self.model,
+                    prompt,
+                    {
+                        "temperature": 0.2,
+                        "maxOutputTokens": 4096,
+                        "responseMimeType": "application/json",
+                        "thinkingConfig": {"thinkingBudget": 0},
                     },
+                    operation="odm_brief",
+                    attempt=attempt,
                 )
-                resp.raise_for_status()
-                data = resp.json()
                 text = (
                     data.get("candidates", [{}])[0]
                     .get("content", {})
@@ -682,14 +1300,16 @@ class GeminiService:
                 if not text:
                     logger.warning("Empty ODM brief response (attempt %d)", attempt + 1)
                     continue
-                result = json.loads(text)
+                result = self._parse_json(text, json.loads)
                 logger.info("ODM brief generated for '%s'", keyword)
                 return result
-            except Exception:
-                if attempt == 0:
+            except Exception as e:
+                if self.retry.should_retry(attempt, e):
                     logger.warning("ODM brief generation failed, retrying")
+                    await self.retry.wait(attempt, e)
                     continue
                 logger.exception("ODM brief generation failed after retries")
+                break
 
         # Fallback
         return {
@@ -0,0 +1,176 @@
+"""Gemini context caching (cachedContents API).
+
+성분 추출/시장 리포트 프롬프트의 고정 지시문(수 KB)을 매 호출마다 다시 보내지 않도록,
+(모델, 지시문 hash)별로 cachedContents를 한 번 만들어 두고 generateContent 요청은
+cachedContent 이름 + 가변 부분만 보낸다.
+
+- TTL 만료 refresh_margin_sec 전부터는 새 캐시를 만들어 교체 (이전 캐시는 TTL로 자연 소멸)
+- 요청이 캐시 없음(만료/삭제)으로 실패하면 invalidate() 후 호출 측이 다시 만든 캐시로 재요청
+- 생성이 거부되면(최소 토큰 미달, 미지원 모델 등) 일정 시간 인라인 프롬프트로 대체
+
+asyncio.Lock은 이벤트 루프에 묶이므로 캐시 레지스트리는 루프별로 하나씩 둔다.
+
+Usage:
+    name = await get_context_cache().get(client, api_key, model, EXTRACTION_INSTRUCTIONS)
+    if name is None:
+        ...  # 지시문을 프롬프트 앞에 붙여 인라인 전송
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+from amz_researcher.services.gemini_retry import RetryPolicy
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_URL = "https://generativelanguage.googleapis.com/v1beta/cachedContents"
+# generateContent가 이 상태로 실패하고 본문에 cache 언급이 있으면 캐시 만료/삭제로 본다
+CACHE_MISS_STATUSES = frozenset({400, 403, 404})
+# 일시적 오류로 생성에 실패했을 때 인라인으로 보내는 시간
+_TRANSIENT_FAILURE_SEC = 60.0
+
+
+def is_cache_miss(resp: httpx.Response) -> bool:
+    """cachedContent를 참조한 요청이 캐시 만료/삭제로 실패했는지."""
+    return resp.status_code in CACHE_MISS_STATUSES and "cache" in resp.text.lower()
+
+
+@dataclass
+class _CachedPrefix:
+    name: str
+    expires_at: float  # time.monotonic 기준
+
+
+class ContextCache:
+    """(model, 지시문 hash) -> cachedContents 이름 (이벤트 루프 하나 전용)."""
+
+    def __init__(
+        self,
+        ttl_sec: int = 3600,
+        refresh_margin_sec: float = 120.0,
+        unsupported_retry_sec: float = 1800.0,
+    ) -> None:
+        self.ttl_sec = ttl_sec
+        self.refresh_margin_sec = refresh_margin_sec
+        self.unsupported_retry_sec = unsupported_retry_sec
+        self._entries: dict[tuple[str, str], _CachedPrefix] = {}
+        # 생성 실패 후 인라인으로 보낼 기한
+        self._unavailable: dict[tuple[str, str], float] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self.hits = 0
+        self.created = 0
+        self.invalidated = 0
+        self.failures = 0
+
+    @staticmethod
+    def _key(model: str, text: str) -> tuple[str, str]:
+        return model, hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    def _fresh(self, key: tuple[str, str]) -> str | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at - self.refresh_margin_sec > time.monotonic():
+            return entry.name
+        return None
+
+    async def get(self, client: httpx.AsyncClient, api_key: str, model: str, text: str) -> str | None:
+        """지시문 text의 cachedContents 이름. 없거나 만료가 임박하면 새로 만든다. 사용 불가면 None."""
+        key = self._key(model, text)
+        if self._unavailable.get(key, 0.0) > time.monotonic():
+            return None
+        name = self._fresh(key)
+        if name is not None:
+            self.hits += 1
+            return name
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # 대기 중 다른 요청이 이미 만들었으면 그대로 사용
+            name = self._fresh(key)
+            if name is not None:
+                self.hits += 1
+                return name
+            if self._unavailable.get(key, 0.0) > time.monotonic():
+                return None
+            try:
+                name = await self._create(client, api_key, model, text, key[1])
+            except Exception as e:
+                self.failures += 1
+                backoff = _TRANSIENT_FAILURE_SEC if RetryPolicy.is_retryable(e) else self.unsupported_retry_sec
+                self._unavailable[key] = time.monotonic() + backoff
+                logger.warning(
+                    "Gemini context cache unavailable for %s (%s); sending prompt inline for %.0fs",
+                    model, e, backoff,
+                )
+                return None
+            self._entries[key] = _CachedPrefix(name, time.monotonic() + self.ttl_sec)
+            self.created += 1
+            return name
+
+    async def _create(
+        self, client: httpx.AsyncClient, api_key: str, model: str, text: str, digest: str,
+    ) -> str:
+        resp = await client.post(
+            CACHE_URL,
+            params={"key": api_key},
+            json={
+                "model": f"models/{model}",
+                "displayName": f"amz-{digest}",
+                "contents": [{"role": "user", "parts": [{"text": text}]}],
+                "ttl": f"{self.ttl_sec}s",
+            },
+            timeout=60.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        logger.info(
+            "Gemini context cache created: %s (%s, %s tokens, ttl %ds)",
+            data["name"], model, data.get("usageMetadata", {}).get("totalTokenCount", "?"), self.ttl_sec,
+        )
+        return data["name"]
+
+    def invalidate(self, name: str) -> None:
+        """만료/삭제된 캐시 항목 제거 (다음 get()에서 다시 생성)."""
+        for key, entry in list(self._entries.items()):
+            if entry.name == name:
+                del self._entries[key]
+                self.invalidated += 1
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "entries": [
+                {"model": model, "name": e.name, "expires_in_sec": round(e.expires_at - now)}
+                for (model, _), e in self._entries.items()
+            ],
+            "hits": self.hits,
+            "created": self.created,
+            "invalidated": self.invalidated,
+            "failures": self.failures,
+        }
+
+
+_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_context_cache() -> ContextCache:
+    """현재 이벤트 루프의 프로세스 공용 context cache 레지스트리."""
+    loop = asyncio.get_running_loop()
+    with _caches_lock:
+        cache = _caches.get(loop)
+        if cache is None:
+            cache = _caches[loop] = ContextCache(ttl_sec=settings.AMZ_GEMINI_CONTEXT_CACHE_TTL_SEC)
+        return cache
+
+
+def context_cache_stats() -> list[dict]:
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [c.stats() for c in caches]
@@ -0,0 +1,171 @@
+"""Gemini API 프로세스 공용 동시성/속도 제한.
+
+모델별로 하나의 GeminiLimiter를 공유한다 (GeminiService 인스턴스/요청과 무관).
+- max_in_flight: 동시에 진행 중인 요청 수 상한 (대기열에서 순서대로 대기)
+- rpm / tpm: 분당 요청 수 / 토큰 수 token bucket
+
+token bucket은 예약 방식이다. 요청 시점에 토큰을 먼저 차감하고(잔량이 음수가 될 수 있음)
+부족분이 다시 채워질 때까지 sleep한 다음 in-flight 슬롯을 기다린다. 토큰 수는 프롬프트 길이로 추정해 예약하고,
+응답의 usageMetadata로 실제 사용량과의 차이를 정산한다.
+
+Usage:
+    async with get_limiter(model).slot(estimated_tokens) as slot:
+        resp = await client.post(...)
+        slot.settle(actual_tokens)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+
+from app.config import settings
+from lib.query_stats import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 한국어/영어 혼합 프롬프트 기준 대략적인 문자/토큰 비율
+CHARS_PER_TOKEN = 3
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """프롬프트 길이 기반 토큰 추정 (입력 + 출력 상한의 절반)."""
+    return len(text) // CHARS_PER_TOKEN + max_output_tokens // 2
+
+
+class TokenBucket:
+    """분당 capacity만큼 채워지는 예약형 token bucket (thread-safe)."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """amount 차감 후 대기해야 할 시간(초) 반환."""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """예약량과 실제 사용량의 차이 정산 (delta > 0이면 추가 차감)."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens - delta)
+
+
+class _Slot:
+    def __init__(self, limiter: GeminiLimiter, reserved_tokens: int) -> None:
+        self._limiter = limiter
+        self._reserved = reserved_tokens
+
+    def settle(self, actual_tokens: int | None) -> None:
+        """응답의 실제 토큰 사용량으로 TPM 예약량 정산."""
+        if actual_tokens:
+            self._limiter.tpm.adjust(actual_tokens - self._reserved)
+            self._reserved = actual_tokens
+
+
+class GeminiLimiter:
+    """모델 하나에 대한 in-flight 상한 + RPM/TPM bucket + 대기 시간 지표."""
+
+    def __init__(self, model: str, max_in_flight: int, rpm: int, tpm: int) -> None:
+        self.model = model
+        self.max_in_flight = max_in_flight
+        self.rpm = TokenBucket(rpm)
+        self.tpm = TokenBucket(tpm)
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.queue_time = Histogram()
+        self._waiting = 0
+        self._in_flight = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sem = self._semaphores.get(loop)
+            if sem is None:
+                sem = self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+            return sem
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int):
+        """RPM/TPM 예산을 예약하고 부족분만큼 sleep한 뒤 in-flight 슬롯을 잡는다.
+
+        속도 제한 대기는 슬롯 밖에서 하므로, 대기 중인 요청이 max_in_flight 자리를
+        차지해 이미 예산이 있는 다른 요청을 막지 않는다.
+        """
+        started = time.monotonic()
+        self._waiting += 1
+        sem = self._semaphore()
+        try:
+            delay = max(self.rpm.reserve(1), self.tpm.reserve(estimated_tokens))
+            try:
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await sem.acquire()
+            except BaseException:
+                # 호출 전에 취소: 예약한 예산 반환
+                self.rpm.adjust(-1)
+                self.tpm.adjust(-estimated_tokens)
+                raise
+        finally:
+            self._waiting -= 1
+        waited_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            self.queue_time.observe(waited_ms)
+        if waited_ms >= 1000:
+            logger.info("Gemini %s queued %.0f ms (in-flight %d)", self.model, waited_ms, self._in_flight)
+        self._in_flight += 1
+        try:
+            yield _Slot(self, estimated_tokens)
+        finally:
+            self._in_flight -= 1
+            sem.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "model": self.model,
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "queued_requests": self.queue_time.count,
+                "queue_avg_ms": round(self.queue_time.avg_ms, 1),
+                "queue_p95_ms": self.queue_time.percentile(0.95),
+                "queue_max_ms": round(self.queue_time.max_ms, 1),
+            }
+
+
+_limiters: dict[str, GeminiLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(model: str) -> GeminiLimiter:
+    """모델별 프로세스 공용 limiter. Pro/Flash 쿼터는 settings에서."""
+    with _limiters_lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            is_pro = "pro" in model
+            limiter = GeminiLimiter(
+                model,
+                max_in_flight=settings.AMZ_GEMINI_MAX_IN_FLIGHT,
+                rpm=settings.AMZ_GEMINI_PRO_RPM if is_pro else settings.AMZ_GEMINI_FLASH_RPM,
+                tpm=settings.AMZ_GEMINI_PRO_TPM if is_pro else settings.AMZ_GEMINI_FLASH_TPM,
+            )
+            _limiters[model] = limiter
+        return limiter
+
+
+def limiter_stats() -> list[dict]:
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [lim.stats() for lim in limiters]
@@ -0,0 +1,176 @@
+"""Gemini 재시도 정책(지수 backoff + jitter, Retry-After 존중)과 hedged request.
+
+- RetryPolicy: 재시도 가능 여부 판단 + attempt별 대기 시간 (full jitter)
+- LatencyWindow: 최근 성공 지연의 이동 창. hedge 지연(p95) 계산용
+- hedged(): 주 요청이 hedge 지연 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 끝난 응답 사용
+
+Usage:
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=30.0)
+    for attempt in range(policy.max_attempts):
+        try:
+            return await call()
+        except Exception as e:
+            if not policy.should_retry(attempt, e):
+                raise
+            await policy.wait(attempt, e)
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 일시적 장애로 보고 재시도하는 HTTP 상태
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """HTTP 응답의 Retry-After 헤더(초 또는 HTTP-date) 해석."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """지수 backoff + full jitter. Retry-After가 있으면 그 값 이상 대기 (max_retry_after 상한)."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        max_retry_after: float = 120.0,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_retry_after = max_retry_after
+
+    @staticmethod
+    def is_retryable(exc: BaseException) -> bool:
+        """4xx 요청 오류(429/408 제외)는 재시도해도 같은 결과이므로 제외."""
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in RETRYABLE_STATUSES
+        # 타임아웃/연결 오류, 응답 JSON 파싱 실패 등은 재시도
+        return isinstance(exc, Exception)
+
+    def should_retry(self, attempt: int, exc: BaseException) -> bool:
+        return attempt + 1 < self.max_attempts and self.is_retryable(exc)
+
+    def delay(self, attempt: int, exc: BaseException | None = None) -> float:
+        """attempt(0부터)번째 실패 후 대기 시간(초)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** attempt)
+        delay = random.uniform(0, ceiling)
+        retry_after = retry_after_seconds(exc) if exc is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+    async def wait(self, attempt: int, exc: BaseException | None = None) -> None:
+        delay = self.delay(attempt, exc)
+        if delay > 0:
+            logger.info("Gemini retry backoff %.1fs (attempt %d, %s)", delay, attempt + 1, type(exc).__name__)
+            await asyncio.sleep(delay)
+
+
+class LatencyWindow:
+    """최근 N개 성공 지연(ms)의 이동 창 (thread-safe)."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._values: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float) -> None:
+        with self._lock:
+            self._values.append(ms)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            values = sorted(self._values)
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def hedged(
+    make_call: Callable[[bool], Awaitable[T]],
+    delay: float | None,
+    on_context: Callable[[contextvars.Context], None] | None = None,
+    started: asyncio.Event | None = None,
+) -> T:
+    """make_call(False)를 시작하고 delay초 안에 끝나지 않으면 make_call(True)를 추가로 시작.
+
+    먼저 성공한 결과를 반환하고 나머지는 취소한다. 한쪽이 실패하면 다른 쪽을 기다리고,
+    모두 실패하면 주 요청의 예외를 올린다. delay가 None이면 hedge 없이 주 요청만 실행.
+    on_context: 결과를 낸 task의 context를 넘겨받는 콜백 (contextvar 전달용).
+    started: 주 요청이 실제로 전송을 시작하면 set되는 event. 주어지면 delay는 그 시점부터
+        잰다 (limiter 대기 중인 요청에는 hedge를 보내지 않음).
+    """
+    if delay is None:
+        return await make_call(False)
+    primary_ctx = contextvars.copy_context()
+    primary = asyncio.create_task(make_call(False), context=primary_ctx)
+    contexts = {primary: primary_ctx}
+    pending: set[asyncio.Task] = {primary}
+    try:
+        if started is not None:
+            waiter = asyncio.ensure_future(started.wait())
+            try:
+                await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if not done:
+            hedge_ctx = contextvars.copy_context()
+            hedge = asyncio.create_task(make_call(True), context=hedge_ctx)
+            contexts[hedge] = hedge_ctx
+            pending.add(hedge)
+            logger.info("Gemini hedge request issued after %.1fs", delay)
+        else:
+            pending = done
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    if on_context is not None:
+                        on_context(contexts[task])
+                    return task.result()
+        if on_context is not None:
+            on_context(primary_ctx)
+        return primary.result()
+    finally:
+        for task in contexts:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,249 @@
+"""Gemini 호출 계측: 호출별 지연/토큰/재시도/HTTP 상태/JSON 파싱 결과.
+
+GeminiService._generate / _generate_stream이 호출마다 GeminiCall을 기록한다.
+기록은 프로세스 전역 통계(operation·model별 히스토그램)와, start_tracking()으로 열린
+요청 단위 통계에 동시에 누적된다 (lib.query_stats와 같은 구조).
+
+JSON 파싱/복구 결과는 응답을 받은 뒤 호출 측에서 note_json_outcome()으로 붙인다.
+직전 호출은 contextvar로 찾으므로 _generate를 await한 같은 코루틴에서 호출해야 한다.
+
+Usage:
+    stats, token = start_tracking()
+    ...  # Gemini 호출
+    stop_tracking(token)
+    logger.info("Gemini stats:\n%s", stats.format_summary())
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+
+from lib.query_stats import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 요청 단위 통계에 보관할 최대 호출 수 (초과분은 집계만)
+MAX_CALLS_PER_REQUEST = 500
+
+# JSON 파싱 결과
+JSON_OK = "ok"
+JSON_REPAIRED = "repaired"  # 파싱 실패 후 깨진/잘린 JSON에서 제품 일부 회수
+JSON_TRUNCATED = "truncated"  # finishReason=MAX_TOKENS
+JSON_FAILED = "failed"
+
+
+@dataclass
+class GeminiCall:
+    operation: str
+    model: str
+    attempt: int = 0
+    streamed: bool = False
+    hedge: bool = False  # hedged request로 추가 발행된 호출
+    status: int = 0  # HTTP 상태 코드 (0: 응답 없음 — 타임아웃/연결 오류)
+    queue_ms: float = 0.0
+    latency_ms: float = 0.0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    thinking_tokens: int = 0
+    cached_tokens: int = 0  # context cache에서 읽은 입력 토큰 (prompt_tokens에 포함)
+    total_tokens: int = 0
+    finish_reason: str = ""
+    json_outcome: str = ""
+    error: str = ""
+
+    def apply_usage(self, usage: dict) -> None:
+        """응답 usageMetadata 반영."""
+        self.prompt_tokens = int(usage.get("promptTokenCount") or 0)
+        self.output_tokens = int(usage.get("candidatesTokenCount") or 0)
+        self.thinking_tokens = int(usage.get("thoughtsTokenCount") or 0)
+        self.cached_tokens = int(usage.get("cachedContentTokenCount") or 0)
+        self.total_tokens = int(usage.get("totalTokenCount") or 0)
+
+
+@dataclass
+class OperationStats:
+    operation: str
+    model: str
+    calls: int = 0
+    retries: int = 0
+    hedges: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    thinking_tokens: int = 0
+    cached_tokens: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    statuses: Counter = field(default_factory=Counter)
+    json_outcomes: Counter = field(default_factory=Counter)
+
+
+class GeminiTelemetry:
+    """(operation, model)별 호출 통계 + (요청 단위일 때) 호출 목록."""
+
+    def __init__(self, keep_calls: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._ops: dict[tuple[str, str], OperationStats] = {}
+        self._keep_calls = keep_calls
+        self.calls: list[GeminiCall] = []
+
+    def _op(self, call: GeminiCall) -> OperationStats:
+        key = (call.operation, call.model)
+        op = self._ops.get(key)
+        if op is None:
+            op = self._ops[key] = OperationStats(call.operation, call.model)
+        return op
+
+    def record(self, call: GeminiCall) -> None:
+        with self._lock:
+            op = self._op(call)
+            op.calls += 1
+            op.retries += 1 if call.attempt else 0
+            op.hedges += 1 if call.hedge else 0
+            op.errors += 1 if call.error else 0
+            op.prompt_tokens += call.prompt_tokens
+            op.output_tokens += call.output_tokens
+            op.thinking_tokens += call.thinking_tokens
+            op.cached_tokens += call.cached_tokens
+            op.latency.observe(call.latency_ms)
+            op.statuses[call.status] += 1
+            if self._keep_calls and len(self.calls) < MAX_CALLS_PER_REQUEST:
+                self.calls.append(call)
+
+    def record_json_outcome(self, call: GeminiCall, outcome: str) -> None:
+        with self._lock:
+            self._op(call).json_outcomes[outcome] += 1
+
+    def operations(self) -> list[OperationStats]:
+        """총 소요 시간 내림차순."""
+        with self._lock:
+            ops = list(self._ops.values())
+        return sorted(ops, key=lambda o: o.latency.total_ms, reverse=True)
+
+    def snapshot(self, include_calls: bool = False) -> dict:
+        """JSON 직렬화 가능한 통계 (request log / 대시보드용)."""
+        result: dict = {
+            "operations": [
+                {
+                    "operation": o.operation,
+                    "model": o.model,
+                    "calls": o.calls,
+                    "retries": o.retries,
+                    "hedges": o.hedges,
+                    "errors": o.errors,
+                    "prompt_tokens": o.prompt_tokens,
+                    "output_tokens": o.output_tokens,
+                    "thinking_tokens": o.thinking_tokens,
+                    "cached_tokens": o.cached_tokens,
+                    "total_ms": round(o.latency.total_ms, 1),
+                    "avg_ms": round(o.latency.avg_ms, 1),
+                    "p50_ms": o.latency.percentile(0.5),
+                    "p95_ms": o.latency.percentile(0.95),
+                    "max_ms": round(o.latency.max_ms, 1),
+                    "buckets": list(o.latency.buckets),
+                    "statuses": {str(k): v for k, v in o.statuses.items()},
+                    "json_outcomes": dict(o.json_outcomes),
+                }
+                for o in self.operations()
+            ],
+        }
+        if include_calls:
+            with self._lock:
+                result["calls"] = [asdict(c) for c in self.calls]
+        return result
+
+    def format_summary(self) -> str:
+        ops = self.operations()
+        lines = [f"{sum(o.calls for o in ops)} Gemini calls"]
+        for o in ops:
+            lines.append(
+                f"  {o.latency.total_ms:9.0f} ms  x{o.calls:<3d} retries={o.retries} hedges={o.hedges} errors={o.errors} "
+                f"p95={o.latency.percentile(0.95):.0f}ms tokens={o.prompt_tokens}/{o.output_tokens}"
+                f"(+{o.thinking_tokens} thinking, {o.cached_tokens} cached) json={dict(o.json_outcomes)}  [{o.operation} {o.model}]"
+            )
+        return "\n".join(lines)
+
+
+_global = GeminiTelemetry()
+_current: contextvars.ContextVar[GeminiTelemetry | _SharedTelemetry | None] = contextvars.ContextVar(
+    "gemini_telemetry", default=None,
+)
+_last_call: contextvars.ContextVar[GeminiCall | None] = contextvars.ContextVar(
+    "gemini_last_call", default=None,
+)
+
+
+def global_gemini_stats() -> GeminiTelemetry:
+    """프로세스 전역 누적 통계."""
+    return _global
+
+
+def record_call(call: GeminiCall) -> None:
+    _global.record(call)
+    current = _current.get()
+    if current is not None:
+        current.record(call)
+    _last_call.set(call)
+
+
+def last_call() -> GeminiCall | None:
+    """현재 context에서 직전에 기록된 Gemini 호출."""
+    return _last_call.get()
+
+
+def adopt_last_call(ctx: contextvars.Context) -> None:
+    """다른 task(context)에서 실행된 호출을 현재 context의 직전 호출로 지정 (hedged request용)."""
+    _last_call.set(ctx.get(_last_call))
+
+
+def note_json_outcome(outcome: str) -> None:
+    """직전 Gemini 호출 응답의 JSON 파싱/복구 결과 기록."""
+    call = _last_call.get()
+    if call is None:
+        return
+    call.json_outcome = outcome
+    _global.record_json_outcome(call, outcome)
+    current = _current.get()
+    if current is not None:
+        current.record_json_outcome(call, outcome)
+
+
+class _SharedTelemetry:
+    """여러 요청이 함께 쓰는 호출(요청 간 배치)을 참여한 요청 통계 모두에 기록.
+
+    trackers 목록은 복사하지 않으므로, 호출자가 나중에 추가한 요청에도 이후 호출이 기록된다.
+    """
+
+    def __init__(self, trackers: list[GeminiTelemetry]) -> None:
+        self._trackers = trackers
+
+    def record(self, call: GeminiCall) -> None:
+        for t in self._trackers:
+            t.record(call)
+
+    def record_json_outcome(self, call: GeminiCall, outcome: str) -> None:
+        for t in self._trackers:
+            t.record_json_outcome(call, outcome)
+
+
+def current_tracker() -> GeminiTelemetry | None:
+    """현재 context의 요청 단위 통계 (없으면 None)."""
+    current = _current.get()
+    return current if isinstance(current, GeminiTelemetry) else None
+
+
+def track_shared(trackers: list[GeminiTelemetry]) -> None:
+    """현재 context(요청 간 공유 배치 task)의 호출을 trackers 모두에 기록하도록 지정."""
+    _current.set(_SharedTelemetry(trackers))
+
+
+def start_tracking() -> tuple[GeminiTelemetry, contextvars.Token]:
+    """요청 단위 통계 수집 시작. stop_tracking(token)으로 종료."""
+    stats = GeminiTelemetry(keep_calls=True)
+    return stats, _current.set(stats)
+
+
+def stop_tracking(token: contextvars.Token) -> None:
+    _current.reset(token)
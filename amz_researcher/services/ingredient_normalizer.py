@@ -0,0 +1,202 @@
+"""로컬 INCI 성분 정규화: 과거 Gemini 추출 결과로 학습한 사전으로 성분을 미리 해석.
+
+amz_ingredient_cache(추출 결과)와 amz_products.ingredients(추출 입력)를 대조해
+INCI 표기별로 "본 횟수 / 선별된 횟수 / common_name·category 다수결"을 집계한다.
+EXTRACTION_INSTRUCTIONS 규칙과 같은 방향으로 표기 변형(대소문자, 괄호 일반명, 식물 부위)을 접는다.
+
+제품의 INCI 토큰이 모두 사전으로 판정(선별 또는 제외)되면 Gemini 없이 결과를 만들고,
+판정할 수 없는 토큰이 하나라도 있으면 Gemini로 보낸다. 로컬 해석 결과는 학습 데이터
+(amz_ingredient_cache)에 저장하지 않는다 (사전이 자기 추측으로 다시 학습하지 않도록).
+
+Usage:
+    normalizer = IngredientNormalizer(min_support=5)
+    normalizer.observe(inci_text, extracted_ingredients)
+    normalizer.resolve(product)  # list[Ingredient] | None
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+from amz_researcher.models import Ingredient
+
+# EXTRACTION_INSTRUCTIONS 규칙 4: 용매/방부제/향료 등 기본 성분은 항상 제외
+BASE_EXCLUDED = frozenset({
+    "water", "aqua", "eau", "aqua water", "water aqua", "purified water", "deionized water",
+    "phenoxyethanol", "ethylhexylglycerin", "fragrance", "parfum", "fragrance parfum",
+    "parfum fragrance", "linalool", "limonene", "citronellol", "geraniol", "citral",
+    "hexyl cinnamal", "benzyl alcohol", "benzyl benzoate", "coumarin", "eugenol",
+})
+
+# 규칙 2: 같은 식물이면 부위와 무관하게 같은 common_name
+_PLANT_PARTS = frozenset({
+    "leaf", "leaves", "seed", "fruit", "kernel", "root", "flower", "bark", "peel", "stem",
+})
+_PAREN_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_PREFIX_RE = re.compile(r"^\s*(?:full\s+)?ingredients?\s*[:：]\s*", re.IGNORECASE)
+# INCI 목록으로 보기 어려운 짧은 입력은 로컬에서 판단하지 않음
+_MIN_TOKENS = 3
+
+
+def split_inci(text: str) -> list[str]:
+    """전성분 문자열을 성분 토큰으로 분리 (괄호 안 쉼표는 무시)."""
+    text = _PREFIX_RE.sub("", text or "")
+    tokens: list[str] = []
+    depth = 0
+    current: list[str] = []
+    for ch in text:
+        if ch in "([":
+            depth += 1
+        elif ch in ")]" and depth:
+            depth -= 1
+        if ch in ",;" and depth == 0:
+            tokens.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    tokens.append("".join(current))
+    return [t.strip(" .*\t\r\n") for t in tokens if t.strip(" .*\t\r\n")]
+
+
+def fold_inci_name(name: str) -> str:
+    """표기 변형을 접은 사전 키: 소문자, 괄호 일반명/구두점 제거, 식물 부위 제거."""
+    text = _PAREN_RE.sub(" ", name.casefold())
+    words = [w for w in _NON_ALNUM_RE.sub(" ", text).split() if w not in _PLANT_PARTS]
+    if words and words[0] == "organic":
+        words = words[1:]
+    return " ".join(words)
+
+
+@dataclass
+class _Entry:
+    seen: int = 0
+    selected: int = 0
+    common_names: Counter = field(default_factory=Counter)
+    categories: Counter = field(default_factory=Counter)
+
+    def majority(self) -> tuple[str, str]:
+        """(common_name, category) 다수결. 동수면 사전순으로 결정적."""
+        common = min(self.common_names.items(), key=lambda kv: (-kv[1], kv[0]))[0]
+        category = min(self.categories.items(), key=lambda kv: (-kv[1], kv[0]))[0]
+        return common, category
+
+
+class IngredientNormalizer:
+    """과거 추출 결과로 학습한 INCI → (선별 여부, common_name, category) 사전."""
+
+    def __init__(self, min_support: int = 5) -> None:
+        self.min_support = min_support
+        self._entries: dict[str, _Entry] = {}
+        self._featured_re: re.Pattern | None = None
+        # casefold common_name -> (common_name, category)
+        self._featured_names: dict[str, tuple[str, str]] = {}
+        self.products_observed = 0
+
+    def __len__(self) -> int:
+        return sum(1 for e in self._entries.values() if e.seen >= self.min_support)
+
+    def observe(self, inci_text: str, ingredients: list[Ingredient]) -> None:
+        """추출 입력(전성분)과 그 추출 결과 한 건을 학습."""
+        tokens = split_inci(inci_text)
+        if not tokens:
+            return
+        chosen: dict[str, Ingredient] = {}
+        for ing in ingredients:
+            key = fold_inci_name(ing.name)
+            if key and ing.source != "featured":
+                chosen.setdefault(key, ing)
+        for key in {fold_inci_name(t) for t in tokens}:
+            if not key or key in BASE_EXCLUDED:
+                continue
+            entry = self._entries.setdefault(key, _Entry())
+            entry.seen += 1
+            ing = chosen.get(key)
+            if ing is not None:
+                entry.selected += 1
+                entry.common_names[ing.common_name or ing.name] += 1
+                entry.categories[ing.category] += 1
+        self.products_observed += 1
+        self._featured_re = None
+
+    def _lookup(self, key: str) -> tuple[bool, tuple[str, str] | None]:
+        """(판정 가능 여부, 선별 시 (common_name, category) / 제외 시 None)."""
+        if key in BASE_EXCLUDED:
+            return True, None
+        entry = self._entries.get(key)
+        if entry is None or entry.seen < self.min_support:
+            return False, None
+        if entry.selected * 2 > entry.seen:
+            return True, entry.majority()
+        return True, None
+
+    def _featured_pattern(self) -> re.Pattern | None:
+        """title/features에서 찾을 선별 성분 common_name 패턴 (긴 이름 우선)."""
+        if self._featured_re is None:
+            names: dict[str, tuple[str, str]] = {}
+            for entry in self._entries.values():
+                if entry.seen >= self.min_support and entry.selected * 2 > entry.seen:
+                    common, category = entry.majority()
+                    if len(common) >= 4:
+                        names.setdefault(common.casefold(), (common, category))
+            self._featured_names = names
+            if not names:
+                return None
+            alternation = "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+            self._featured_re = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+        return self._featured_re
+
+    def resolve(self, product: dict) -> list[Ingredient] | None:
+        """사전만으로 추출 결과를 만들 수 있으면 반환, 아니면 None (Gemini로 보낼 제품).
+
+        - 기본 제외 성분이 아닌 INCI 토큰 중 하나라도 신뢰할 판정(min_support 이상 관측)이
+          없으면 None (새 성분은 Gemini가 판단)
+        - title/features에 common_name이 있으면 source "both", INCI에 없이 title/features에만
+          있는 선별 성분은 "featured"로 추가
+        """
+        tokens = split_inci(product.get("ingredients_raw") or "")
+        if len(tokens) < _MIN_TOKENS:
+            return None
+        picked: list[tuple[str, str, str]] = []
+        for token in tokens:
+            ok, resolved = self._lookup(fold_inci_name(token))
+            if not ok:
+                return None
+            if resolved is not None:
+                picked.append((token, *resolved))
+
+        featured_text = " ".join(
+            [str(product.get("title") or "")] + [str(f) for f in product.get("features") or []]
+        ).casefold()
+        results: list[Ingredient] = []
+        seen_common: set[str] = set()
+        for name, common, category in picked:
+            in_text = common.casefold() in featured_text or name.casefold() in featured_text
+            results.append(Ingredient(
+                name=name, common_name=common, category=category,
+                source="both" if in_text else "inci",
+            ))
+            seen_common.add(common.casefold())
+
+        pattern = self._featured_pattern()
+        if pattern is not None and featured_text:
+            for m in pattern.finditer(featured_text):
+                common_key = m.group(0).casefold()
+                if common_key in seen_common:
+                    continue
+                seen_common.add(common_key)
+                common, category = self._featured_names[common_key]
+                results.append(Ingredient(
+                    name=common, common_name=common, category=category, source="featured",
+                ))
+        return results
+
+    def stats(self) -> dict:
+        trusted = [e for e in self._entries.values() if e.seen >= self.min_support]
+        return {
+            "products_observed": self.products_observed,
+            "names": len(self._entries),
+            "trusted_names": len(trusted),
+            "selected_names": sum(1 for e in trusted if e.selected * 2 > e.seen),
+        }
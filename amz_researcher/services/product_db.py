@@ -2,7 +2,7 @@ import json
 import logging
 from datetime import datetime
 
-from lib.mysql_connector import MysqlConnector
+from lib.mysql_connector import AsyncServiceProxy, MysqlConnector
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,8 @@ class ProductDBService:
 
     def __init__(self, environment: str = "CFO"):
         self._env = environment
+        # 이벤트 루프에서 호출할 async 변형: await self.aio.<method>(...)
+        self.aio = AsyncServiceProxy(self)
 
     def search_categories(self, keyword: str) -> list[dict]:
         """키워드로 카테고리 fuzzy 검색. 전체 카테고리 대상."""
@@ -160,9 +162,11 @@ class ProductDBService:
         Returns:
             {"product_count": int, "collected_at": datetime} or None (미수집)
         """
+        # amz_products.collected_at은 내용이 바뀐 행만 갱신되므로(row_hash 변경 감지)
+        # 매 수집마다 갱신되는 카테고리 매핑의 collected_at을 기준으로 한다
         query = """
             SELECT COUNT(*) as product_count,
-                   MAX(p.collected_at) as collected_at
+                   MAX(pc.collected_at) as collected_at
             FROM amz_products p
             JOIN amz_product_categories pc ON p.asin = pc.asin
             WHERE pc.category_node_id = %s
@@ -179,7 +183,11 @@ class ProductDBService:
         count = int(row["product_count"])
         if count == 0 or row["collected_at"] is None:
             return None
-        return {"product_count": count, "collected_at": row["collected_at"]}
+        collected_at = row["collected_at"]
+        return {
+            "product_count": count,
+            "collected_at": datetime(collected_at.year, collected_at.month, collected_at.day),
+        }
 
     # ── 키워드 유사 검색 ──────────────────────────────
 
@@ -445,26 +453,22 @@ class ProductDBService:
               AND voice_negative != CAST('null' AS JSON)
               AND JSON_LENGTH(voice_negative) > 0
         """
+        result = []
         try:
             with MysqlConnector(self._env) as conn:
-                df = conn.read_query_table(query)
+                for row in conn.read_query_stream(query, as_dicts=True):
+                    neg = row["voice_negative"]
+                    if isinstance(neg, str):
+                        neg = json.loads(neg)
+                    result.append({
+                        "asin": row["asin"],
+                        "ingredients": row["ingredients"],
+                        "voice_negative": neg or [],
+                        "bs_category": row["bs_category"] or "Unknown",
+                    })
         except Exception:
             logger.exception("Failed to get products with voice")
             return []
-        if df.empty:
-            return []
-
-        result = []
-        for _, row in df.iterrows():
-            neg = row["voice_negative"]
-            if isinstance(neg, str):
-                neg = json.loads(neg)
-            result.append({
-                "asin": row["asin"],
-                "ingredients": row["ingredients"],
-                "voice_negative": neg or [],
-                "bs_category": row["bs_category"] or "Unknown",
-            })
         return result
 
     def get_voice_keyword_stats(self) -> list[dict]:
@@ -528,32 +532,46 @@ class ProductDBService:
         product_count: int = 0,
         report_id: str = "",
         duration_sec: float | None = None,
+        stage_timings: dict[str, int] | None = None,
+        gemini_stats: dict | None = None,
     ) -> None:
-        """요청 완료 로그 업데이트."""
+        """요청 완료 로그 업데이트.
+
+        stage_timings: 단계별 소요 시간(ms), gemini_stats: gemini_telemetry snapshot.
+        """
         query = """
             UPDATE amz_report_request_log
             SET status = 'completed', product_count = %s, report_id = %s,
-                duration_sec = %s, completed_at = %s
+                duration_sec = %s, stage_timings_json = %s, gemini_stats_json = %s,
+                completed_at = %s
             WHERE id = %s
         """
         now = datetime.now()
+        timings_json = json.dumps(stage_timings) if stage_timings else None
+        gemini_json = json.dumps(gemini_stats, ensure_ascii=False) if gemini_stats else None
         try:
             with MysqlConnector(self._env) as conn:
-                conn.cursor.execute(query, (product_count, report_id, duration_sec, now, log_id))
+                conn.cursor.execute(
+                    query,
+                    (product_count, report_id, duration_sec, timings_json, gemini_json, now, log_id),
+                )
                 conn.connection.commit()
         except Exception:
             logger.exception("Failed to log request complete")
 
-    def log_request_failed(self, log_id: int, error: str = "") -> None:
+    def log_request_failed(
+        self, log_id: int, error: str = "", gemini_stats: dict | None = None,
+    ) -> None:
         """요청 실패 로그 업데이트."""
         query = """
             UPDATE amz_report_request_log
-            SET status = 'failed', error_message = %s, completed_at = %s
+            SET status = 'failed', error_message = %s, gemini_stats_json = %s, completed_at = %s
             WHERE id = %s
         """
+        gemini_json = json.dumps(gemini_stats, ensure_ascii=False) if gemini_stats else None
         try:
             with MysqlConnector(self._env) as conn:
-                conn.cursor.execute(query, (error[:500], datetime.now(), log_id))
+                conn.cursor.execute(query, (error[:500], gemini_json, datetime.now(), log_id))
                 conn.connection.commit()
         except Exception:
             logger.exception("Failed to log request failure")
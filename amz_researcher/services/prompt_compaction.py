@@ -0,0 +1,132 @@
+"""Gemini 프롬프트 입력 압축.
+
+프롬프트 규칙상 어차피 버려지는 입력(기본 INCI 성분, 중복 features)과 과도하게 긴 텍스트를
+요청 전에 줄인다. 압축 전/후 크기는 label별로 누적해 절감량(추정 토큰)을 확인한다.
+
+Usage:
+    compacted = compact_extraction_product(product)
+    record_savings("extraction", before_chars, after_chars)
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+
+from amz_researcher.services.gemini_limiter import CHARS_PER_TOKEN
+from amz_researcher.services.ingredient_normalizer import BASE_EXCLUDED, fold_inci_name, split_inci
+
+logger = logging.getLogger(__name__)
+
+# 필드별 문자 수 상한
+INCI_MAX_CHARS = 4000
+FEATURES_MAX_CHARS = 1500
+DETAIL_VALUE_MAX_CHARS = 300
+REVIEW_MAX_CHARS = 800
+TITLE_MAX_CHARS = 200
+
+_WS_RE = re.compile(r"\s+")
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """공백을 접고 limit 이내의 마지막 문장/구 경계에서 자른다."""
+    text = _WS_RE.sub(" ", str(text or "")).strip()
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    for sep in (". ", ", ", " "):
+        idx = cut.rfind(sep)
+        if idx >= limit // 2:
+            return cut[: idx + 1].rstrip(" ,")
+    return cut
+
+
+def compact_inci(text: str) -> str:
+    """기본 제외 성분(용매/방부제/향료)과 중복 표기를 빼고 다시 이어 붙인다.
+
+    fold_inci_name은 식물 부위(Leaf/Seed 등)를 지우므로 BASE_EXCLUDED 판정에만 쓰고,
+    중복은 대소문자/공백만 다른 표기로 한정한다 (같은 식물의 다른 부위 성분은 유지).
+    """
+    kept: list[str] = []
+    seen: set[str] = set()
+    for token in split_inci(text):
+        if fold_inci_name(token) in BASE_EXCLUDED:
+            continue
+        key = _WS_RE.sub(" ", token).strip().casefold()
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(token)
+    return truncate_text(", ".join(kept), INCI_MAX_CHARS)
+
+
+def dedupe_features(features: list) -> list[str]:
+    """대소문자/공백만 다른 중복 feature 제거 + 전체 길이 상한."""
+    result: list[str] = []
+    seen: set[str] = set()
+    used = 0
+    for f in features or []:
+        text = _WS_RE.sub(" ", str(f)).strip()
+        key = text.casefold()
+        if not text or key in seen:
+            continue
+        if used + len(text) > FEATURES_MAX_CHARS:
+            text = truncate_text(text, FEATURES_MAX_CHARS - used)
+            if not text:
+                break
+        seen.add(key)
+        result.append(text)
+        used += len(text)
+        if used >= FEATURES_MAX_CHARS:
+            break
+    return result
+
+
+def compact_extraction_product(product: dict) -> dict:
+    """성분 추출 입력 한 건 압축 (asin/title 유지, 나머지 필드 축약)."""
+    compacted = dict(product)
+    compacted["title"] = truncate_text(product.get("title") or "", TITLE_MAX_CHARS)
+    compacted["ingredients_raw"] = compact_inci(product.get("ingredients_raw") or "")
+    compacted["features"] = dedupe_features(product.get("features") or [])
+    details = product.get("additional_details") or {}
+    if isinstance(details, dict):
+        compacted["additional_details"] = {
+            k: truncate_text(v, DETAIL_VALUE_MAX_CHARS) if isinstance(v, str) else v
+            for k, v in details.items()
+            if v not in (None, "", [], {})
+        }
+    return compacted
+
+
+_savings_lock = threading.Lock()
+# label -> [requests, before_chars, after_chars]
+_savings: dict[str, list[int]] = {}
+
+
+def record_savings(label: str, before_chars: int, after_chars: int) -> None:
+    """압축 전/후 크기 누적 + 요청 단위 로그."""
+    with _savings_lock:
+        entry = _savings.setdefault(label, [0, 0, 0])
+        entry[0] += 1
+        entry[1] += before_chars
+        entry[2] += after_chars
+    if before_chars:
+        logger.info(
+            "Prompt compaction (%s): ~%d → ~%d tokens (-%.0f%%)",
+            label, before_chars // CHARS_PER_TOKEN, after_chars // CHARS_PER_TOKEN,
+            (1 - after_chars / before_chars) * 100,
+        )
+
+
+def compaction_stats() -> dict[str, dict]:
+    """label별 누적 절감량 (추정 토큰)."""
+    with _savings_lock:
+        return {
+            label: {
+                "requests": n,
+                "tokens_before": before // CHARS_PER_TOKEN,
+                "tokens_after": after // CHARS_PER_TOKEN,
+                "tokens_saved": (before - after) // CHARS_PER_TOKEN,
+            }
+            for label, (n, before, after) in _savings.items()
+        }
@@ -55,6 +55,17 @@ class Settings(BaseSettings):
     MART_PASSWORD: str
     MART_DATABASE: str
 
+    # MySQL Connection Pool
+    MYSQL_POOL_ENABLED: bool = True
+    MYSQL_POOL_MIN_SIZE: int = 1
+    MYSQL_POOL_MAX_SIZE: int = 10
+    MYSQL_POOL_IDLE_TIMEOUT: int = 300  # seconds
+    MYSQL_POOL_ACQUIRE_TIMEOUT: int = 30  # seconds
+    MYSQL_WRITE_BATCH_SIZE: int = 5000  # rows per executemany call
+    MYSQL_MAX_STMT_BYTES: int = 16 * 1024 * 1024  # multi-row INSERT 문 최대 크기
+    MYSQL_LOCAL_INFILE: bool = False  # local_infile=True로 연 bulk 적재 전용 커넥션에서만 LOAD DATA LOCAL INFILE 허용
+    MYSQL_SLOW_QUERY_MS: int = 1000  # 이 시간 이상 걸린 쿼리는 파라미터화된 SQL로 WARNING 로그
+
     # Google
     GOOGLE_KEY_PATH: str = "/google_keys/google_boosters_finance_key.json"
 
@@ -70,6 +81,29 @@ class Settings(BaseSettings):
     AMZ_SEARCH_ROBOT_ID: str = ""
     AMZ_DETAIL_ROBOT_ID: str = ""
     AMZ_ADMIN_SLACK_ID: str = ""
+    # Gemini 프로세스 공용 limiter (모델별 동시 요청 수 / 분당 요청·토큰 쿼터)
+    AMZ_GEMINI_MAX_IN_FLIGHT: int = 8
+    AMZ_GEMINI_FLASH_RPM: int = 1000
+    AMZ_GEMINI_FLASH_TPM: int = 1_000_000
+    AMZ_GEMINI_PRO_RPM: int = 150
+    AMZ_GEMINI_PRO_TPM: int = 2_000_000
+    # Gemini 재시도 (지수 backoff + full jitter, Retry-After 우선)
+    AMZ_GEMINI_RETRY_MAX_ATTEMPTS: int = 2  # 최초 호출 포함
+    AMZ_GEMINI_RETRY_BASE_SEC: float = 1.0
+    AMZ_GEMINI_RETRY_MAX_SEC: float = 30.0
+    # 성분 추출 hedged request: 최근 지연 p95가 지나도 응답이 없으면 같은 요청을 한 번 더 발행
+    AMZ_GEMINI_HEDGE_ENABLED: bool = True
+    AMZ_GEMINI_HEDGE_PERCENTILE: float = 0.95
+    AMZ_GEMINI_HEDGE_MIN_SAMPLES: int = 20  # 표본이 이보다 적으면 hedge 안 함
+    AMZ_GEMINI_HEDGE_MIN_SEC: float = 10.0
+    # 성분 추출 요청 간 micro-batching: window 동안 동시 요청의 입력을 모아 배치로 발행
+    AMZ_GEMINI_EXTRACT_AGGREGATE_ENABLED: bool = True
+    # 다른 요청이 추출을 기다리는 중일 때만 적용되어 그만큼 첫 배치 발행이 늦어진다
+    # (혼자 들어온 요청은 기다리지 않고 바로 발행)
+    AMZ_GEMINI_EXTRACT_AGGREGATE_WINDOW_MS: int = 300
+    # 성분 추출/시장 리포트 고정 지시문을 cachedContents로 등록해 참조 (생성 실패 시 인라인)
+    AMZ_GEMINI_CONTEXT_CACHE_ENABLED: bool = True
+    AMZ_GEMINI_CONTEXT_CACHE_TTL_SEC: int = 3600
 
     # Bright Data
     BRIGHT_DATA_API_TOKEN: str = ""
@@ -79,6 +113,17 @@ class Settings(BaseSettings):
     # Keyword Search
     AMZ_KEYWORD_CACHE_DAYS: int = 7
 
+    # AmzCacheService in-process L1 (MySQL 캐시 테이블 앞단)
+    AMZ_L1_CACHE_ENABLED: bool = True
+    AMZ_L1_CACHE_MAX_MB: int = 64
+    AMZ_L1_CACHE_TTL_SEC: int = 600
+    # 실패 ASIN 스킵 판단을 프로세스 내 사본(last_failed_at 증분 갱신)으로 수행
+    AMZ_FAILED_ASIN_SKIP_SET: bool = False
+    # 과거 추출 결과로 학습한 로컬 성분 사전 (INCI 전체가 해석되는 제품은 Gemini 생략)
+    AMZ_INGREDIENT_NORMALIZER_ENABLED: bool = True
+    AMZ_INGREDIENT_NORMALIZER_MIN_SUPPORT: int = 5  # INCI 표기별 최소 관측 제품 수
+    AMZ_INGREDIENT_NORMALIZER_REFRESH_SEC: int = 3600
+
     # Report Serving
     REPORT_DIR: str = "data/reports"
     REPORT_TTL_DAYS: int = 30
@@ -94,10 +94,10 @@ def upload_financial_db(payload):
         "Comments": "fn_fs_comments",
     }
 
-    with MysqlConnector("CFO") as conn:
+    with MysqlConnector("CFO", local_infile=True) as conn:
         for sheet_key, table in table_map.items():
             if sheet_key in df_list:
-                conn.upsert_data(df_list[sheet_key], table)
+                conn.upsert_data(df_list[sheet_key], table, bulk=True)
                 logger.debug(f"Upserted {sheet_key} -> {table}")
 
     logger.info("Finished uploading financial data to DB")
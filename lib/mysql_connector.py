@@ -1,27 +1,105 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-import math
+from datetime import date, datetime
+from typing import Any, TypeVar
 
 import pandas as pd
 import pymysql
 
 from app.config import settings
+from lib import query_stats
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+# max_allowed_packet 대비 여유분 (패킷 헤더, ON DUPLICATE KEY UPDATE 절 등)
+_PACKET_HEADROOM = 64 * 1024
+# 환경별 max_allowed_packet 캐시 (서버 설정은 프로세스 수명 동안 고정으로 간주)
+_max_packet_cache: dict[str, int] = {}
+
+
+def _frame_to_rows(df: pd.DataFrame, columns: list[str]) -> list[tuple]:
+    """DataFrame → executemany 파라미터 튜플 목록.
 
-def _safe_val(v):
-    """NaN/NaT → None 변환. pymysql은 NaN을 처리하지 못함."""
+    컬럼 단위로 object 배열을 만들어 NaN/NaT → None을 한 번에 치환한다.
+    pymysql은 NaN을 처리하지 못하고, object 변환으로 numpy 스칼라도 Python 타입이 된다.
+    """
+    arrays = []
+    for c in columns:
+        arr = df[c].to_numpy(dtype=object, copy=True)
+        mask = pd.isna(arr)
+        if mask.any():
+            arr[mask] = None
+        arrays.append(arr)
+    return list(zip(*arrays))
+
+
+# LOAD DATA LOCAL INFILE 비허용 시 서버/클라이언트 에러 코드
+# 1148: ER_NOT_ALLOWED_COMMAND, 2068: CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+# 3948/3950: local_infile 비활성 (MySQL 8.0.19+)
+_LOCAL_INFILE_REJECTED = frozenset({1148, 2068, 3948, 3950})
+# LOAD DATA를 거부한 환경 (이후 호출은 바로 executemany 사용)
+_local_infile_unsupported: set[str] = set()
+
+
+def _tsv_field(v) -> str:
+    """LOAD DATA 기본 포맷(탭 구분, 백슬래시 escape, \\N = NULL)으로 값 직렬화."""
     if v is None:
-        return None
-    if isinstance(v, float) and math.isnan(v):
-        return None
-    if isinstance(v, pd.Timestamp) and pd.isna(v):
-        return None
-    return v
+        return "\\N"
+    if isinstance(v, bool):
+        return "1" if v else "0"
+    if isinstance(v, datetime):
+        return v.isoformat(sep=" ")
+    if isinstance(v, date):
+        return v.isoformat()
+    if isinstance(v, bytes):
+        v = v.decode("utf-8")
+    return (
+        str(v)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# 기존 row hash 조회 시 IN 목록 1회당 키 수
+_HASH_LOOKUP_CHUNK = 1000
+
+
+def _row_hash(values: tuple) -> str:
+    """변경 감지용 row hash (md5 hex). 정수값 float는 int와 같은 값으로 취급."""
+    parts = []
+    for v in values:
+        if isinstance(v, float) and v.is_integer():
+            v = int(v)
+        parts.append(_tsv_field(v))
+    return hashlib.md5("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _write_tsv(values: list[tuple]) -> str:
+    """행 목록을 임시 TSV 파일로 스트리밍하고 경로 반환 (호출자가 삭제)."""
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".tsv", encoding="utf-8", newline="", delete=False,
+    ) as f:
+        f.writelines("\t".join(map(_tsv_field, row)) + "\n" for row in values)
+        return f.name
 
 
 @dataclass(frozen=True)
@@ -33,6 +111,7 @@ class DBConfig:
     user: str
     password: str
     database: str
+    environment: str = ""  # 쿼리 통계/slow query 로그 라벨
 
     @classmethod
     def from_env(cls, environment: str) -> DBConfig:
@@ -46,9 +125,252 @@ class DBConfig:
                 f"Required: {', '.join(f'{prefix}{f}' for f in fields)}"
             ) from e
         values["port"] = int(values["port"])
+        values["environment"] = environment.upper()
         return cls(**values)
 
 
+class _InstrumentedCursorMixin:
+    """execute/executemany/fetch 소요 시간을 query_stats에 기록하는 커서 mixin.
+
+    executemany 내부의 multi-row execute는 개별 기록하지 않고 원본 쿼리로 한 번만 기록한다.
+    """
+
+    _in_executemany = False
+    _last_query = ""
+
+    @property
+    def _stats_environment(self) -> str:
+        return getattr(self.connection, "stats_environment", "")
+
+    def execute(self, query, args=None):
+        if self._in_executemany:
+            return super().execute(query, args)
+        self._last_query = query
+        started = time.perf_counter()
+        try:
+            return super().execute(query, args)
+        finally:
+            query_stats.record_query(
+                self._stats_environment, "execute", query, self.rowcount,
+                (time.perf_counter() - started) * 1000,
+            )
+
+    def executemany(self, query, args):
+        self._last_query = query
+        self._in_executemany = True
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, args)
+        finally:
+            self._in_executemany = False
+            query_stats.record_query(
+                self._stats_environment, "executemany", query, len(args) if args else 0,
+                (time.perf_counter() - started) * 1000,
+            )
+
+    def _timed_fetch(self, fetch, *args):
+        started = time.perf_counter()
+        rows = fetch(*args)
+        query_stats.record_query(
+            self._stats_environment, "fetch", self._last_query,
+            len(rows) if rows is not None else 0,
+            (time.perf_counter() - started) * 1000,
+        )
+        return rows
+
+
+class InstrumentedCursor(_InstrumentedCursorMixin, pymysql.cursors.Cursor):
+    """기본 커서. 결과가 execute 시점에 버퍼링되므로 fetch는 계측하지 않는다."""
+
+
+class InstrumentedSSCursor(_InstrumentedCursorMixin, pymysql.cursors.SSCursor):
+    """서버 사이드 커서. fetch마다 네트워크 왕복이 있으므로 fetch도 계측한다."""
+
+    def fetchmany(self, size=None):
+        return self._timed_fetch(super().fetchmany, size)
+
+    def fetchall(self):
+        return self._timed_fetch(super().fetchall)
+
+
+def _connect(config: DBConfig, local_infile: bool = False) -> pymysql.connections.Connection:
+    """pymysql 커넥션 생성. local_infile은 bulk 적재용 전용 커넥션에서만 켠다
+    (켜진 커넥션에서는 서버가 임의의 클라이언트 파일을 요청할 수 있음)."""
+    started = time.perf_counter()
+    conn = pymysql.connect(
+        host=config.host,
+        user=config.user,
+        password=config.password,
+        database=config.database,
+        port=config.port,
+        charset="utf8mb4",
+        autocommit=False,
+        local_infile=local_infile,
+        cursorclass=InstrumentedCursor,
+    )
+    query_stats.record_connect(config.environment, (time.perf_counter() - started) * 1000)
+    conn.stats_environment = config.environment
+    return conn
+
+
+class ConnectionPool:
+    """Thread-safe pymysql connection pool for a single environment.
+
+    - min_size: 유휴 상태로도 유지할 최소 커넥션 수 (idle_timeout 정리 대상 제외)
+    - max_size: 동시에 빌려줄 수 있는 최대 커넥션 수. 초과 시 acquire_timeout까지 대기
+    - borrow 시 ping으로 health check, 죽은 커넥션은 폐기 후 재생성
+    - return 시 rollback으로 미커밋 트랜잭션 정리 (non-pooled close와 동일한 의미)
+    """
+
+    def __init__(
+        self,
+        config: DBConfig,
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_timeout: float = 300.0,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        self._config = config
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque[tuple[pymysql.connections.Connection, float]] = deque()
+        self._size = 0  # idle + 대여 중인 커넥션 수
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def acquire(self) -> pymysql.connections.Connection:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            conn = None
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                self._prune_idle()
+                if self._idle:
+                    conn, _ = self._idle.pop()  # LIFO: 가장 최근 사용 커넥션 우선
+                elif self._size < self.max_size:
+                    self._size += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for MySQL connection "
+                            f"(pool max_size={self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+            if conn is None:
+                try:
+                    return _connect(self._config)
+                except Exception:
+                    self._discard_slot()
+                    raise
+
+            try:
+                conn.ping(reconnect=False)
+                return conn
+            except Exception:
+                logger.info("Discarding stale pooled MySQL connection")
+                self._close_quietly(conn)
+                self._discard_slot()
+
+    def release(self, conn: pymysql.connections.Connection) -> None:
+        try:
+            conn.rollback()
+        except Exception:
+            self._close_quietly(conn)
+            self._discard_slot()
+            return
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._size -= 1
+                self._close_quietly(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def _prune_idle(self) -> None:
+        """idle_timeout을 넘긴 유휴 커넥션 정리 (min_size까지는 유지). lock 보유 상태에서 호출."""
+        cutoff = time.monotonic() - self.idle_timeout
+        # deque 앞쪽이 가장 오래 쉰 커넥션
+        while self._idle and self._size > self.min_size and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            self._close_quietly(conn)
+
+    def _discard_slot(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(conn: pymysql.connections.Connection) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(environment: str) -> ConnectionPool:
+    """환경(CFO/BOOSTA/...)별 프로세스 공유 커넥션 풀."""
+    key = environment.upper()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                DBConfig.from_env(environment),
+                min_size=settings.MYSQL_POOL_MIN_SIZE,
+                max_size=settings.MYSQL_POOL_MAX_SIZE,
+                idle_timeout=settings.MYSQL_POOL_IDLE_TIMEOUT,
+                acquire_timeout=settings.MYSQL_POOL_ACQUIRE_TIMEOUT,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    global _db_executor
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+    with _db_executor_lock:
+        if _db_executor is not None:
+            _db_executor.shutdown(wait=False)
+            _db_executor = None
+
+
+def _rows_per_sec(rows: int, started: float) -> float:
+    elapsed = time.perf_counter() - started
+    return rows / elapsed if elapsed > 0 else float(rows)
+
+
 class MysqlConnector:
     """MySQL connector with context manager, upsert, and delete+insert support.
 
@@ -57,33 +379,50 @@ class MysqlConnector:
             df = conn.read_query_table("SELECT * FROM my_table")
             conn.upsert_data(df, "my_table")
             conn.delete_and_insert(df, "my_table", where="date = %s", where_params=("2024-01-01",))
+
+    settings.MYSQL_POOL_ENABLED이면 환경별 커넥션 풀에서 커넥션을 빌리고,
+    close() 시 rollback 후 풀에 반환한다. pooled=False로 개별 커넥션 강제 가능.
+
+    local_infile=True(bulk=True 적재용)이고 settings.MYSQL_LOCAL_INFILE이 켜져 있으면
+    LOAD DATA LOCAL INFILE을 허용한 전용 커넥션을 풀 밖에서 연다. 그 외 커넥션은
+    local infile을 허용하지 않으며 bulk=True는 executemany로 적재된다.
     """
 
-    def __init__(self, environment: str) -> None:
-        self._config = DBConfig.from_env(environment)
+    def __init__(self, environment: str, pooled: bool | None = None, local_infile: bool = False) -> None:
         self._environment = environment
-        self.connection = pymysql.connect(
-            host=self._config.host,
-            user=self._config.user,
-            password=self._config.password,
-            database=self._config.database,
-            port=self._config.port,
-            charset="utf8mb4",
-            autocommit=False,
-        )
+        self._local_infile = local_infile and settings.MYSQL_LOCAL_INFILE
+        if pooled is None:
+            pooled = settings.MYSQL_POOL_ENABLED
+        if self._local_infile:
+            self._pool = None
+            self._config = DBConfig.from_env(environment)
+            self.connection = _connect(self._config, local_infile=True)
+        elif pooled:
+            self._pool = get_pool(environment)
+            self._config = self._pool._config
+            self.connection = self._pool.acquire()
+        else:
+            self._pool = None
+            self._config = DBConfig.from_env(environment)
+            self.connection = _connect(self._config)
         self.cursor = self.connection.cursor()
+        self._stream_cursor = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            self.connection.rollback()
-            logger.warning(
-                "Transaction rolled back on %s: %s: %s",
-                self._environment, exc_type.__name__, exc_val,
-            )
-        self.close()
+        try:
+            if exc_type is not None and self.connection:
+                self.connection.rollback()
+                logger.warning(
+                    "Transaction rolled back on %s: %s: %s",
+                    self._environment, exc_type.__name__, exc_val,
+                )
+        except Exception:
+            logger.warning("Rollback failed on %s", self._environment, exc_info=True)
+        finally:
+            self.close()
 
     def read_query_table(self, query: str, params: tuple | None = None) -> pd.DataFrame:
         """Execute a SELECT query and return results as DataFrame.
@@ -97,44 +436,182 @@ class MysqlConnector:
         rows = self.cursor.fetchall()
         return pd.DataFrame(rows, columns=columns)
 
+    def read_query_stream(
+        self,
+        query: str,
+        params: tuple | None = None,
+        chunk_size: int = 5000,
+        as_dicts: bool = False,
+    ) -> Iterator[pd.DataFrame] | Iterator[dict]:
+        """Execute a SELECT query with an unbuffered server-side cursor.
+
+        결과 전체를 메모리에 올리지 않고 chunk_size 행씩 가져와
+        DataFrame 청크(기본) 또는 행 dict(as_dicts=True)를 yield한다.
+        제너레이터를 끝까지 소비하거나 close()하기 전까지 같은 커넥션으로 다른 쿼리를 실행할 수 없다.
+
+        Args:
+            query: SQL query string. Use %s placeholders for parameters.
+            params: Optional tuple of parameter values for safe interpolation.
+            chunk_size: Rows fetched per round trip.
+            as_dicts: Yield one dict per row instead of DataFrame chunks.
+        """
+        cursor = self.connection.cursor(InstrumentedSSCursor)
+        self._stream_cursor = cursor
+        try:
+            cursor.execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if as_dicts:
+                    for row in rows:
+                        yield dict(zip(columns, row))
+                else:
+                    yield pd.DataFrame(rows, columns=columns)
+        finally:
+            self._stream_cursor = None
+            cursor.close()
+
     def upsert_data(
         self,
         df: pd.DataFrame,
         table_name: str,
         exclude_columns: tuple[str, ...] = ("id", "created_at", "updated_at"),
+        batch_size: int | None = None,
+        bulk: bool = False,
+        key_columns: tuple[str, ...] = (),
+        hash_column: str | None = None,
+        hash_exclude: tuple[str, ...] = (),
+        update_overrides: dict[str, str] | None = None,
     ) -> str:
         """INSERT ... ON DUPLICATE KEY UPDATE (MySQL 8.0+ compatible).
 
         Uses VALUES() syntax which is universally supported across MySQL 8.0.x.
         The AS alias syntax (MySQL 8.0.20+) is avoided for cross-server compatibility.
+
+        Args:
+            batch_size: executemany 1회당 행 수 (기본 settings.MYSQL_WRITE_BATCH_SIZE).
+                각 배치는 max_allowed_packet 이내의 multi-row VALUES 문으로 전송된다.
+            bulk: True면 LOAD DATA LOCAL INFILE로 임시 staging 테이블에 적재 후
+                INSERT ... SELECT로 병합. local_infile=True로 연 커넥션에서만 동작하며,
+                그 외이거나 서버가 local infile을 거부하면 executemany로 대체.
+            key_columns: hash_column 사용 시 행 식별 키 (보통 PK/unique key).
+            hash_column: 지정하면 변경 감지 모드. 키/hash_exclude를 제외한 컬럼의 hash를
+                이 컬럼에 함께 저장하고, 기존 hash와 같은 행은 쓰지 않는다.
+            hash_exclude: hash 계산에서 뺄 컬럼 (수집 시각처럼 매번 바뀌는 값).
+            update_overrides: 중복 키일 때 VALUES() 대신 쓸 컬럼별 SQL 식
+                (예: {"retry_count": "`retry_count` + 1"}). 신규 행에는 df 값이 들어간다.
         """
         if df.empty:
             return f"No data to upsert into {table_name}"
 
+        unchanged = 0
+        if hash_column:
+            if not key_columns:
+                raise ValueError("hash_column requires key_columns")
+            df, unchanged = self._drop_unchanged_rows(
+                df, table_name, key_columns, hash_column,
+                exclude=(*exclude_columns, *hash_exclude),
+            )
+            if df.empty:
+                logger.info("upsert on %s: all %d rows unchanged", table_name, unchanged)
+                return f"0 records upserted into {table_name} (changed 0, unchanged {unchanged})"
+
         columns = [c for c in df.columns if c not in exclude_columns]
         placeholders = ", ".join(["%s"] * len(columns))
         col_list = ", ".join(f"`{c}`" for c in columns)
-        update_set = ", ".join(f"`{c}` = VALUES(`{c}`)" for c in columns)
+        overrides = update_overrides or {}
+        update_set = ", ".join(
+            f"`{c}` = {overrides.get(c, f'VALUES(`{c}`)')}" for c in columns
+        )
 
         query = (
             f"INSERT INTO `{table_name}` ({col_list}) VALUES ({placeholders}) "
             f"ON DUPLICATE KEY UPDATE {update_set}"
         )
-        values = [
-            tuple(_safe_val(row[c]) for c in columns)
-            for _, row in df.iterrows()
-        ]
-        self.cursor.executemany(query, values)
+        started = time.perf_counter()
+        values = _frame_to_rows(df, columns)
+        staging = self._load_staging(table_name, columns, values) if bulk else None
+        if staging:
+            self.cursor.execute(
+                f"INSERT INTO `{table_name}` ({col_list}) "
+                f"SELECT {col_list} FROM `{staging}` "
+                f"ON DUPLICATE KEY UPDATE {update_set}"
+            )
+            self._drop_staging(staging)
+        else:
+            self._write_rows(query, values, batch_size)
         self.connection.commit()
-        return f"{len(df)} records upserted into {table_name}"
+        rate = _rows_per_sec(len(values), started)
+        if hash_column:
+            logger.info(
+                "upsert on %s: changed %d, unchanged %d (%.0f rows/s)",
+                table_name, len(values), unchanged, rate,
+            )
+            return (
+                f"{len(values)} records upserted into {table_name} "
+                f"(changed {len(values)}, unchanged {unchanged}, {rate:,.0f} rows/s)"
+            )
+        return f"{len(values)} records upserted into {table_name} ({rate:,.0f} rows/s)"
+
+    def _drop_unchanged_rows(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        key_columns: tuple[str, ...],
+        hash_column: str,
+        exclude: tuple[str, ...],
+    ) -> tuple[pd.DataFrame, int]:
+        """row hash를 계산해 hash_column에 채우고, 저장된 hash와 같은 행을 제외.
+
+        Returns:
+            (쓸 행만 남긴 DataFrame, 건너뛴 행 수)
+        """
+        keys = list(key_columns)
+        hashed = [c for c in df.columns if c not in (*keys, *exclude, hash_column)]
+        hashes = [_row_hash(row) for row in _frame_to_rows(df, hashed)]
+        row_keys = _frame_to_rows(df, keys)
+
+        existing = self._fetch_row_hashes(table_name, keys, hash_column, row_keys)
+        changed = [existing.get(k) != h for k, h in zip(row_keys, hashes)]
+        df = df.assign(**{hash_column: hashes})[changed]
+        return df, len(changed) - int(sum(changed))
+
+    def _fetch_row_hashes(
+        self,
+        table_name: str,
+        keys: list[str],
+        hash_column: str,
+        row_keys: list[tuple],
+    ) -> dict[tuple, str]:
+        """키 집합에 대해 저장된 row hash 조회 (IN 목록 청크 단위)."""
+        key_list = ", ".join(f"`{k}`" for k in keys)
+        key_expr = f"({key_list})" if len(keys) > 1 else key_list
+        tuple_ph = "(" + ", ".join(["%s"] * len(keys)) + ")" if len(keys) > 1 else "%s"
+        unique_keys = list(dict.fromkeys(row_keys))
+        existing: dict[tuple, str] = {}
+        for i in range(0, len(unique_keys), _HASH_LOOKUP_CHUNK):
+            chunk = unique_keys[i:i + _HASH_LOOKUP_CHUNK]
+            self.cursor.execute(
+                f"SELECT {key_list}, `{hash_column}` FROM `{table_name}` "
+                f"WHERE {key_expr} IN ({', '.join([tuple_ph] * len(chunk))})",
+                tuple(v for key in chunk for v in key),
+            )
+            for row in self.cursor.fetchall():
+                existing[tuple(row[:-1])] = row[-1]
+        return existing
 
     def delete_and_insert(
         self,
         df: pd.DataFrame,
         table_name: str,
-        where: str,
+        where: str | None = None,
         where_params: tuple | None = None,
         exclude_columns: tuple[str, ...] = ("id", "created_at", "updated_at"),
+        batch_size: int | None = None,
+        bulk: bool = False,
+        swap: bool = False,
     ) -> str:
         """Delete matching rows then insert in a single transaction.
 
@@ -144,9 +621,20 @@ class MysqlConnector:
             df: Data to insert after deletion.
             table_name: Target table.
             where: WHERE clause with %s placeholders (e.g. "date = %s AND brand = %s").
+                None is only allowed with swap=True (full-table refresh).
             where_params: Parameter values for the WHERE clause.
             exclude_columns: Columns to skip during insert.
+            batch_size: Rows per executemany call (default settings.MYSQL_WRITE_BATCH_SIZE).
+            bulk: Load via LOAD DATA LOCAL INFILE into a staging table before the delete,
+                then merge with INSERT ... SELECT. Requires a connector opened with
+                local_infile=True; otherwise, or if rejected, falls back to executemany.
+            swap: 라이브 테이블에는 교체 직전까지 손대지 않는다.
+                where 지정 시 staging 적재를 모두 끝낸 뒤 DELETE + INSERT ... SELECT만 짧은 트랜잭션으로,
+                where=None이면 shadow 테이블을 채운 뒤 RENAME TABLE로 원자적으로 교체한다.
+                이때 DDL의 암묵적 커밋으로 이 연결의 미커밋 변경도 함께 커밋된다.
         """
+        if where is None and not swap:
+            raise ValueError("delete_and_insert requires where unless swap=True")
         if df.empty:
             return f"No data to insert into {table_name}"
 
@@ -154,21 +642,180 @@ class MysqlConnector:
         placeholders = ", ".join(["%s"] * len(columns))
         col_list = ", ".join(f"`{c}`" for c in columns)
 
-        delete_query = f"DELETE FROM `{table_name}` WHERE {where}"
-        insert_query = f"INSERT INTO `{table_name}` ({col_list}) VALUES ({placeholders})"
-
-        values = [
-            tuple(_safe_val(row[c]) for c in columns)
-            for _, row in df.iterrows()
-        ]
-
-        self.cursor.execute(delete_query, where_params)
+        started = time.perf_counter()
+        values = _frame_to_rows(df, columns)
+        if swap and where is None:
+            return self._swap_table(table_name, columns, values, batch_size, bulk, started)
+
+        if swap:
+            # staging을 반드시 먼저 채워, 대상 테이블 락은 서버 내부 복사 동안만 잡힘
+            staging = self._create_staging(table_name)
+            if not (bulk and self._load_infile(staging, columns, values)):
+                self._write_rows(
+                    f"INSERT INTO `{staging}` ({col_list}) VALUES ({placeholders})",
+                    values, batch_size,
+                )
+        else:
+            # staging 적재를 DELETE 앞에 두어 대상 테이블 락 보유 시간을 줄임
+            staging = self._load_staging(table_name, columns, values) if bulk else None
+
+        self.cursor.execute(f"DELETE FROM `{table_name}` WHERE {where}", where_params)
         deleted = self.cursor.rowcount
-        self.cursor.executemany(insert_query, values)
+        if staging:
+            self.cursor.execute(
+                f"INSERT INTO `{table_name}` ({col_list}) SELECT {col_list} FROM `{staging}`"
+            )
+            self._drop_staging(staging)
+        else:
+            self._write_rows(
+                f"INSERT INTO `{table_name}` ({col_list}) VALUES ({placeholders})",
+                values, batch_size,
+            )
         self.connection.commit()
 
-        logger.info("delete_and_insert on %s: deleted %d, inserted %d", table_name, deleted, len(values))
-        return f"Deleted {deleted}, inserted {len(values)} rows in {table_name}"
+        rate = _rows_per_sec(len(values), started)
+        logger.info(
+            "delete_and_insert on %s: deleted %d, inserted %d (%.0f rows/s)",
+            table_name, deleted, len(values), rate,
+        )
+        return f"Deleted {deleted}, inserted {len(values)} rows in {table_name} ({rate:,.0f} rows/s)"
+
+    def _swap_table(
+        self,
+        table_name: str,
+        columns: list[str],
+        values: list[tuple],
+        batch_size: int | None,
+        bulk: bool,
+        started: float,
+    ) -> str:
+        """전체 테이블 교체: shadow 테이블 적재 → RENAME TABLE 원자 교체 → 구 테이블 DROP.
+
+        CREATE/RENAME/DROP은 DDL이라 암묵적 커밋이 일어난다. 이 연결에서 호출 전에
+        커밋하지 않은 변경도 함께 커밋되고, 교체 후에는 rollback으로 되돌릴 수 없다.
+        읽기 쪽은 RENAME 순간의 metadata lock만 기다리며, 적재 도중에는 기존 테이블을
+        그대로 읽는다. CREATE TABLE ... LIKE는 인덱스는 복사하지만 foreign key/trigger는
+        복사하지 않는다.
+
+        shadow/구 테이블 이름에는 호출마다 고유한 suffix를 붙여, 같은 테이블을 동시에
+        교체해도 서로의 shadow를 지우거나 덮어쓰지 않는다 (마지막 RENAME이 최종본).
+        """
+        # MySQL 식별자 최대 64자: "__new_" + suffix 8자 = 14자
+        suffix = uuid.uuid4().hex[:8]
+        shadow = f"{table_name[:50]}__new_{suffix}"
+        old = f"{table_name[:50]}__old_{suffix}"
+        col_list = ", ".join(f"`{c}`" for c in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+
+        self.cursor.execute(f"DROP TABLE IF EXISTS `{shadow}`")
+        self.cursor.execute(f"CREATE TABLE `{shadow}` LIKE `{table_name}`")
+        try:
+            if not (bulk and self._load_infile(shadow, columns, values)):
+                self._write_rows(
+                    f"INSERT INTO `{shadow}` ({col_list}) VALUES ({placeholders})",
+                    values, batch_size,
+                )
+            self.connection.commit()
+            self.cursor.execute(
+                f"RENAME TABLE `{table_name}` TO `{old}`, `{shadow}` TO `{table_name}`"
+            )
+        except Exception:
+            self.connection.rollback()
+            self.cursor.execute(f"DROP TABLE IF EXISTS `{shadow}`")
+            raise
+        self.cursor.execute(f"DROP TABLE IF EXISTS `{old}`")
+
+        rate = _rows_per_sec(len(values), started)
+        logger.info(
+            "delete_and_insert on %s: swapped in %d rows (%.0f rows/s)",
+            table_name, len(values), rate,
+        )
+        return f"Swapped {len(values)} rows into {table_name} ({rate:,.0f} rows/s)"
+
+    def _create_staging(self, table_name: str) -> str:
+        """대상 테이블과 같은 구조의 TEMPORARY staging 테이블 생성.
+
+        TEMPORARY TABLE 생성/삭제는 암묵적 커밋을 일으키지 않으므로 호출자의 트랜잭션이 유지된다.
+        """
+        staging = f"_stg_{table_name}"
+        self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{staging}`")
+        self.cursor.execute(f"CREATE TEMPORARY TABLE `{staging}` LIKE `{table_name}`")
+        return staging
+
+    def _load_staging(self, table_name: str, columns: list[str], values: list[tuple]) -> str | None:
+        """LOAD DATA LOCAL INFILE로 임시 staging 테이블 적재. 비허용 서버면 None."""
+        if not self._local_infile_allowed():
+            return None
+        staging = self._create_staging(table_name)
+        if self._load_infile(staging, columns, values):
+            return staging
+        self._drop_staging(staging)
+        return None
+
+    def _local_infile_allowed(self) -> bool:
+        return self._local_infile and self._environment.upper() not in _local_infile_unsupported
+
+    def _load_infile(self, target: str, columns: list[str], values: list[tuple]) -> bool:
+        """target 테이블에 LOAD DATA LOCAL INFILE 적재. 서버가 거부하면 False.
+
+        REPLACE: 같은 unique key 행이 여러 번 나오면 마지막 행이 남는다
+        (executemany upsert 경로와 같은 last-wins. LOCAL 기본값 IGNORE는 첫 행을 남김).
+        """
+        if not self._local_infile_allowed():
+            return False
+        col_list = ", ".join(f"`{c}`" for c in columns)
+        path = _write_tsv(values)
+        try:
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE `{target}` "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' ({col_list})",
+                (path,),
+            )
+            return True
+        except pymysql.err.MySQLError as e:
+            code = e.args[0] if e.args else None
+            if code not in _LOCAL_INFILE_REJECTED:
+                raise
+            logger.warning(
+                "LOAD DATA LOCAL INFILE rejected on %s (%s), falling back to executemany",
+                self._environment, e,
+            )
+            _local_infile_unsupported.add(self._environment.upper())
+            return False
+        finally:
+            os.unlink(path)
+
+    def _drop_staging(self, staging: str) -> None:
+        self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{staging}`")
+
+    def _write_rows(self, query: str, values: list[tuple], batch_size: int | None = None) -> None:
+        """executemany를 batch_size 행 단위로 나눠 실행.
+
+        pymysql은 INSERT ... VALUES 문을 multi-row VALUES로 재작성하며
+        cursor.max_stmt_length 바이트마다 문장을 끊는다. 이를 서버 max_allowed_packet에 맞춘다.
+        """
+        batch_size = batch_size or settings.MYSQL_WRITE_BATCH_SIZE
+        self.cursor.max_stmt_length = self._max_stmt_length()
+        for start in range(0, len(values), batch_size):
+            self.cursor.executemany(query, values[start:start + batch_size])
+
+    def _max_stmt_length(self) -> int:
+        key = self._environment.upper()
+        packet = _max_packet_cache.get(key)
+        if packet is None:
+            try:
+                self.cursor.execute("SELECT @@max_allowed_packet")
+                packet = int(self.cursor.fetchone()[0])
+            except Exception:
+                logger.debug("Could not read max_allowed_packet, using pymysql default", exc_info=True)
+                return pymysql.cursors.Cursor.max_stmt_length
+            _max_packet_cache[key] = packet
+        return max(
+            _PACKET_HEADROOM,
+            min(packet - _PACKET_HEADROOM, settings.MYSQL_MAX_STMT_BYTES),
+        )
 
     def get_column_max_length(self, table_name: str, column_name: str) -> int | None:
         """Get CHARACTER_MAXIMUM_LENGTH using parameterized query."""
@@ -185,10 +832,144 @@ class MysqlConnector:
         return None
 
     def close(self) -> None:
+        if self._stream_cursor:
+            # 소비되지 않은 스트리밍 결과를 정리해야 커넥션을 재사용할 수 있음
+            try:
+                self._stream_cursor.close()
+            except Exception:
+                logger.debug("Stream cursor close failed", exc_info=True)
+            self._stream_cursor = None
         if self.cursor:
-            self.cursor.close()
+            try:
+                self.cursor.close()
+            except Exception:
+                logger.debug("Cursor close failed", exc_info=True)
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            if self._pool is not None:
+                self._pool.release(self.connection)
+            else:
+                self.connection.close()
+            self.connection = None
 
     # Legacy alias
     connectClose = close
+
+
+# ── Async access layer ───────────────────────────────
+
+_db_executor: ThreadPoolExecutor | None = None
+_db_executor_lock = threading.Lock()
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    """DB 전용 스레드 풀. 크기는 커넥션 풀 max_size와 동일하게 맞춰 대기를 풀 앞단에서 흡수."""
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is None:
+            _db_executor = ThreadPoolExecutor(
+                max_workers=settings.MYSQL_POOL_MAX_SIZE,
+                thread_name_prefix="mysql",
+            )
+        return _db_executor
+
+
+async def run_in_db_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """동기 DB 호출을 DB 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+
+    contextvars를 복사해 전달하므로 요청 단위 컨텍스트가 스레드에서도 유지된다.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_db_executor(), call)
+
+
+class AsyncMysqlConnector:
+    """Async counterpart of MysqlConnector.
+
+    풀링된 pymysql 커넥션을 DB 스레드 풀에서 다루므로 호출 중에도 이벤트 루프가 블록되지 않는다.
+
+    Usage:
+        async with AsyncMysqlConnector("CFO") as conn:
+            df = await conn.read_query_table("SELECT * FROM my_table WHERE id = %s", (1,))
+            await conn.upsert_data(df, "my_table")
+    """
+
+    def __init__(self, environment: str, pooled: bool | None = None, local_infile: bool = False) -> None:
+        self._environment = environment
+        self._pooled = pooled
+        self._local_infile = local_infile
+        self._conn: MysqlConnector | None = None
+
+    async def __aenter__(self):
+        self._conn = await run_in_db_thread(
+            MysqlConnector, self._environment, self._pooled, self._local_infile,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            await run_in_db_thread(conn.__exit__, exc_type, exc_val, exc_tb)
+
+    @property
+    def sync(self) -> MysqlConnector:
+        if self._conn is None:
+            raise RuntimeError("AsyncMysqlConnector is not open")
+        return self._conn
+
+    async def read_query_table(self, query: str, params: tuple | None = None) -> pd.DataFrame:
+        return await run_in_db_thread(self.sync.read_query_table, query, params)
+
+    async def execute(self, query: str, params: tuple | None = None, commit: bool = True) -> int:
+        """단일 DML 실행 후 영향받은 행 수 반환."""
+        def _execute() -> int:
+            conn = self.sync
+            conn.cursor.execute(query, params)
+            if commit:
+                conn.connection.commit()
+            return conn.cursor.rowcount
+
+        return await run_in_db_thread(_execute)
+
+    async def upsert_data(self, df: pd.DataFrame, table_name: str, **kwargs: Any) -> str:
+        return await run_in_db_thread(self.sync.upsert_data, df, table_name, **kwargs)
+
+    async def delete_and_insert(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        where: str | None = None,
+        where_params: tuple | None = None,
+        exclude_columns: tuple[str, ...] = ("id", "created_at", "updated_at"),
+        batch_size: int | None = None,
+        bulk: bool = False,
+        swap: bool = False,
+    ) -> str:
+        """MysqlConnector.delete_and_insert를 DB 스레드에서 실행 (인자 동일)."""
+        return await run_in_db_thread(
+            self.sync.delete_and_insert, df, table_name, where, where_params,
+            exclude_columns=exclude_columns, batch_size=batch_size, bulk=bulk, swap=swap,
+        )
+
+
+class AsyncServiceProxy:
+    """동기 DB 서비스 메서드의 async 변형.
+
+    service.aio.method(...)는 service.method(...)를 DB 스레드 풀에서 실행하는 코루틴이다.
+    """
+
+    def __init__(self, service: object) -> None:
+        self._service = service
+
+    def __getattr__(self, name: str):
+        method = getattr(self._service, name)
+        if not callable(method):
+            raise AttributeError(f"{type(self._service).__name__}.{name} is not callable")
+
+        @functools.wraps(method)
+        async def _call(*args, **kwargs):
+            return await run_in_db_thread(method, *args, **kwargs)
+
+        return _call
@@ -0,0 +1,213 @@
+"""MySQL 쿼리 계측: fingerprint별 지연 히스토그램, slow query 로그, 요청 단위 통계.
+
+MysqlConnector의 커서가 execute/executemany/fetch마다 record_query()를 호출한다.
+기록은 프로세스 전역 통계와, track_queries()로 열린 요청 단위 통계에 동시에 누적된다.
+
+Usage:
+    with track_queries() as stats:
+        ...  # DB 호출
+    logger.info("Query stats:\n%s", stats.format_summary())
+"""
+from __future__ import annotations
+
+import bisect
+import contextvars
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 전부
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_WS_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|%\(\w+\)s")
+_TUPLE_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_TUPLE_LIST_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def fingerprint(sql: str) -> str:
+    """리터럴/placeholder/IN 목록/multi-row VALUES를 접어 쿼리 형태만 남긴다."""
+    fp = _WS_RE.sub(" ", sql).strip()
+    fp = _STRING_RE.sub("?", fp)
+    fp = _PLACEHOLDER_RE.sub("?", fp)
+    fp = _NUMBER_RE.sub("?", fp)
+    fp = _TUPLE_RE.sub("(...)", fp)
+    fp = _TUPLE_LIST_RE.sub("(...)", fp)
+    return fp[:300]
+
+
+@dataclass
+class Histogram:
+    """고정 버킷 지연 히스토그램 (ms)."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준 근사 백분위수 (ms)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class QueryEntry:
+    environment: str
+    op: str
+    fingerprint: str
+    rows: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+
+class QueryStats:
+    """(environment, op, fingerprint)별 쿼리 통계 + 환경별 connect 시간."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str, str], QueryEntry] = {}
+        self._connects: dict[str, Histogram] = {}
+
+    def record(self, environment: str, op: str, fp: str, rows: int, ms: float) -> None:
+        key = (environment, op, fp)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = QueryEntry(environment, op, fp)
+            entry.rows += max(rows, 0)
+            entry.latency.observe(ms)
+
+    def record_connect(self, environment: str, ms: float) -> None:
+        with self._lock:
+            self._connects.setdefault(environment, Histogram()).observe(ms)
+
+    def entries(self) -> list[QueryEntry]:
+        """총 소요 시간 내림차순."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return sorted(entries, key=lambda e: e.latency.total_ms, reverse=True)
+
+    @property
+    def total_queries(self) -> int:
+        with self._lock:
+            return sum(e.latency.count for e in self._entries.values())
+
+    @property
+    def total_ms(self) -> float:
+        with self._lock:
+            return sum(e.latency.total_ms for e in self._entries.values())
+
+    def snapshot(self) -> dict:
+        """JSON 직렬화 가능한 통계 (대시보드/로그용)."""
+        with self._lock:
+            connects = {
+                env: {"count": h.count, "avg_ms": round(h.avg_ms, 1), "max_ms": round(h.max_ms, 1)}
+                for env, h in self._connects.items()
+            }
+        return {
+            "queries": [
+                {
+                    "environment": e.environment,
+                    "op": e.op,
+                    "fingerprint": e.fingerprint,
+                    "count": e.latency.count,
+                    "rows": e.rows,
+                    "total_ms": round(e.latency.total_ms, 1),
+                    "avg_ms": round(e.latency.avg_ms, 1),
+                    "p95_ms": e.latency.percentile(0.95),
+                    "max_ms": round(e.latency.max_ms, 1),
+                    "buckets": list(e.latency.buckets),
+                }
+                for e in self.entries()
+            ],
+            "connects": connects,
+        }
+
+    def format_summary(self, top: int = 10) -> str:
+        entries = self.entries()
+        lines = [f"{self.total_queries} queries, {self.total_ms:.0f} ms total"]
+        for e in entries[:top]:
+            lines.append(
+                f"  {e.latency.total_ms:8.1f} ms  x{e.latency.count:<4d} "
+                f"rows={e.rows:<6d} max={e.latency.max_ms:.1f}ms  "
+                f"[{e.environment} {e.op}] {e.fingerprint[:120]}"
+            )
+        with self._lock:
+            for env, h in self._connects.items():
+                lines.append(f"  connect[{env}]: x{h.count}, avg {h.avg_ms:.1f} ms")
+        return "\n".join(lines)
+
+
+_global_stats = QueryStats()
+_current_stats: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar(
+    "query_stats", default=None,
+)
+
+
+def global_query_stats() -> QueryStats:
+    """프로세스 전역 누적 통계."""
+    return _global_stats
+
+
+def record_query(environment: str, op: str, sql: str, rows: int, ms: float) -> None:
+    fp = fingerprint(sql)
+    _global_stats.record(environment, op, fp, rows, ms)
+    current = _current_stats.get()
+    if current is not None:
+        current.record(environment, op, fp, rows, ms)
+    if ms >= settings.MYSQL_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query on %s (%s, %.0f ms, %d rows): %s",
+            environment, op, ms, rows, _WS_RE.sub(" ", sql).strip()[:1000],
+        )
+
+
+def record_connect(environment: str, ms: float) -> None:
+    _global_stats.record_connect(environment, ms)
+    current = _current_stats.get()
+    if current is not None:
+        current.record_connect(environment, ms)
+
+
+def start_tracking() -> tuple[QueryStats, contextvars.Token]:
+    """요청 단위 통계 수집 시작. stop_tracking(token)으로 종료."""
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def stop_tracking(token: contextvars.Token) -> None:
+    _current_stats.reset(token)
+
+
+@contextmanager
+def track_queries():
+    stats, token = start_tracking()
+    try:
+        yield stats
+    finally:
+        stop_tracking(token)
@@ -0,0 +1,119 @@
+"""프로세스 내 LRU + TTL 캐시 (바이트 단위 용량 제한).
+
+MySQL 캐시 테이블 앞단의 L1로 사용한다. 키는 튜플이고 첫 요소를 namespace로 보고
+namespace별 hit/miss를 집계한다. DB 스레드 풀에서 동시에 접근하므로 thread-safe.
+
+Usage:
+    cache = TTLCache(max_bytes=64 * 1024 * 1024, ttl=600)
+    cache.set(("ingredient", "CFO", asin), ingredients)
+    cache.get(("ingredient", "CFO", asin))
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """값의 대략적인 메모리 크기 (bytes). 용량 계산용 근사치."""
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if _depth > 4:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v, _depth + 1) for v in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value), _depth + 1)
+    return sys.getsizeof(value)
+
+
+class TTLCache:
+    """용량(bytes) 기준 LRU eviction + 항목별 TTL 만료."""
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (value, size, expires_at)
+        self._data: OrderedDict[tuple, tuple[Any, int, float]] = OrderedDict()
+        self._size = 0
+        self._hits: Counter[Hashable] = Counter()
+        self._misses: Counter[Hashable] = Counter()
+        self._evictions = 0
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[2] <= now:
+                if entry is not _MISSING:
+                    self._pop(key)
+                self._misses[key[0]] += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits[key[0]] += 1
+            return entry[0]
+
+    def set(self, key: tuple, value: Any, ttl: float | None = None, size: int | None = None) -> None:
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (value, size, expires_at)
+            self._size += size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._data))
+                self._pop(oldest)
+                self._evictions += 1
+
+    def delete(self, key: tuple) -> None:
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+
+    def invalidate(self, predicate: Callable[[tuple, Any], bool]) -> int:
+        """predicate(key, value)가 참인 항목 모두 제거. 제거한 수 반환."""
+        with self._lock:
+            keys = [k for k, entry in self._data.items() if predicate(k, entry[0])]
+            for k in keys:
+                self._pop(k)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            namespaces = set(self._hits) | set(self._misses)
+            return {
+                "entries": len(self._data),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "hits": sum(self._hits.values()),
+                "misses": sum(self._misses.values()),
+                "by_namespace": {
+                    ns: {"hits": self._hits[ns], "misses": self._misses[ns]}
+                    for ns in sorted(namespaces, key=str)
+                },
+            }
+
+    def _pop(self, key: tuple) -> None:
+        _, size, _ = self._data.pop(key)
+        self._size -= size
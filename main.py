@@ -5,8 +5,10 @@ from fastapi import FastAPI
 
 from app.router import router
 from amz_researcher.router import router as amz_router
+from amz_researcher.services.extraction_aggregator import close_extraction_aggregators
 from amz_researcher.services.report_store import ReportStore
 from app.config import settings
+from lib.mysql_connector import close_all_pools
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +24,9 @@ async def lifespan(app: FastAPI):
     if deleted:
         logging.getLogger(__name__).info("Startup: cleaned up %d expired reports", deleted)
     yield
+    # Shutdown: close pooled MySQL connections and shared Gemini clients
+    close_all_pools()
+    await close_extraction_aggregators()
 
 
 app = FastAPI(title="Webhooks Service", lifespan=lifespan)
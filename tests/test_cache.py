@@ -0,0 +1,218 @@
+"""
+AmzCacheService 테스트
+
+- L1 (프로세스 내 LRU/TTL) 캐시: 용량 기반 eviction, TTL 만료, hit/miss 집계
+- L2(MySQL) 앞단 동작: 재조회 시 DB 생략, write-through, 수집 시 무효화, hit 복사본 반환
+- 실패 ASIN 스킵 정책 (SQL 조건 / watermark 증분 스킵 셋)
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from amz_researcher.models import Ingredient, ProductIngredients
+from amz_researcher.services import cache as cache_module
+from amz_researcher.services.cache import AmzCacheService, invalidate_l1_for_ingestion
+from lib.ttl_cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_l1(monkeypatch):
+    monkeypatch.setattr(cache_module, "_l1", TTLCache(max_bytes=1024 * 1024, ttl=60))
+
+
+def test_ttl_cache_evicts_lru_by_size_and_expires():
+    """용량 초과 시 가장 오래 안 쓴 항목부터 제거, TTL 지나면 miss"""
+    cache = TTLCache(max_bytes=100, ttl=60)
+    cache.set(("a", 1), "x", size=40)
+    cache.set(("a", 2), "y", size=40)
+    assert cache.get(("a", 1)) == "x"  # 1을 최근 사용으로
+    cache.set(("b", 3), "z", size=40)
+    assert cache.get(("a", 2)) is None
+    assert cache.get(("a", 1)) == "x"
+
+    cache.set(("b", 4), "w", ttl=0.01, size=1)
+    time.sleep(0.02)
+    assert cache.get(("b", 4)) is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size_bytes"] == 80
+    assert stats["by_namespace"]["a"] == {"hits": 2, "misses": 1}
+
+
+def _mock_connector(df: pd.DataFrame) -> MagicMock:
+    conn = MagicMock()
+    conn.__enter__.return_value.read_query_table.return_value = df
+    return conn
+
+
+def test_ingredient_cache_served_from_l1_after_first_read():
+    """첫 조회만 DB, 이후 같은 ASIN은 L1에서. 미스 ASIN만 DB로 조회"""
+    df = pd.DataFrame([{
+        "asin": "A1", "ingredient_name": "Niacinamide", "common_name": "Vitamin B3",
+        "category": "Vitamin", "source": "inci",
+    }])
+    service = AmzCacheService("CFO")
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(df)) as mc:
+        first = service.get_ingredient_cache(["A1"])
+        second = service.get_ingredient_cache(["A1"])
+        assert mc.call_count == 1
+        service.get_ingredient_cache(["A1", "A2"])
+        query, params = mc.return_value.__enter__.return_value.read_query_table.call_args[0]
+    assert first == second
+    assert second["A1"][0].common_name == "Vitamin B3"
+    assert params[:-1] == ("A2",)
+
+
+def test_ingredient_cache_write_through_and_ingestion_invalidation():
+    """저장 시 L1에 바로 반영, 해당 ASIN 수집 시 L1에서 제거"""
+    service = AmzCacheService("CFO")
+    saved = [ProductIngredients(asin="A1", ingredients=[
+        Ingredient(name="Retinol", common_name="Retinol", category="Vitamin"),
+    ])]
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(pd.DataFrame())) as mc:
+        assert service.save_ingredient_cache(saved)
+        calls = mc.call_count
+        assert service.get_ingredient_cache(["A1"])["A1"][0].name == "Retinol"
+        assert mc.call_count == calls
+
+        invalidate_l1_for_ingestion(["A1"])
+        assert service.get_ingredient_cache(["A1"]) == {}
+        assert mc.call_count == calls + 1
+
+
+def test_l1_hits_are_isolated_copies():
+    """L1에서 꺼낸 모델을 수정해도 캐시와 다른 호출자의 결과는 그대로"""
+    service = AmzCacheService("CFO")
+    saved = [ProductIngredients(asin="A1", ingredients=[
+        Ingredient(name="Retinol", common_name="Retinol", category="Vitamin"),
+    ])]
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(pd.DataFrame())):
+        service.save_ingredient_cache(saved)
+        saved[0].ingredients[0].common_name = "changed by caller"
+        first = service.get_ingredient_cache(["A1"])
+        first["A1"][0].common_name = "mutated"
+        assert service.get_ingredient_cache(["A1"])["A1"][0].common_name == "Retinol"
+
+
+def test_ingredient_l1_write_through_matches_db_rows():
+    """L1에는 DB에 쓴 정규화 값(빈 common_name → name)을 저장"""
+    service = AmzCacheService("CFO")
+    saved = [ProductIngredients(asin="A1", ingredients=[
+        Ingredient(name="Retinol", common_name="", category="Vitamin"),
+    ])]
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(pd.DataFrame())) as mc:
+        service.save_ingredient_cache(saved)
+        df = mc.return_value.__enter__.return_value.upsert_data.call_args[0][0]
+        hit = service.get_ingredient_cache(["A1"])["A1"][0]
+    assert hit.common_name == df.iloc[0]["common_name"] == "Retinol"
+
+
+def test_ingredient_normalizer_fetches_inci_once_per_asin(monkeypatch):
+    """성분 행과 INCI 원문을 따로 스트리밍해 ASIN으로 대조 (INCI는 ASIN당 한 행)"""
+    monkeypatch.setattr(cache_module, "_normalizers", {})
+    monkeypatch.setattr(cache_module.settings, "AMZ_INGREDIENT_NORMALIZER_ENABLED", True)
+    monkeypatch.setattr(cache_module.settings, "AMZ_INGREDIENT_NORMALIZER_MIN_SUPPORT", 2)
+    results = [
+        {"asin": f"A{i}", "ingredient_name": "Niacinamide", "common_name": "Vitamin B3",
+         "category": "Vitamin", "source": "inci"}
+        for i in range(3)
+    ]
+    inci = [{"asin": f"A{i}", "ingredients": "Water, Niacinamide"} for i in range(3)]
+    conn = _mock_connector(pd.DataFrame())
+    stream = conn.__enter__.return_value.read_query_stream
+    stream.side_effect = [iter(results), iter(inci)]
+    with patch.object(cache_module, "MysqlConnector", return_value=conn):
+        normalizer = AmzCacheService("CFO").get_ingredient_normalizer()
+    (results_query, _), (inci_query, _) = [c[0] for c in stream.call_args_list]
+    assert "JOIN" not in results_query and "ingredients" not in results_query.split("FROM")[0]
+    assert "FROM amz_products" in inci_query
+    assert normalizer is not None and len(normalizer) == 1
+
+
+def test_market_report_l1_hit_checks_data_freshness():
+    """L1에 있는 리포트도 생성 이후 제품 데이터가 갱신됐으면 무효"""
+    service = AmzCacheService("CFO")
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(pd.DataFrame())):
+        service.save_market_report_cache("serum", "# report", 10)
+    generated_at = cache_module._l1.get(("market_report", "CFO", "serum", 10))[1]
+
+    with patch.object(service, "_get_data_freshness", return_value=generated_at - timedelta(hours=1)):
+        assert service.get_market_report_cache("serum", 10) == "# report"
+    with patch.object(service, "_get_data_freshness", return_value=generated_at + timedelta(hours=1)):
+        assert service.get_market_report_cache("serum", 10) is None
+    assert cache_module._l1.get(("market_report", "CFO", "serum", 10)) is None
+
+
+def test_get_failed_asins_filters_in_sql_for_requested_asins():
+    """요청 ASIN만 PK로 조회하고 정책은 WHERE 조건으로 평가"""
+    df = pd.DataFrame({"asin": ["A2"]})
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(df)) as mc:
+        skipped = AmzCacheService("CFO").get_failed_asins(["A1", "A2"])
+        query, params = mc.return_value.__enter__.return_value.read_query_table.call_args[0]
+    assert skipped == {"A2"}
+    assert "WHERE asin IN (%s,%s)" in query
+    assert "retry_count >= %s OR last_failed_at >= %s" in query
+    assert params[:2] == ("A1", "A2")
+    assert cache_module.MAX_RETRY_COUNT in params
+
+
+def test_failed_asin_skip_set_refreshes_by_watermark(monkeypatch):
+    """스킵 셋은 첫 조회만 전체, 이후 watermark 이후 변경분만 읽고 정책은 조회 시점 기준"""
+    monkeypatch.setattr(cache_module.settings, "AMZ_FAILED_ASIN_SKIP_SET", True)
+    monkeypatch.setattr(cache_module, "_failed_asin_skip_set", cache_module._FailedAsinSkipSet())
+    now = datetime.now()
+    first = pd.DataFrame([
+        {"asin": "P", "reason": "not_found", "retry_count": 1, "last_failed_at": now - timedelta(days=30)},
+        {"asin": "T", "reason": "timeout", "retry_count": 1, "last_failed_at": now - timedelta(days=30)},
+    ])
+    update = pd.DataFrame([
+        {"asin": "T", "reason": "timeout", "retry_count": 2, "last_failed_at": now},
+    ])
+    service = AmzCacheService("CFO")
+    conn = MagicMock()
+    reads = conn.__enter__.return_value.read_query_table
+    reads.side_effect = [first, update]
+    with patch.object(cache_module, "MysqlConnector", return_value=conn):
+        assert service.get_failed_asins(["P", "T", "X"]) == {"P"}
+        assert service.get_failed_asins(["P", "T", "X"]) == {"P", "T"}
+    assert "WHERE" not in reads.call_args_list[0][0][0]
+    query, params = reads.call_args_list[1][0]
+    assert query.endswith("WHERE last_failed_at >= %s")
+    assert params[0] < now - timedelta(days=29)
+
+
+def test_save_failed_asins_increments_retry_count_in_one_statement():
+    """기존 값 조회 없이 ON DUPLICATE KEY UPDATE로 retry_count 증가"""
+    with patch.object(cache_module, "MysqlConnector", return_value=_mock_connector(pd.DataFrame())) as mc:
+        AmzCacheService("CFO").save_failed_asins(["A1", "A2", "A1"], "kw", reason="timeout")
+        conn = mc.return_value.__enter__.return_value
+    conn.read_query_table.assert_not_called()
+    df, table = conn.upsert_data.call_args[0]
+    assert table == "amz_failed_asins"
+    assert list(df["asin"]) == ["A1", "A2"]
+    assert conn.upsert_data.call_args[1]["update_overrides"] == {"retry_count": "`retry_count` + 1"}
+
+
+def test_harmonize_only_touched_names_with_update_join():
+    """names 지정 시 해당 성분만 재집계 → canonical 테이블 → UPDATE ... JOIN, L1은 해당 성분 보유 ASIN만 무효화"""
+    service = AmzCacheService("CFO")
+    # MySQL collation처럼 대소문자만 다른 이름도 무효화 대상
+    cache_module._l1.set(("ingredient", "CFO", "A1"), [Ingredient(name="RETINOL", common_name="x", category="")])
+    cache_module._l1.set(("ingredient", "CFO", "A2"), [Ingredient(name="Zinc", common_name="Zinc", category="")])
+    conn = _mock_connector(pd.DataFrame())
+    cursor = conn.__enter__.return_value.cursor
+    cursor.rowcount = 3
+    with patch.object(cache_module, "MysqlConnector", return_value=conn):
+        assert service.harmonize_common_names(["Retinol", "_NONE_", "Retinol"]) == 3
+    (refresh, p1), (apply, p2) = [c[0] for c in cursor.execute.call_args_list]
+    assert "INSERT INTO amz_ingredient_canonical" in refresh
+    assert "AND ingredient_name IN (%s)" in refresh
+    assert "JOIN amz_ingredient_canonical k" in apply and "AND c.ingredient_name IN (%s)" in apply
+    assert p1 == p2 == ("Retinol",)
+    assert cache_module._l1.get(("ingredient", "CFO", "A1")) is None
+    assert cache_module._l1.get(("ingredient", "CFO", "A2")) is not None
@@ -0,0 +1,645 @@
+"""
+GeminiService 테스트
+
+- content hash 기반 추출 결과 공유 (중복 입력 1회 추출, content cache 조회/저장)
+- 동시 요청 간 추출 배치 묶기 (single-flight)
+- 프로세스 공용 limiter (동시 요청 상한, token bucket 대기, 실사용량 정산)
+- 토큰 기반 배치 계획 + 잘린/깨진 응답의 누락 ASIN만 재요청
+- 시장 리포트 스트리밍 (Executive Summary 선전달)
+- Voice 키워드 shard 결과 병합
+- 추출 입력 압축
+- 호출별 telemetry (HTTP 상태, 토큰, 재시도, JSON 결과)
+- 재시도 backoff (Retry-After) + hedged request (limiter 대기 중에는 hedge 안 함)
+- 고정 지시문 context cache (생성/재사용/만료 시 재생성/생성 거부 시 인라인)
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from amz_researcher.models import Ingredient, ProductIngredients, VoiceKeyword, VoiceKeywordResult
+from amz_researcher.services.gemini import (
+    EXTRACTION_INSTRUCTIONS,
+    GeminiService,
+    executive_summary_complete,
+    extraction_content_hash,
+    merge_voice_keywords,
+    plan_extraction_batches,
+    salvage_products,
+)
+from amz_researcher.services import gemini as gemini_module
+from amz_researcher.services import gemini_telemetry
+from amz_researcher.services.extraction_aggregator import close_extraction_aggregators, get_extraction_aggregator
+from amz_researcher.services.gemini_limiter import GeminiLimiter, TokenBucket
+from amz_researcher.services.gemini_retry import LatencyWindow, RetryPolicy, hedged
+from amz_researcher.services.prompt_compaction import compact_extraction_product, compact_inci
+
+
+def _product(asin: str, inci: str, title: str = "Serum") -> dict:
+    return {"asin": asin, "title": title, "ingredients_raw": inci, "features": [], "additional_details": {}}
+
+
+class _FakeContentCache:
+    """AmzCacheService의 extraction cache 대역 (aio 프록시 형태)."""
+
+    def __init__(self, stored: dict):
+        self.stored = dict(stored)
+        self.saved: dict = {}
+        self.aio = self
+
+    async def get_extraction_cache(self, hashes):
+        return {h: self.stored[h] for h in hashes if h in self.stored}
+
+    async def save_extraction_cache(self, results):
+        self.saved.update(results)
+        return True
+
+
+def test_content_hash_ignores_asin_and_whitespace_case():
+    a = _product("A1", "Water,  Niacinamide")
+    b = _product("B2", "water, niacinamide")
+    assert extraction_content_hash(a) == extraction_content_hash(b)
+    assert extraction_content_hash(a) != extraction_content_hash(_product("A1", "Water, Retinol"))
+
+
+def test_extract_ingredients_shares_results_across_identical_inputs():
+    """같은 입력은 한 번만 Gemini로, 캐시 hit는 호출 없이 팬아웃"""
+    products = [
+        _product("A1", "Niacinamide"),
+        _product("A2", "niacinamide"),  # A1과 동일 입력
+        _product("B1", "Retinol"),
+        _product("C1", "Zinc"),  # content cache hit
+    ]
+    zinc = [Ingredient(name="Zinc", common_name="Zinc", category="Active/Functional")]
+    content_cache = _FakeContentCache({extraction_content_hash(products[3]): zinc})
+    sent: list[list[str]] = []
+
+    async def _fake_batch(batch, max_retries=1):
+        sent.append([p["asin"] for p in batch])
+        return [
+            ProductIngredients(asin=p["asin"], ingredients=[
+                Ingredient(name=p["ingredients_raw"], common_name=p["ingredients_raw"], category="Vitamin"),
+            ])
+            for p in batch
+        ]
+
+    async def _run():
+        aggregator = get_extraction_aggregator("key")
+        aggregator.service._extract_batch = _fake_batch
+        service = GeminiService("key")
+        try:
+            return await service.extract_ingredients(products, content_cache=content_cache)
+        finally:
+            await service.close()
+            await aggregator.service.close()
+
+    results = asyncio.run(_run())
+
+    assert sent == [["A1", "B1"]]
+    by_asin = {r.asin: r.ingredients for r in results}
+    assert set(by_asin) == {"A1", "A2", "B1", "C1"}
+    assert by_asin["A2"][0].name == "Niacinamide"
+    assert by_asin["A2"][0] is not by_asin["A1"][0]
+    assert by_asin["C1"] == zinc
+    assert set(content_cache.saved) == {
+        extraction_content_hash(products[0]), extraction_content_hash(products[2]),
+    }
+
+
+def test_extract_ingredients_refresh_skips_cache_lookup_but_saves():
+    """reuse_cached=False(refresh)면 content cache hit도 다시 추출하고 새 결과로 덮어씀"""
+    product = _product("C1", "Zinc")
+    stale = [Ingredient(name="Old", common_name="Old", category="Other")]
+    content_cache = _FakeContentCache({extraction_content_hash(product): stale})
+    sent: list[str] = []
+
+    async def _fake_batch(batch):
+        sent.extend(p["asin"] for p in batch)
+        return [ProductIngredients(asin=p["asin"], ingredients=[
+            Ingredient(name="Zinc", common_name="Zinc", category="Active/Functional"),
+        ]) for p in batch]
+
+    service = GeminiService("key")
+    service._extract_batch = _fake_batch
+    results = asyncio.run(service.extract_ingredients(
+        [product], batch_size=10, content_cache=content_cache, reuse_cached=False,
+    ))
+    asyncio.run(service.close())
+    assert sent == ["C1"]
+    assert results[0].ingredients[0].name == "Zinc"
+    assert content_cache.saved[extraction_content_hash(product)][0].name == "Zinc"
+
+
+def test_concurrent_requests_share_aggregated_extraction_batches():
+    """동시에 들어온 두 요청의 입력이 한 배치로 묶이고, 겹치는 입력은 한 번만 추출되며
+    배치 호출은 두 요청의 telemetry에 모두 기록된다"""
+    sent: list[list[str]] = []
+
+    async def _run():
+        aggregator = get_extraction_aggregator("key")
+
+        async def _fake_batch(batch, max_retries=1):
+            sent.append([p["asin"] for p in batch])
+            gemini_telemetry.record_call(gemini_telemetry.GeminiCall("extract_ingredients", "flash"))
+            return [
+                ProductIngredients(asin=p["asin"], ingredients=[
+                    Ingredient(name=p["ingredients_raw"], common_name=p["ingredients_raw"], category="Vitamin"),
+                ])
+                for p in batch
+            ]
+
+        aggregator.service._extract_batch = _fake_batch
+
+        async def _request(products):
+            service = GeminiService("key")
+            stats, token = gemini_telemetry.start_tracking()
+            try:
+                return await service.extract_ingredients(products), stats
+            finally:
+                gemini_telemetry.stop_tracking(token)
+                await service.close()  # 요청별 client를 닫아도 공유 배치와 무관
+
+        try:
+            return await asyncio.gather(
+                _request([_product("A1", "Niacinamide"), _product("B1", "Retinol")]),
+                _request([_product("B1", "Retinol"), _product("C1", "Zinc")]),
+            )
+        finally:
+            await aggregator.service.close()
+
+    (first_results, first_stats), (second_results, second_stats) = asyncio.run(_run())
+    assert sent == [["A1", "B1", "C1"]]
+    assert sorted(r.asin for r in first_results) == ["A1", "B1"]
+    assert sorted(r.asin for r in second_results) == ["B1", "C1"]
+    assert len(first_stats.calls) == len(second_stats.calls) == 1
+
+def test_lone_extraction_request_skips_aggregation_window():
+    """기다리는 다른 요청이 없으면 window를 기다리지 않고 바로 발행, 종료 시 공용 client를 닫음"""
+
+    async def _fake_batch(batch):
+        return [ProductIngredients(asin=p["asin"], ingredients=[]) for p in batch]
+
+    async def _run():
+        aggregator = get_extraction_aggregator("key")
+        aggregator.window_sec = 5.0
+        aggregator.service._extract_batch = _fake_batch
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await aggregator.extract({"h1": _product("A1", "Zinc")})
+        elapsed = loop.time() - started
+        await close_extraction_aggregators()
+        return aggregator, elapsed
+
+    aggregator, elapsed = asyncio.run(_run())
+    assert elapsed < 1.0
+    assert aggregator.service.client.is_closed
+
+
+def test_limiter_bounds_in_flight_requests_and_records_queue_time():
+    """max_in_flight 초과 요청은 대기열에서 기다리고 대기 시간이 집계됨"""
+    limiter = GeminiLimiter("m", max_in_flight=2, rpm=6000, tpm=10_000_000)
+    peak = 0
+
+    async def _call():
+        nonlocal peak
+        async with limiter.slot(10):
+            peak = max(peak, limiter.stats()["in_flight"])
+            await asyncio.sleep(0.01)
+
+    async def _run():
+        await asyncio.gather(*[_call() for _ in range(6)])
+
+    asyncio.run(_run())
+    stats = limiter.stats()
+    assert peak == 2
+    assert stats["queued_requests"] == 6 and stats["in_flight"] == 0 and stats["waiting"] == 0
+    assert stats["queue_max_ms"] >= 10
+
+
+def test_limiter_rate_wait_does_not_hold_in_flight_slot():
+    """RPM 부족분을 기다리는 요청은 in-flight 슬롯 밖에서 대기하고, 취소되면 예약을 반환"""
+    limiter = GeminiLimiter("m", max_in_flight=1, rpm=60, tpm=10_000_000)
+    limiter.rpm.reserve(60)  # RPM 소진: 다음 요청은 1초 대기
+    order = []
+
+    async def _rate_limited():
+        async with limiter.slot(10):
+            order.append("rate_limited")
+
+    async def _run():
+        task = asyncio.create_task(_rate_limited())
+        await asyncio.sleep(0.05)
+        stats = limiter.stats()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return stats
+
+    stats = asyncio.run(_run())
+    assert stats["in_flight"] == 0 and stats["waiting"] == 1
+    assert order == []
+    assert limiter.rpm.reserve(0) == 0.0  # 취소된 예약은 반환됨
+
+
+def test_token_bucket_reserves_and_settles():
+    """용량 초과 예약은 부족분/충전 속도만큼 대기, 정산으로 잔량 보정"""
+    bucket = TokenBucket(per_minute=60)  # 1 token/s
+    assert bucket.reserve(60) == 0.0
+    assert 1.9 < bucket.reserve(2) <= 2.0
+    bucket.adjust(-2)  # 실제 사용량이 예약보다 2 적음 → 환급
+    assert bucket.reserve(0) < 0.1
+
+
+def test_plan_batches_packs_by_estimated_output_tokens():
+    """긴 INCI 제품은 적게, 짧은 제품은 많이 묶음"""
+    long_inci = ", ".join(f"Ingredient {i}" for i in range(40))
+    products = [_product(f"L{i}", long_inci) for i in range(6)] + [_product(f"S{i}", "Water") for i in range(30)]
+    batches = plan_extraction_batches(products, max_batch=40, output_budget=3000)
+    assert all(sum(p["asin"].startswith("L") for p in b) <= 2 for b in batches)
+    assert max(len(b) for b in batches) > 10
+    assert [p["asin"] for b in batches for p in b] == [p["asin"] for p in products]
+
+
+def test_truncated_response_resubmits_only_missing_asins():
+    """finishReason=MAX_TOKENS면 완성된 제품만 취하고 누락 ASIN을 나눠 재요청"""
+    calls: list[list[str]] = []
+
+    def _result(asins):
+        return {"products": [
+            {"asin": a, "ingredients": [{"name": "X", "common_name": "X", "category": "Other"}]}
+            for a in asins
+        ]}
+
+    async def _fake_generate(model, prompt, config, timeout=None, **kwargs):
+        asins = [p["asin"] for p in json.loads(prompt.split("제품 목록:\n", 1)[1])]
+        calls.append(asins)
+        if len(asins) == 4:
+            full = json.dumps(_result(asins[:1]))
+            truncated = full[:-1]  # A0까지만 완성된 채 잘린 응답
+            return {"candidates": [{"finishReason": "MAX_TOKENS", "content": {"parts": [{"text": truncated}]}}]}
+        return {"candidates": [{"finishReason": "STOP", "content": {"parts": [{"text": json.dumps(_result(asins))}]}}]}
+
+    service = GeminiService("key")
+    service._generate = _fake_generate
+    products = [_product(f"A{i}", f"Inci {i}") for i in range(4)]
+    results = asyncio.run(service._extract_batch(products))
+    asyncio.run(service.close())
+
+    # A0은 잘린 응답에서 복구, 나머지 A1~A3만 나눠 재요청
+    assert calls[0] == ["A0", "A1", "A2", "A3"]
+    assert sorted(calls[1:]) == [["A1"], ["A2", "A3"]]
+    assert sorted(r.asin for r in results) == ["A0", "A1", "A2", "A3"]
+
+
+def test_malformed_response_salvages_products_and_rerequests_missing():
+    """중간 제품 객체가 깨진 응답에서도 나머지 제품을 회수하고 누락 ASIN만 한 번 재요청"""
+    calls: list[list[str]] = []
+    good = '{"asin": "%s", "ingredients": [{"name": "Niacinamide", "common_name": "Niacinamide", "category": "Vitamin"}]}'
+    broken = '{"products": [' + good % "A0" + ', {"asin": "A1", "ingredients": [{"name": "X" "category"}]}, ' + good % "A2" + ", " + (good % "A3")[:40]
+    assert [p.asin for p in salvage_products(broken)] == ["A0", "A2"]
+
+    async def _fake_generate(model, prompt, config, timeout=None, **kwargs):
+        asins = [p["asin"] for p in json.loads(prompt.split("제품 목록:\n", 1)[1])]
+        calls.append(asins)
+        text = broken if len(asins) == 4 else '{"products": [' + ", ".join(good % a for a in asins) + "]}"
+        return {"candidates": [{"finishReason": "STOP", "content": {"parts": [{"text": text}]}}]}
+
+    service = GeminiService("key")
+    service._generate = _fake_generate
+    products = [_product(f"A{i}", f"Inci {i}") for i in range(4)]
+    results = asyncio.run(service._extract_batch(products))
+    asyncio.run(service.close())
+
+    assert calls == [["A0", "A1", "A2", "A3"], ["A1", "A3"]]
+    assert sorted(r.asin for r in results) == ["A0", "A1", "A2", "A3"]
+
+def test_market_report_stream_posts_executive_summary_early():
+    """Executive Summary 섹션이 끝나는 시점에 콜백 1회, 반환값은 전체 리포트"""
+    pieces = [
+        "## Executive Summary\n- 니아신아마이드 중심 ",
+        "시장\n**즉각적인 전략 제안:** 가격대 공략\n",
+        "\n1. **시장 요약**\n- 본문",
+        "\n2. **가격대별 성분 전략**\n- 본문",
+    ]
+    received: list[tuple[str, int]] = []
+    streamed = 0
+
+    async def _fake_stream(model, prompt, config, timeout=None, **kwargs):
+        nonlocal streamed
+        for piece in pieces:
+            streamed += 1
+            yield piece
+
+    async def _on_summary(text):
+        received.append((text, streamed))
+
+    async def _run():
+        service = GeminiService(api_key="test")
+        service._generate_stream = _fake_stream
+        try:
+            return await service.generate_market_report(
+                {"keyword": "serum", "total_products": 10}, on_executive_summary=_on_summary,
+            )
+        finally:
+            await service.close()
+
+    report = asyncio.run(_run())
+    assert report == "".join(pieces)
+    assert len(received) == 1
+    text, at_piece = received[0]
+    assert at_piece == 3  # 나머지 섹션 수신 전에 전달
+    assert executive_summary_complete(text)
+    assert not executive_summary_complete("## Executive Summary\n- 아직 작성 중")
+
+
+def test_merge_voice_keywords_folds_variants_and_remaps_asins():
+    """shard 간 표기 변형을 접고 ASIN을 합친 뒤 2개 이상 제품 키워드만 결정적으로 정렬"""
+    shard1 = VoiceKeywordResult(
+        positive_keywords=[
+            VoiceKeyword(keyword="Moisturizing", asins=["A2", "A1"]),
+            VoiceKeyword(keyword="gentle", asins=["A1"]),
+        ],
+        negative_keywords=[VoiceKeyword(keyword="Breakouts", asins=["A1"])],
+    )
+    shard2 = VoiceKeywordResult(
+        positive_keywords=[
+            VoiceKeyword(keyword="moisturising", asins=["B1", "ZZ"]),  # ZZ: 입력에 없는 ASIN
+            VoiceKeyword(keyword="lightweight", asins=["B1", "B2"]),
+        ],
+        negative_keywords=[VoiceKeyword(keyword="break-out", asins=["B2"])],
+    )
+    asins = ["A1", "A2", "B1", "B2"]
+
+    merged = merge_voice_keywords([shard1, shard2], asins)
+    assert merged == merge_voice_keywords([shard2, shard1], asins)
+    assert [(vk.keyword, vk.asins) for vk in merged.positive_keywords] == [
+        ("moisturizing", ["A1", "A2", "B1"]),
+        ("lightweight", ["B1", "B2"]),
+    ]
+    assert [vk.asins for vk in merged.negative_keywords] == [["A1", "B2"]]
+
+
+def test_compact_extraction_product_drops_boilerplate():
+    """기본 제외 성분/중복 features 제거, 긴 텍스트는 경계에서 자름"""
+    product = {
+        "asin": "A1",
+        "title": "Serum",
+        "ingredients_raw": "Water (Aqua), Glycerin, Phenoxyethanol, Niacinamide, glycerin, Fragrance",
+        "features": ["Vegan  formula", "vegan formula", "Fast absorbing"],
+        "additional_details": {"Scent": "Unscented", "Note": "", "Story": "word " * 200},
+    }
+    compacted = compact_extraction_product(product)
+    assert compacted["asin"] == "A1"
+    assert compacted["ingredients_raw"] == "Glycerin, Niacinamide"
+    assert compacted["features"] == ["Vegan formula", "Fast absorbing"]
+    assert set(compacted["additional_details"]) == {"Scent", "Story"}
+    assert len(compacted["additional_details"]["Story"]) <= 300
+    assert product["ingredients_raw"].startswith("Water")  # 원본 불변
+
+
+def test_compact_inci_keeps_different_parts_of_same_plant():
+    """식물 부위만 다른 성분(Leaf/Seed, Fruit/Seed)은 중복으로 보지 않음"""
+    text = (
+        "Water, Camellia Sinensis Leaf Extract, Camellia Sinensis Seed Oil, "
+        "Rosa Canina Fruit Oil, Rosa Canina Seed Oil, rosa  canina seed oil"
+    )
+    assert compact_inci(text) == (
+        "Camellia Sinensis Leaf Extract, Camellia Sinensis Seed Oil, "
+        "Rosa Canina Fruit Oil, Rosa Canina Seed Oil"
+    )
+
+
+def test_generate_records_telemetry_per_request():
+    """호출별 HTTP 상태/토큰/재시도/JSON 결과가 요청 단위 통계와 히스토그램에 기록된다"""
+    responses = [
+        httpx.Response(503, json={"error": {"message": "overloaded"}}),
+        httpx.Response(200, json={
+            "candidates": [{"content": {"parts": [{"text": '{"keywords": ["vegan"]}'}]}, "finishReason": "STOP"}],
+            "usageMetadata": {"promptTokenCount": 120, "candidatesTokenCount": 8, "totalTokenCount": 128},
+        }),
+    ]
+
+    async def _run():
+        service = GeminiService(api_key="test")
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(lambda req: responses.pop(0)))
+        stats, token = gemini_telemetry.start_tracking()
+        try:
+            for attempt in range(2):
+                try:
+                    data = await service._generate(
+                        service.model, "prompt", {"maxOutputTokens": 64},
+                        operation="title_keywords", attempt=attempt,
+                    )
+                except httpx.HTTPStatusError:
+                    continue
+                text = data["candidates"][0]["content"]["parts"][0]["text"]
+                service._parse_json(text, json.loads)
+        finally:
+            gemini_telemetry.stop_tracking(token)
+            await service.close()
+        return stats
+
+    stats = asyncio.run(_run())
+    first, second = stats.calls
+    assert (first.status, first.error, first.attempt) == (503, "HTTPStatusError", 0)
+    assert (second.status, second.attempt, second.prompt_tokens, second.output_tokens) == (200, 1, 120, 8)
+    assert second.json_outcome == "ok" and second.finish_reason == "STOP"
+    (op,) = stats.snapshot()["operations"]
+    assert (op["calls"], op["retries"], op["errors"]) == (2, 1, 1)
+    assert op["statuses"] == {"503": 1, "200": 1}
+    assert op["json_outcomes"] == {"ok": 1}
+    assert sum(op["buckets"]) == 2
+
+
+def test_retry_policy_honors_retry_after_and_skips_client_errors():
+    """429는 Retry-After 이상 대기 후 재시도, 400은 재시도하지 않는다"""
+    request = httpx.Request("POST", "https://example.invalid")
+
+    def _error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+        response = httpx.Response(status, headers=headers, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    policy = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=4.0)
+    throttled = _error(429, {"Retry-After": "7"})
+    assert policy.should_retry(0, throttled)
+    assert policy.delay(0, throttled) >= 7
+    assert not policy.should_retry(2, throttled)
+    assert not policy.should_retry(0, _error(400))
+    assert all(0 <= policy.delay(5) <= 4.0 for _ in range(50))
+
+
+def test_hedged_returns_first_response_and_cancels_the_other():
+    """주 요청이 hedge 지연 안에 끝나지 않으면 hedge를 보내고 먼저 온 응답을 쓴다"""
+    cancelled: list[bool] = []
+
+    async def _call(is_hedge: bool) -> str:
+        try:
+            await asyncio.sleep(0.01 if is_hedge else 5)
+            return "hedge" if is_hedge else "primary"
+        except asyncio.CancelledError:
+            cancelled.append(is_hedge)
+            raise
+
+    result = asyncio.run(hedged(_call, 0.02))
+    assert result == "hedge"
+    assert cancelled == [False]
+
+
+def test_hedge_latency_excludes_limiter_queue_time(monkeypatch):
+    """hedge 기준 지연은 limiter 슬롯을 잡은 뒤의 응답 시간만 기록"""
+    limiter = GeminiLimiter("m", max_in_flight=1, rpm=6000, tpm=10_000_000)
+    window = LatencyWindow()
+    monkeypatch.setattr(gemini_module, "get_limiter", lambda model: limiter)
+    monkeypatch.setattr(gemini_module, "_EXTRACT_LATENCY", window)
+    monkeypatch.setattr(gemini_module.settings, "AMZ_GEMINI_CONTEXT_CACHE_ENABLED", False)
+    service = GeminiService("key")
+
+    async def _post(model, body, timeout):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": "{}"}]}}]},
+                              request=httpx.Request("POST", "https://gemini.test"))
+
+    service._post_generate = _post
+
+    async def _hold_slot():
+        async with limiter.slot(1):
+            await asyncio.sleep(0.2)
+
+    async def _run():
+        holder = asyncio.create_task(_hold_slot())
+        await asyncio.sleep(0)
+        await service._generate_extraction("prompt", 0)
+        await holder
+        await service.close()
+
+    asyncio.run(_run())
+    assert len(window) == 1
+    assert window.percentile(0.5) < 150  # 대기 0.2초는 제외
+
+
+def test_no_hedge_while_primary_waits_in_limiter(monkeypatch):
+    """주 요청이 limiter에서 hedge 지연보다 오래 대기해도 hedge는 보내지 않는다"""
+    limiter = GeminiLimiter("m", max_in_flight=1, rpm=6000, tpm=10_000_000)
+    monkeypatch.setattr(gemini_module, "get_limiter", lambda model: limiter)
+    monkeypatch.setattr(gemini_module, "_EXTRACT_LATENCY", LatencyWindow())
+    monkeypatch.setattr(gemini_module.settings, "AMZ_GEMINI_CONTEXT_CACHE_ENABLED", False)
+    service = GeminiService("key")
+    service._hedge_delay = lambda: 0.05
+    posts: list[float] = []
+
+    async def _post(model, body, timeout):
+        posts.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": "{}"}]}}]},
+                              request=httpx.Request("POST", "https://gemini.test"))
+
+    service._post_generate = _post
+
+    async def _hold_slot():
+        async with limiter.slot(1):
+            await asyncio.sleep(0.2)
+
+    async def _run():
+        holder = asyncio.create_task(_hold_slot())
+        await asyncio.sleep(0)
+        await service._generate_extraction("prompt", 0)
+        await holder
+        await service.close()
+
+    asyncio.run(_run())
+    assert len(posts) == 1
+
+
+def test_odm_brief_does_not_retry_non_retryable_error():
+    """4xx(재시도 불가) 실패는 한 번만 호출하고 fallback 브리프 반환"""
+    calls = 0
+    request = httpx.Request("POST", "https://gemini.test")
+
+    async def _fake_generate(model, prompt, config, timeout=None, **kwargs):
+        nonlocal calls
+        calls += 1
+        response = httpx.Response(400, request=request)
+        raise httpx.HTTPStatusError("bad request", request=request, response=response)
+
+    service = GeminiService("key")
+    service._generate = _fake_generate
+    safe = [{"ingredient": "Glycerin", "frequency_pct": 80}]
+    stats = {"total_products": 10, "with_count": 3}
+    result = asyncio.run(service.generate_odm_brief("sticky", [], safe, stats))
+    asyncio.run(service.close())
+    assert calls == 1
+    assert result["safe_combo"] == "Glycerin"
+
+
+class _CachedContentsStub:
+    """Gemini cachedContents / generateContent 로컬 대역 (httpx.MockTransport handler)."""
+
+    def __init__(self, min_tokens: int = 0):
+        self.min_tokens = min_tokens
+        self.live: set[str] = set()
+        self.created: list[str] = []
+        self.create_requests = 0
+        self.bodies: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/cachedContents"):
+            self.create_requests += 1
+            text = body["contents"][0]["parts"][0]["text"]
+            if len(text) // 3 < self.min_tokens:
+                return httpx.Response(400, json={"error": {"message": "Cached content is too small"}})
+            name = f"cachedContents/c{len(self.created)}"
+            self.live.add(name)
+            self.created.append(name)
+            return httpx.Response(200, json={"name": name, "usageMetadata": {"totalTokenCount": len(text) // 3}})
+        self.bodies.append(body)
+        name = body.get("cachedContent")
+        if name is not None and name not in self.live:
+            return httpx.Response(403, json={"error": {"message": "CachedContent not found (or permission denied)"}})
+        return httpx.Response(200, json={
+            "candidates": [{"content": {"parts": [{"text": '{"products": []}'}]}, "finishReason": "STOP"}],
+            "usageMetadata": {"promptTokenCount": 900, "cachedContentTokenCount": 800 if name else 0},
+        })
+
+
+def test_context_cache_reuses_and_recreates_static_prefix():
+    """고정 지시문은 한 번 등록해 재사용하고, 만료되면 다시 만들어 재요청한다"""
+    stub = _CachedContentsStub()
+
+    async def _run():
+        service = GeminiService(api_key="test")
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+        try:
+            for _ in range(2):
+                await service._generate(service.model, "제품 목록:\n[]", {}, static_prefix=EXTRACTION_INSTRUCTIONS)
+            stub.live.clear()  # TTL 만료
+            await service._generate(service.model, "제품 목록:\n[]", {}, static_prefix=EXTRACTION_INSTRUCTIONS)
+        finally:
+            await service.close()
+
+    asyncio.run(_run())
+    assert stub.created == ["cachedContents/c0", "cachedContents/c1"]
+    assert [b.get("cachedContent") for b in stub.bodies] == [
+        "cachedContents/c0", "cachedContents/c0", "cachedContents/c0", "cachedContents/c1",
+    ]
+    # 캐시를 참조하는 요청에는 가변 부분만 실린다
+    assert stub.bodies[0]["contents"][0]["parts"][0]["text"] == "제품 목록:\n[]"
+
+
+def test_context_cache_falls_back_inline_when_creation_is_refused():
+    """최소 토큰 미달 등으로 생성이 거부되면 지시문을 앞에 붙여 인라인으로 보내고, 생성을 반복 시도하지 않는다"""
+    stub = _CachedContentsStub(min_tokens=10**6)
+
+    async def _run():
+        service = GeminiService(api_key="test")
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+        try:
+            for _ in range(2):
+                await service._generate(service.model, "제품 목록:\n[]", {}, static_prefix=EXTRACTION_INSTRUCTIONS)
+        finally:
+            await service.close()
+
+    asyncio.run(_run())
+    assert (stub.create_requests, stub.created) == (1, [])
+    assert all("cachedContent" not in b for b in stub.bodies)
+    assert stub.bodies[0]["contents"][0]["parts"][0]["text"] == EXTRACTION_INSTRUCTIONS + "\n\n제품 목록:\n[]"
@@ -0,0 +1,59 @@
+"""
+IngredientNormalizer 테스트
+
+- 과거 추출 결과 학습 (표기 변형 접기, 선별/제외 다수결)
+- 전 토큰 판정 가능 시 로컬 해석 / 모르는 토큰이 있으면 Gemini 위임
+"""
+
+from amz_researcher.models import Ingredient
+from amz_researcher.services.ingredient_normalizer import (
+    IngredientNormalizer,
+    fold_inci_name,
+    split_inci,
+)
+
+_INCI = "Water, Glycerin, Argania Spinosa Kernel Oil, Tocopherol, Cetearyl Alcohol, Phenoxyethanol"
+_EXTRACTED = [
+    Ingredient(name="Glycerin", common_name="Glycerin", category="Humectant", source="inci"),
+    Ingredient(name="Argania Spinosa Kernel Oil", common_name="Argan Oil", category="Natural Oil", source="both"),
+    Ingredient(name="Tocopherol", common_name="Vitamin E", category="Vitamin", source="inci"),
+]
+
+
+def _trained() -> IngredientNormalizer:
+    normalizer = IngredientNormalizer(min_support=3)
+    for _ in range(3):
+        normalizer.observe(_INCI, _EXTRACTED)
+    return normalizer
+
+
+def test_split_and_fold_inci_variants():
+    assert split_inci("Ingredients: Water, Rosmarinus Officinalis (Rosemary, Organic) Leaf Extract.") == [
+        "Water", "Rosmarinus Officinalis (Rosemary, Organic) Leaf Extract",
+    ]
+    assert fold_inci_name("ROSMARINUS OFFICINALIS (ROSEMARY) LEAF EXTRACT") == fold_inci_name(
+        "Rosmarinus Officinalis Extract"
+    )
+
+
+def test_resolve_uses_learned_selection_and_defers_unknown_products():
+    """알려진 표기로만 이뤄진 제품은 로컬 해석, 모르는 성분이 하나라도 있으면 None"""
+    normalizer = _trained()
+    product = {
+        "asin": "B1",
+        "title": "Hair Serum with Vitamin E",
+        "features": ["Lightweight argan oil formula"],
+        "ingredients_raw": "Aqua, GLYCERIN, Argania Spinosa (Argan) Kernel Oil, Tocopherol, Cetearyl Alcohol",
+    }
+    resolved = normalizer.resolve(product)
+    assert [(i.name, i.common_name, i.category, i.source) for i in resolved] == [
+        ("GLYCERIN", "Glycerin", "Humectant", "inci"),
+        ("Argania Spinosa (Argan) Kernel Oil", "Argan Oil", "Natural Oil", "both"),
+        ("Tocopherol", "Vitamin E", "Vitamin", "both"),
+    ]
+
+    unknown = dict(product, ingredients_raw="Glycerin, Bakuchiol, Squalane, Niacinamide, Tocopherol")
+    assert normalizer.resolve(unknown) is None
+    one_new_active = dict(product, ingredients_raw=product["ingredients_raw"] + ", Bakuchiol")
+    assert normalizer.resolve(one_new_active) is None
+    assert normalizer.resolve(dict(product, ingredients_raw="")) is None
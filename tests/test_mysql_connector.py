@@ -0,0 +1,392 @@
+"""
+MysqlConnector 테스트
+
+- 환경별 커넥션 풀 (재사용, max_size 대기, stale 커넥션 폐기, rollback-on-return)
+- 컬럼 단위 NaN/NaT 변환 + 배치 분할 쓰기
+- 서버 사이드 커서 스트리밍 읽기
+- async 접근 계층 (DB 스레드 실행, 서비스 async 변형)
+- LOAD DATA LOCAL INFILE 벌크 적재 + executemany fallback
+- swap 모드 (staging 선적재, RENAME TABLE 전체 교체)
+- row hash 변경 감지 upsert
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pandas as pd
+import pymysql
+import pytest
+from unittest.mock import patch
+
+from lib import mysql_connector
+from lib.mysql_connector import (
+    AsyncMysqlConnector,
+    AsyncServiceProxy,
+    ConnectionPool,
+    DBConfig,
+    MysqlConnector,
+    _frame_to_rows,
+    _row_hash,
+    _tsv_field,
+)
+
+CONFIG = DBConfig(host="localhost", port=3306, user="u", password="p", database="d")
+
+
+class FakeConnection:
+    """pymysql Connection 대역: ping/rollback/close 호출만 기록."""
+
+    def __init__(self):
+        self.open = True
+        self.alive = True
+        self.rollbacks = 0
+        self.commits = 0
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise ConnectionError("gone away")
+
+    def rollback(self):
+        if not self.alive:
+            raise ConnectionError("gone away")
+        self.rollbacks += 1
+
+    def commit(self):
+        self.commits += 1
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor()
+
+    def close(self):
+        self.open = False
+
+
+class FakeCursor:
+    max_stmt_length = 1024000
+
+    def __init__(self):
+        self.executed: list[tuple] = []
+        self.batches: list[list[tuple]] = []
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchone(self):
+        return (4 * 1024 * 1024,)
+
+    def executemany(self, query, values):
+        self.batches.append(list(values))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_connect():
+    created: list[FakeConnection] = []
+
+    def _factory(config, local_infile=False):
+        conn = FakeConnection()
+        conn.local_infile = local_infile
+        created.append(conn)
+        return conn
+
+    with patch("lib.mysql_connector._connect", side_effect=_factory):
+        yield created
+
+
+def test_pool_reuses_released_connection(fake_connect):
+    """반환된 커넥션은 rollback 후 다음 borrow에서 재사용"""
+    pool = ConnectionPool(CONFIG, max_size=2)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert conn.rollbacks == 1
+    assert pool.acquire() is conn
+    assert len(fake_connect) == 1
+
+
+def test_pool_discards_stale_connection_on_borrow(fake_connect):
+    """ping 실패한 유휴 커넥션은 폐기하고 새로 연결"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.alive = False
+    fresh = pool.acquire()
+    assert fresh is not conn
+    assert not conn.open
+    assert pool.stats()["size"] == 1
+
+
+def test_pool_waits_when_exhausted(fake_connect):
+    """max_size 초과 시 반환될 때까지 대기, acquire_timeout 경과 시 TimeoutError"""
+    pool = ConnectionPool(CONFIG, max_size=1, acquire_timeout=0.05)
+    conn = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    pool.acquire_timeout = 2.0
+    timer = threading.Timer(0.05, pool.release, args=(conn,))
+    timer.start()
+    assert pool.acquire() is conn
+    timer.join()
+
+
+def test_pool_prunes_idle_connections_above_min_size(fake_connect):
+    """idle_timeout 경과한 유휴 커넥션은 min_size까지만 유지"""
+    pool = ConnectionPool(CONFIG, min_size=1, max_size=3, idle_timeout=0)
+    conns = [pool.acquire() for _ in range(3)]
+    for c in conns:
+        pool.release(c)
+    pool.acquire()
+    assert pool.stats()["size"] == 1
+    assert sum(not c.open for c in conns) == 2
+
+
+def test_connector_context_manager_returns_connection_to_pool(fake_connect):
+    """with MysqlConnector(...) 종료 시 커넥션이 닫히지 않고 풀로 반환"""
+    pool = ConnectionPool(CONFIG, max_size=2)
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with MysqlConnector("CFO", pooled=True) as conn:
+            first = conn.connection
+        with MysqlConnector("CFO", pooled=True) as conn:
+            assert conn.connection is first
+    assert first.open
+    assert pool.stats() == {"size": 1, "idle": 1, "in_use": 0, "max_size": 2}
+
+
+def test_frame_to_rows_converts_nan_and_numpy_scalars():
+    """NaN/NaT → None, numpy 스칼라 → Python 타입"""
+    df = pd.DataFrame({
+        "a": [1, 2],
+        "b": [1.5, np.nan],
+        "c": [pd.Timestamp("2026-01-01"), pd.NaT],
+        "d": ["x", None],
+    })
+    rows = _frame_to_rows(df, ["a", "b", "c", "d"])
+    assert rows == [(1, 1.5, pd.Timestamp("2026-01-01"), "x"), (2, None, None, None)]
+    assert type(rows[0][0]) is int
+
+
+def test_upsert_data_writes_in_batches(fake_connect):
+    """batch_size 단위로 executemany 분할, max_stmt_length는 max_allowed_packet 기준"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({"id": range(5), "asin": [f"A{i}" for i in range(5)], "v": range(5)})
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with MysqlConnector("CFO", pooled=True) as conn:
+            msg = conn.upsert_data(df, "t", batch_size=2)
+            cursor = conn.cursor
+    assert [len(b) for b in cursor.batches] == [2, 2, 1]
+    assert cursor.batches[0][0] == ("A0", 0)
+    assert cursor.max_stmt_length == 4 * 1024 * 1024 - 64 * 1024
+    assert msg.startswith("5 records upserted into t (")
+
+
+class FakeStreamCursor(FakeCursor):
+    description = (("asin",), ("v",))
+
+    def __init__(self, rows):
+        super().__init__()
+        self._rows = list(rows)
+        self.closed = False
+
+    def fetchmany(self, size):
+        chunk, self._rows = self._rows[:size], self._rows[size:]
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_read_query_stream_yields_chunks_and_dicts(fake_connect):
+    """chunk_size 단위 DataFrame 청크 / 행 dict 스트리밍, 종료 시 커서 정리"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    rows = [(f"A{i}", i) for i in range(5)]
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with MysqlConnector("CFO", pooled=True) as conn:
+            cursor = FakeStreamCursor(rows)
+            conn.connection.cursor = lambda cursor_class=None: cursor
+            chunks = list(conn.read_query_stream("SELECT asin, v FROM t", chunk_size=2))
+            assert [len(c) for c in chunks] == [2, 2, 1]
+            assert list(chunks[0].columns) == ["asin", "v"]
+            assert cursor.closed
+
+            cursor = FakeStreamCursor(rows)
+            first = next(conn.read_query_stream("SELECT asin, v FROM t", as_dicts=True))
+            assert first == {"asin": "A0", "v": 0}
+    # 소비 중단된 스트림도 close() 시 정리
+    assert cursor.closed
+
+
+def test_async_connector_runs_queries_off_the_event_loop(fake_connect):
+    """AsyncMysqlConnector 호출은 DB 스레드에서 실행되고 종료 시 풀로 반환"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    threads: list[int] = []
+
+    async def _run():
+        async with AsyncMysqlConnector("CFO", pooled=True) as conn:
+            conn.sync.cursor.rowcount = 3
+            return await conn.execute("UPDATE t SET v = 1")
+
+    def _execute(self, query, params=None):
+        threads.append(threading.get_ident())
+
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with patch.object(FakeCursor, "execute", _execute):
+            assert asyncio.run(_run()) == 3
+    assert threads and threading.get_ident() not in threads
+    assert fake_connect[0].commits == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_async_delete_and_insert_mirrors_sync_signature(fake_connect):
+    """async delete_and_insert도 where 없이 swap=True 전체 교체를 지원"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({"k": ["a"], "v": [1]})
+
+    async def _run():
+        async with AsyncMysqlConnector("NOINFILE", pooled=True) as conn:
+            return await conn.delete_and_insert(df, "t", swap=True, batch_size=10)
+
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        assert asyncio.run(_run()).startswith("Swapped 1 rows into t")
+
+
+def test_async_service_proxy_wraps_sync_methods():
+    """service.aio.method(...)는 동기 메서드를 DB 스레드에서 실행하는 코루틴"""
+
+    class Service:
+        def lookup(self, key, suffix=""):
+            return key + suffix, threading.get_ident()
+
+    proxy = AsyncServiceProxy(Service())
+    value, thread_id = asyncio.run(proxy.lookup("a", suffix="b"))
+    assert value == "ab"
+    assert thread_id != threading.get_ident()
+
+
+def test_tsv_field_escapes_for_load_data():
+    """NULL → \\N, 탭/개행/백슬래시 escape, bool/datetime 직렬화"""
+    assert _tsv_field(None) == "\\N"
+    assert _tsv_field(True) == "1"
+    assert _tsv_field(pd.Timestamp("2026-01-02 03:04:05")) == "2026-01-02 03:04:05"
+    assert _tsv_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+
+def _infile_connector(environment: str) -> MysqlConnector:
+    """LOAD DATA LOCAL INFILE을 허용한 bulk 적재 전용 커넥터."""
+    with patch.object(mysql_connector.settings, "MYSQL_LOCAL_INFILE", True):
+        with patch.object(DBConfig, "from_env", return_value=CONFIG):
+            return MysqlConnector(environment, local_infile=True)
+
+
+def test_bulk_delete_and_insert_merges_from_staging(fake_connect):
+    """bulk=True: staging 적재(REPLACE, last-wins) → DELETE → INSERT ... SELECT"""
+    df = pd.DataFrame({"k": ["a", "b"], "v": [1, None]})
+    with _infile_connector("BULKOK") as conn:
+        conn.delete_and_insert(df, "t", where="k IS NOT NULL", bulk=True)
+        cursor = conn.cursor
+    assert fake_connect[-1].local_infile is True
+    statements = [q for q, _ in cursor.executed]
+    assert any(q.startswith("LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE") for q in statements)
+    load_idx = next(i for i, q in enumerate(statements) if q.startswith("LOAD DATA"))
+    delete_idx = statements.index("DELETE FROM `t` WHERE k IS NOT NULL")
+    assert load_idx < delete_idx
+    assert "INSERT INTO `t` (`k`, `v`) SELECT `k`, `v` FROM `_stg_t`" in statements
+    assert cursor.batches == []
+
+
+def test_bulk_on_pooled_connection_never_enables_local_infile(fake_connect):
+    """풀 커넥션은 local infile을 켜지 않으며 bulk=True도 executemany로 적재"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({"k": ["a", "b"], "v": [1, 2]})
+    with patch.object(mysql_connector.settings, "MYSQL_LOCAL_INFILE", True):
+        with patch.object(mysql_connector, "get_pool", return_value=pool):
+            with MysqlConnector("POOLED", pooled=True) as conn:
+                conn.upsert_data(df, "t", bulk=True)
+                cursor = conn.cursor
+    assert fake_connect[-1].local_infile is False
+    assert not any(q.startswith("LOAD DATA") for q, _ in cursor.executed)
+    assert cursor.batches == [[("a", 1), ("b", 2)]]
+
+
+def test_bulk_falls_back_to_executemany_when_local_infile_rejected(fake_connect):
+    """서버가 LOAD DATA LOCAL을 거부하면 executemany로 적재"""
+    df = pd.DataFrame({"k": ["a", "b"], "v": [1, 2]})
+
+    def _execute(self, query, params=None):
+        if query.startswith("LOAD DATA"):
+            raise pymysql.err.OperationalError(3948, "Loading local data is disabled")
+        self.executed.append((query, params))
+
+    with patch.object(FakeCursor, "execute", _execute):
+        with _infile_connector("NOINFILE") as conn:
+            conn.upsert_data(df, "t", bulk=True)
+            cursor = conn.cursor
+    assert cursor.batches == [[("a", 1), ("b", 2)]]
+    assert "NOINFILE" in mysql_connector._local_infile_unsupported
+
+
+def test_swap_stages_rows_before_touching_live_table(fake_connect):
+    """swap=True: infile 불가여도 staging을 먼저 채운 뒤 DELETE + INSERT ... SELECT"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({"k": ["a", "b"], "v": [1, 2]})
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with MysqlConnector("NOINFILE", pooled=True) as conn:
+            conn.delete_and_insert(df, "t", where="k = %s", where_params=("a",), swap=True)
+            cursor = conn.cursor
+    statements = [q for q, _ in cursor.executed]
+    assert cursor.batches == [[("a", 1), ("b", 2)]]
+    assert statements[-3:] == [
+        "DELETE FROM `t` WHERE k = %s",
+        "INSERT INTO `t` (`k`, `v`) SELECT `k`, `v` FROM `_stg_t`",
+        "DROP TEMPORARY TABLE IF EXISTS `_stg_t`",
+    ]
+
+
+def test_swap_without_where_renames_shadow_table(fake_connect):
+    """swap=True, where=None: 고유 이름의 shadow 테이블 적재 후 RENAME TABLE 교체"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({"k": ["a"], "v": [1]})
+    with patch.object(mysql_connector, "get_pool", return_value=pool), \
+            patch.object(mysql_connector.uuid, "uuid4", return_value=mysql_connector.uuid.UUID(int=0xAB)):
+        with MysqlConnector("NOINFILE", pooled=True) as conn:
+            msg = conn.delete_and_insert(df, "t", swap=True)
+            cursor = conn.cursor
+            with pytest.raises(ValueError):
+                conn.delete_and_insert(df, "t")
+    statements = [q for q, _ in cursor.executed]
+    suffix = mysql_connector.uuid.UUID(int=0xAB).hex[:8]
+    assert f"CREATE TABLE `t__new_{suffix}` LIKE `t`" in statements
+    assert f"RENAME TABLE `t` TO `t__old_{suffix}`, `t__new_{suffix}` TO `t`" in statements
+    assert statements[-1] == f"DROP TABLE IF EXISTS `t__old_{suffix}`"
+    assert cursor.batches == [[("a", 1)]]
+    assert msg.startswith("Swapped 1 rows into t")
+
+
+def test_upsert_with_row_hash_skips_unchanged_rows(fake_connect):
+    """hash_column 지정 시 저장된 hash와 같은 행은 쓰지 않고 변경/미변경 수 보고"""
+    pool = ConnectionPool(CONFIG, max_size=1)
+    df = pd.DataFrame({
+        "asin": ["A0", "A1", "A2"],
+        "price": [1.0, 2.0, 3.0],
+        "collected_at": [pd.Timestamp("2026-01-01")] * 3,
+    })
+    stored = {"A0": _row_hash((1,)), "A1": _row_hash((9.5,))}  # A0 동일, A1 변경, A2 신규
+
+    with patch.object(mysql_connector, "get_pool", return_value=pool):
+        with MysqlConnector("CFO", pooled=True) as conn:
+            conn.cursor.fetchall = lambda: [(k, h) for k, h in stored.items()]
+            msg = conn.upsert_data(
+                df, "t", key_columns=("asin",), hash_column="row_hash",
+                hash_exclude=("collected_at",),
+            )
+            cursor = conn.cursor
+    lookup, params = cursor.executed[0]
+    assert lookup == "SELECT `asin`, `row_hash` FROM `t` WHERE `asin` IN (%s, %s, %s)"
+    assert params == ("A0", "A1", "A2")
+    written = cursor.batches[0]
+    assert [row[0] for row in written] == ["A1", "A2"]
+    assert written[0][-1] == _row_hash((2.0,))
+    assert "changed 2, unchanged 1" in msg
@@ -0,0 +1,53 @@
+"""
+orchestrator 파이프라인 단계 실행 테스트
+
+- 독립 단계 동시 실행 + 단계별 소요 시간 기록
+- optional 단계 실패 격리 / 필수 단계 예외 전파
+"""
+
+import asyncio
+
+import pytest
+
+from amz_researcher.orchestrator import _run_stage
+
+
+def test_independent_stages_run_concurrently_and_isolate_optional_failures():
+    """optional 단계 실패는 default로 대체되고, 나머지 단계는 동시에 끝난다"""
+    timings: dict[str, int] = {}
+
+    async def _slow(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    async def _broken():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("gemini down")
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(
+            _run_stage(timings, "voice", _slow("v"), optional=True),
+            _run_stage(timings, "title", _broken(), optional=True, default=[]),
+            _run_stage(timings, "report_cache", _slow("r"), optional=True),
+        )
+        return (*results, loop.time() - started)
+
+    voice, title, report, elapsed = asyncio.run(_run())
+    assert (voice, title, report) == ("v", [], "r")
+    assert elapsed < 0.18  # 순차 실행이면 0.2초 이상
+    assert set(timings) == {"voice", "title", "report_cache"}
+    assert timings["voice"] >= 90
+
+
+def test_required_stage_failure_propagates():
+    """필수 단계 예외는 default로 삼키지 않고 전파하되 소요 시간은 기록한다"""
+    timings: dict[str, int] = {}
+
+    async def _broken():
+        raise RuntimeError("gemini down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_run_stage(timings, "market_report", _broken()))
+    assert "market_report" in timings
@@ -0,0 +1,57 @@
+"""
+쿼리 계측 테스트
+
+- SQL fingerprint (리터럴/IN 목록/multi-row VALUES 접기)
+- 커서 계측 → 요청 단위 통계 + slow query 로그
+"""
+
+import logging
+
+from lib import query_stats
+from lib.mysql_connector import _InstrumentedCursorMixin
+
+
+class _BaseCursor:
+    def __init__(self):
+        self.connection = type("Conn", (), {"stats_environment": "CFO"})()
+        self.rowcount = -1
+
+    def execute(self, query, args=None):
+        self.rowcount = 2
+        return 2
+
+    def executemany(self, query, args):
+        # pymysql처럼 내부적으로 execute를 다시 호출
+        return sum(self.execute(query, a) for a in args)
+
+
+class _Cursor(_InstrumentedCursorMixin, _BaseCursor):
+    pass
+
+
+def test_fingerprint_collapses_literals_and_lists():
+    """값만 다른 쿼리는 같은 fingerprint"""
+    a = query_stats.fingerprint("SELECT * FROM t WHERE asin IN ('A1', 'A2') AND n > 3")
+    b = query_stats.fingerprint("SELECT *\n FROM t WHERE asin IN (%s, %s, %s) AND n > %s")
+    assert a == b == "SELECT * FROM t WHERE asin IN (...) AND n > ?"
+    assert query_stats.fingerprint(
+        "INSERT INTO t (a, b) VALUES (1, 'x'), (2, 'y')"
+    ) == "INSERT INTO t (a, b) VALUES (...)"
+
+
+def test_cursor_records_into_request_scope_and_logs_slow_queries(monkeypatch, caplog):
+    """execute/executemany가 요청 통계에 한 번씩 기록되고 임계값 초과 시 WARNING"""
+    monkeypatch.setattr(query_stats.settings, "MYSQL_SLOW_QUERY_MS", 0)
+    cursor = _Cursor()
+    with caplog.at_level(logging.WARNING, logger="lib.query_stats"):
+        with query_stats.track_queries() as stats:
+            cursor.execute("SELECT * FROM t WHERE id = %s", (1,))
+            cursor.executemany("UPDATE t SET v = %s WHERE id = %s", [(1, 1), (2, 2), (3, 3)])
+        cursor.execute("SELECT 1")  # scope 밖: 요청 통계에 포함되지 않음
+
+    entries = {(e.op, e.fingerprint): e for e in stats.entries()}
+    assert stats.total_queries == 2
+    assert entries[("execute", "SELECT * FROM t WHERE id = ?")].rows == 2
+    assert entries[("executemany", "UPDATE t SET v = ? WHERE id = ?")].rows == 3
+    assert "Slow query on CFO" in caplog.text
+    assert "WHERE id = %s" in caplog.text